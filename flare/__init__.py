@@ -3,9 +3,17 @@ import typing
 
 from flare.components import *
 from flare.context import MessageContext, ModalContext
-from flare.converters import Converter, add_converter
+from flare.converters import Converter, Range, SyncConverter, add_converter
+from flare.cookies import CookieManifest
 from flare.internal.bootstrap import install
+from flare.internal.debounce import Debounce
+from flare.internal.event_handler import Dispatcher, DispatcherStats, Overflow, dispatch
+from flare.internal.executor import run_coroutine
+from flare.internal.middleware import DispatchInfo, Middleware
+from flare.internal.processes import ProcessDispatcher
+from flare.internal.ratelimit import Bucket, RateLimit
 from flare.row import Row
+from flare.store import MemoryStore, SQLiteStore, StateStore, StoreStats
 from flare.utils import gather_iter
 
 __all__: typing.Sequence[str] = (
@@ -27,9 +35,27 @@ __all__: typing.Sequence[str] = (
     "MessageContext",
     "ModalContext",
     "Converter",
+    "SyncConverter",
     "add_converter",
+    "Range",
     "install",
+    "dispatch",
+    "run_coroutine",
+    "Middleware",
+    "DispatchInfo",
+    "Dispatcher",
+    "DispatcherStats",
+    "Overflow",
+    "Debounce",
+    "RateLimit",
+    "Bucket",
+    "ProcessDispatcher",
+    "CookieManifest",
     "Row",
+    "StateStore",
+    "StoreStats",
+    "MemoryStore",
+    "SQLiteStore",
     "gather_iter",
 )
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 import copy
 import hashlib
+import inspect
 import typing as t
 
 import hikari
@@ -11,6 +12,10 @@ import hikari.components
 from flare import dataclass
 from flare.exceptions import CustomIDNotSetError, SerializerError
 from flare.internal import bootstrap
+from flare.internal.codec import CodecPlan
+from flare.internal.debounce import Debounce
+from flare.internal.executor import wrap_sync_callback
+from flare.internal.ratelimit import RateLimit
 
 if t.TYPE_CHECKING:
     from flare import row
@@ -82,17 +87,39 @@ class CallbackComponent(
     """
 
     _cookie: t.ClassVar[str]
+    _defer: t.ClassVar[bool]
+    """If `True`, interactions with this component are deferred before the callback is run."""
+    _debounce: t.ClassVar[Debounce | None]
+    """Repeated clicks on this component are ignored by this policy if set."""
+    _ratelimit: t.ClassVar[RateLimit | None]
+    """Limits how often this component's callback is run if set."""
+    _timeout: t.ClassVar[float | None]
+    """The number of seconds before this component's callback is cancelled if set."""
+    _codec_plan: t.ClassVar[CodecPlan]
+    """The precompiled converters used to serialize and deserialize this component."""
 
     def __init_subclass__(
         cls,
         cookie: str | None = None,
         _dataclass_fields: list[dataclass.Field] | None = None,
+        *,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> None:
         super().__init_subclass__(_dataclass_fields)
 
-        cls._cookie = cookie or write_cookie(f"{cls.__name__}.{cls.__module__}")
+        cls._defer = defer
+        cls._debounce = debounce
+        cls._ratelimit = ratelimit
+        cls._timeout = timeout
 
-        bootstrap.components[cls._cookie] = cls
+        if not inspect.iscoroutinefunction(cls.callback):
+            cls.callback = wrap_sync_callback(cls.callback)  # type: ignore
+
+        cls._cookie = bootstrap.register(cls, cookie or write_cookie(f"{cls.__name__}.{cls.__module__}"))
+        cls._codec_plan = CodecPlan(cls._dataclass_annotations)
 
     def __post_init__(self) -> None:
         self._custom_id: str | None = None
@@ -107,9 +134,9 @@ class CallbackComponent(
         return self._custom_id
 
     async def set_custom_id(self):
-        self._custom_id = await bootstrap.active_serde.serialize(
-            self._cookie, self._dataclass_annotations, self._dataclass_values
-        )
+        self._custom_id = await bootstrap.active_serde.serialize(self._cookie, self._codec_plan, self._dataclass_values)
+        # The custom_id may have been rejected before if its state expired from a store.
+        bootstrap.rejected.pop(self._custom_id, None)
 
     @property
     def cookie(self) -> str:
@@ -10,6 +10,10 @@ from flare.components.base import CallbackComponent, Component
 from flare.components.functional import FunctionalComponent
 from flare.exceptions import ComponentError
 
+if t.TYPE_CHECKING:
+    from flare.internal.debounce import Debounce
+    from flare.internal.ratelimit import RateLimit
+
 __all__: t.Sequence[str] = ("Button", "button", "LinkButton")
 
 P = t.ParamSpec("P")
@@ -30,9 +34,15 @@ class Button(CallbackComponent):
         style: hikari.ButtonStyle = hikari.ButtonStyle.PRIMARY,
         disabled: bool = False,
         cookie: str | None = None,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
         _dataclass_fields: list[dataclass.Field] | None = None,
     ) -> None:
-        super().__init_subclass__(cookie, _dataclass_fields)
+        super().__init_subclass__(
+            cookie, _dataclass_fields, defer=defer, debounce=debounce, ratelimit=ratelimit, timeout=timeout
+        )
         cls.__label = label
         cls.__emoji = emoji
         cls.__style = style
@@ -102,12 +112,20 @@ class button(FunctionalComponent[Button]):
         emoji: str | hikari.Emoji | None = None,
         style: hikari.ButtonStyle = hikari.ButtonStyle.PRIMARY,
         disabled: bool = False,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> None:
         self.cookie = cookie
         self.label = label
         self.emoji = emoji
         self.style = style
         self.disabled = disabled
+        self.defer = defer
+        self.debounce = debounce
+        self.ratelimit = ratelimit
+        self.timeout = timeout
 
     @property
     def component_type(self) -> type[Button]:
@@ -121,6 +139,10 @@ class button(FunctionalComponent[Button]):
             "emoji": self.emoji,
             "style": self.style,
             "disabled": self.disabled,
+            "defer": self.defer,
+            "debounce": self.debounce,
+            "ratelimit": self.ratelimit,
+            "timeout": self.timeout,
         }
 
 
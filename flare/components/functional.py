@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import inspect
 import typing as t
 
 import sigparse
@@ -8,6 +9,7 @@ import typing_extensions
 
 from flare import dataclass
 from flare.components import base
+from flare.internal.executor import wrap_sync_callback
 
 if t.TYPE_CHECKING:
     from flare import context
@@ -48,11 +50,14 @@ class FunctionalComponent(abc.ABC, t.Generic[T]):
             else base.write_cookie(f"{callback_.__module__}.{callback_.__name__}")
         )
 
+        # Callbacks that are not `async` are run in a thread so they don't block the event loop.
+        run = callback_ if inspect.iscoroutinefunction(callback_) else wrap_sync_callback(callback_)
+
         # This is a python moment.
         class Inner(self.component_type, _dataclass_fields=params, **kwargs):  # type: ignore
             async def callback(self, ctx: context.MessageContext):
                 kwargs = self._dataclass_values  # type: ignore
-                await callback_(ctx, **kwargs)  # type: ignore
+                await run(ctx, **kwargs)  # type: ignore
 
         Inner.__name__ = callback_.__name__
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import copy
+import inspect
 import typing as t
 
 import hikari
@@ -17,6 +18,9 @@ from flare.components.base import (
 from flare.dataclass import Dataclass
 from flare.exceptions import TitleNotSetError
 from flare.internal import bootstrap
+from flare.internal.codec import CodecPlan
+from flare.internal.executor import wrap_sync_callback
+from flare.internal.ratelimit import RateLimit
 
 if t.TYPE_CHECKING:
     from flare.context import ModalContext
@@ -29,15 +33,45 @@ class ModalComponent(Component[hikari.api.ModalActionRowBuilder]):
 
 
 class Modal(SupportsCallback["ModalContext"], SupportsCookie, t.MutableSequence[ModalComponent], Dataclass):
-    __cookie: t.ClassVar[str]
+    _cookie: t.ClassVar[str]
+    _defer: t.ClassVar[bool]
+    """If `True`, the modal is deferred before the callback is run."""
+    _ratelimit: t.ClassVar[RateLimit | None]
+    """Limits how often the modal's callback is run if set."""
+    _timeout: t.ClassVar[float | None]
+    """The number of seconds before the modal's callback is cancelled if set."""
     __title: t.ClassVar[str | None]
-
-    def __init_subclass__(cls, title: str | None = None, cookie: str | None = None) -> None:
+    _codec_plan: t.ClassVar[CodecPlan]
+    """The precompiled converters used to serialize and deserialize this modal's state."""
+
+    def __init_subclass__(
+        cls,
+        title: str | None = None,
+        cookie: str | None = None,
+        defer: bool = False,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
+    ) -> None:
         cls.__title = title
-        cls.__cookie = cookie or write_cookie(f"{cls.__name__}.{cls.__module__}")
-        bootstrap.components[cls.__cookie] = cls
+        cls._defer = defer
+        cls._ratelimit = ratelimit
+        cls._timeout = timeout
+
+        if not inspect.iscoroutinefunction(cls.callback):
+            cls.callback = wrap_sync_callback(cls.callback)  # type: ignore
+        cls._cookie = bootstrap.register(cls, cookie or write_cookie(f"{cls.__name__}.{cls.__module__}"))
         super().__init_subclass__()
 
+        # `ModalComponent` shouldn't store state so it is left out of the plan.
+        cls._codec_plan = CodecPlan(
+            {
+                field.name: field.annotation
+                for field in cls._fields
+                if not isinstance(field.default, ModalComponent)
+                and not utils.any_issubclass(field.annotation, ModalComponent)
+            }
+        )
+
     def __post_init__(self, _ctx: ModalContext | None = None) -> None:
         self.title = self.__title
 
@@ -95,7 +129,7 @@ class Modal(SupportsCallback["ModalContext"], SupportsCookie, t.MutableSequence[
 
     @property
     def cookie(self) -> str:
-        return self.__cookie
+        return self._cookie
 
     def set_title(self, title: str) -> Self:
         self.title = title
@@ -127,12 +161,25 @@ class Modal(SupportsCallback["ModalContext"], SupportsCookie, t.MutableSequence[
             raise TitleNotSetError(f"Title for {self.__class__.__name__} not set.")
 
         custom_id = await bootstrap.active_serde.serialize(
-            self.__cookie,
+            self._cookie,
+            self._codec_plan,
             # `ModalComponent` shouldn't store state so that is removed.
-            self._without_modal_component(self._dataclass_annotations),
             self._without_modal_component(self._dataclass_values),
         )
-        await inter.create_modal_response(self.title, custom_id, components=self.build())
+        bootstrap.rejected.pop(custom_id, None)
+
+        # Interactions received by an interaction server are responded to in the HTTP response.
+        pending = bootstrap.rest_responses.pop(inter.id, None)
+        if pending is None:
+            await inter.create_modal_response(self.title, custom_id, components=self.build())
+            return
+
+        future, _ = pending
+
+        builder = hikari.impl.InteractionModalBuilder(self.title, custom_id)
+        for row in self.build():
+            builder.add_component(row)
+        future.set_result(builder)
 
 
 class TextInput(ModalComponent):
@@ -13,6 +13,10 @@ from flare.components.base import CallbackComponent
 from flare.components.functional import FunctionalComponent
 from flare.exceptions import ComponentError
 
+if t.TYPE_CHECKING:
+    from flare.internal.debounce import Debounce
+    from flare.internal.ratelimit import RateLimit
+
 __all__: t.Final[t.Sequence[str]] = (
     "TextSelect",
     "UserSelect",
@@ -45,9 +49,15 @@ class _AbstractSelect(CallbackComponent, abc.ABC):
         max_values: int | None = None,
         placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
         disabled: bool | None = None,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
         _dataclass_fields: list[dataclass.Field] | None = None,
     ) -> None:
-        super().__init_subclass__(cookie, _dataclass_fields)
+        super().__init_subclass__(
+            cookie, _dataclass_fields, defer=defer, debounce=debounce, ratelimit=ratelimit, timeout=timeout
+        )
         cls.__min_values = min_values
         cls.__max_values = max_values
         cls.__placeholder = placeholder
@@ -132,6 +142,14 @@ class TextSelect(_AbstractSelect):
         cookie:
             An identifier to use for the select menu. A custom cookie can be
             supplied so a shorter one is used in serializing and deserializing.
+        defer:
+            If `True`, interactions are deferred before the callback is run.
+        debounce:
+            If provided, repeated clicks by a user are ignored by this policy.
+        ratelimit:
+            If provided, limits how often the callback is run.
+        timeout:
+            If provided, the callback is cancelled if it runs for longer than this many seconds.
     """
 
     __options: t.ClassVar[t.Sequence[tuple[str, str] | str | hikari.SelectMenuOption] | None]
@@ -144,6 +162,10 @@ class TextSelect(_AbstractSelect):
         max_values: int | None = None,
         placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
         disabled: bool | None = None,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
         _dataclass_fields: list[dataclass.Field] | None = None,
     ) -> None:
         super().__init_subclass__(
@@ -152,6 +174,10 @@ class TextSelect(_AbstractSelect):
             max_values=max_values,
             placeholder=placeholder,
             disabled=disabled,
+            defer=defer,
+            debounce=debounce,
+            ratelimit=ratelimit,
+            timeout=timeout,
             _dataclass_fields=_dataclass_fields,
         )
         cls.__options = options
@@ -222,6 +248,14 @@ class UserSelect(BaseSelect):
         cookie:
             An identifier to use for the select menu. A custom cookie can be
             supplied so a shorter one is used in serializing and deserializing.
+        defer:
+            If `True`, interactions are deferred before the callback is run.
+        debounce:
+            If provided, repeated clicks by a user are ignored by this policy.
+        ratelimit:
+            If provided, limits how often the callback is run.
+        timeout:
+            If provided, the callback is cancelled if it runs for longer than this many seconds.
     """
 
     @property
@@ -245,6 +279,14 @@ class RoleSelect(BaseSelect):
         cookie:
             An identifier to use for the select menu. A custom cookie can be
             supplied so a shorter one is used in serializing and deserializing.
+        defer:
+            If `True`, interactions are deferred before the callback is run.
+        debounce:
+            If provided, repeated clicks by a user are ignored by this policy.
+        ratelimit:
+            If provided, limits how often the callback is run.
+        timeout:
+            If provided, the callback is cancelled if it runs for longer than this many seconds.
     """
 
     @property
@@ -268,6 +310,14 @@ class MentionableSelect(BaseSelect):
         cookie:
             An identifier to use for the select menu. A custom cookie can be
             supplied so a shorter one is used in serializing and deserializing.
+        defer:
+            If `True`, interactions are deferred before the callback is run.
+        debounce:
+            If provided, repeated clicks by a user are ignored by this policy.
+        ratelimit:
+            If provided, limits how often the callback is run.
+        timeout:
+            If provided, the callback is cancelled if it runs for longer than this many seconds.
     """
 
     @property
@@ -293,6 +343,14 @@ class ChannelSelect(_AbstractSelect):
         cookie:
             An identifier to use for the select menu. A custom cookie can be
             supplied so a shorter one is used in serializing and deserializing.
+        defer:
+            If `True`, interactions are deferred before the callback is run.
+        debounce:
+            If provided, repeated clicks by a user are ignored by this policy.
+        ratelimit:
+            If provided, limits how often the callback is run.
+        timeout:
+            If provided, the callback is cancelled if it runs for longer than this many seconds.
     """
 
     __channel_types: t.ClassVar[t.Sequence[hikari.ChannelType] | None]
@@ -305,6 +363,10 @@ class ChannelSelect(_AbstractSelect):
         max_values: int | None = None,
         placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
         disabled: bool | None = None,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
         _dataclass_fields: list[dataclass.Field] | None = None,
     ) -> None:
         super().__init_subclass__(
@@ -313,6 +375,10 @@ class ChannelSelect(_AbstractSelect):
             max_values=max_values,
             placeholder=placeholder,
             disabled=disabled,
+            defer=defer,
+            debounce=debounce,
+            ratelimit=ratelimit,
+            timeout=timeout,
             _dataclass_fields=_dataclass_fields,
         )
         cls.__channel_types = channel_types
@@ -355,12 +421,20 @@ class _AbstractSelectFunction(FunctionalComponent[T], abc.ABC):
         max_values: int | None = None,
         placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
         disabled: bool | None = None,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> None:
         self.cookie = cookie
         self.min_values = min_values
         self.max_values = max_values
         self.placeholder = placeholder
         self.disabled = disabled
+        self.defer = defer
+        self.debounce = debounce
+        self.ratelimit = ratelimit
+        self.timeout = timeout
 
     @property
     @abc.abstractmethod
@@ -375,6 +449,10 @@ class _AbstractSelectFunction(FunctionalComponent[T], abc.ABC):
             "max_values": self.max_values,
             "placeholder": self.placeholder,
             "disabled": self.disabled,
+            "defer": self.defer,
+            "debounce": self.debounce,
+            "ratelimit": self.ratelimit,
+            "timeout": self.timeout,
         }
 
 
@@ -388,6 +466,10 @@ class text_select(_AbstractSelectFunction[TextSelect]):
         max_values: int | None = None,
         placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
         disabled: bool | None = None,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> None:
         self.options = options
         super().__init__(
@@ -396,6 +478,10 @@ class text_select(_AbstractSelectFunction[TextSelect]):
             max_values=max_values,
             placeholder=placeholder,
             disabled=disabled,
+            defer=defer,
+            debounce=debounce,
+            ratelimit=ratelimit,
+            timeout=timeout,
         )
 
     @property
@@ -437,6 +523,10 @@ class channel_select(_AbstractSelectFunction[ChannelSelect]):
         max_values: int | None = None,
         placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
         disabled: bool | None = None,
+        defer: bool = False,
+        debounce: Debounce | None = None,
+        ratelimit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> None:
         self.channel_types = channel_types
         super().__init__(
@@ -445,6 +535,10 @@ class channel_select(_AbstractSelectFunction[ChannelSelect]):
             max_values=max_values,
             placeholder=placeholder,
             disabled=disabled,
+            defer=defer,
+            debounce=debounce,
+            ratelimit=ratelimit,
+            timeout=timeout,
         )
 
     @property
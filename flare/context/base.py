@@ -1,16 +1,90 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import typing as t
 
 import hikari
 from hikari.snowflakes import Snowflake
 
+from flare.internal import bootstrap
+
 __all__: t.Sequence[str] = ("PartialContext", "InteractionResponse")
 
 logger = logging.getLogger("__name__")
 
 T = t.TypeVar("T", bound=hikari.ComponentInteraction | hikari.ModalInteraction)
+P = t.ParamSpec("P")
+R = t.TypeVar("R")
+ContextT = t.TypeVar("ContextT", bound="PartialContext[t.Any]")
+
+
+def _locked(
+    func: t.Callable[t.Concatenate[ContextT, P], t.Awaitable[R]]
+) -> t.Callable[t.Concatenate[ContextT, P], t.Awaitable[R]]:
+    """Stop flare deferring the interaction while the decorated method responds."""
+
+    @functools.wraps(func)
+    async def inner(self: ContextT, *args: P.args, **kwargs: P.kwargs) -> R:
+        async with self._response_lock:
+            return await func(self, *args, **kwargs)
+
+    return inner
+
+
+def _build_message_response(
+    response_type: hikari.ResponseType,
+    content: hikari.UndefinedNoneOr[t.Any] = hikari.UNDEFINED,
+    *,
+    flags: t.Union[int, hikari.MessageFlag, hikari.UndefinedType] = hikari.UNDEFINED,
+    tts: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+    component: hikari.UndefinedOr[hikari.api.ComponentBuilder] = hikari.UNDEFINED,
+    components: hikari.UndefinedOr[t.Sequence[hikari.api.ComponentBuilder]] = hikari.UNDEFINED,
+    attachment: hikari.UndefinedNoneOr[hikari.Resourceish] = hikari.UNDEFINED,
+    attachments: hikari.UndefinedNoneOr[t.Sequence[hikari.Resourceish]] = hikari.UNDEFINED,
+    embed: hikari.UndefinedOr[hikari.Embed] = hikari.UNDEFINED,
+    embeds: hikari.UndefinedOr[t.Sequence[hikari.Embed]] = hikari.UNDEFINED,
+    mentions_everyone: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+    user_mentions: hikari.UndefinedOr[
+        t.Union[hikari.SnowflakeishSequence[hikari.PartialUser], bool]
+    ] = hikari.UNDEFINED,
+    role_mentions: hikari.UndefinedOr[
+        t.Union[hikari.SnowflakeishSequence[hikari.PartialRole], bool]
+    ] = hikari.UNDEFINED,
+) -> hikari.api.InteractionMessageBuilder:
+    """Build the initial response for an interaction received by an interaction server."""
+    builder = hikari.impl.InteractionMessageBuilder(response_type)  # type: ignore
+
+    if content is None:
+        builder.clear_content()
+    elif content is not hikari.UNDEFINED:
+        builder.set_content(str(content))
+    if flags is not hikari.UNDEFINED:
+        builder.set_flags(flags)
+    if tts is not hikari.UNDEFINED:
+        builder.set_tts(tts)
+    if mentions_everyone is not hikari.UNDEFINED:
+        builder.set_mentions_everyone(mentions_everyone)
+    if user_mentions is not hikari.UNDEFINED:
+        builder.set_user_mentions(user_mentions)
+    if role_mentions is not hikari.UNDEFINED:
+        builder.set_role_mentions(role_mentions)
+
+    if attachment is None or attachments is None:
+        builder.clear_attachments()
+
+    for item in (component, *(components or ())):
+        if item is not hikari.UNDEFINED:
+            builder.add_component(item)
+    for item in (attachment, *(attachments or ())):
+        if item is not hikari.UNDEFINED and item is not None:
+            builder.add_attachment(item)
+    for item in (embed, *(embeds or ())):
+        if item is not hikari.UNDEFINED:
+            builder.add_embed(item)
+
+    return builder
 
 
 class InteractionResponse:
@@ -46,10 +120,12 @@ class InteractionResponse:
         if self._message:
             return self._message
 
+        await self._context._wait_delivered()
         return await self._context.interaction.fetch_initial_response()
 
     async def delete(self) -> None:
         """Delete the response issued to the interaction this object represents."""
+        await self._context._wait_delivered()
 
         if self._message:
             await self._context.interaction.delete_message(self._message)
@@ -101,6 +177,8 @@ class InteractionResponse:
         Returns:
             InteractionResponse: A proxy object representing the response to the interaction.
         """
+        await self._context._wait_delivered()
+
         if self._message:
             message = await self._context.interaction.edit_message(
                 self._message,
@@ -135,12 +213,24 @@ class InteractionResponse:
 class PartialContext(t.Generic[T]):
     """A context object proxying a Discord interaction."""
 
-    __slots__ = ("_interaction", "_responses", "_issued_response")
+    __slots__ = (
+        "_interaction",
+        "_responses",
+        "_issued_response",
+        "_auto_deferred",
+        "_response_lock",
+        "_delivered",
+    )
 
     def __init__(self, interaction: T) -> None:
         self._interaction: T = interaction
         self._responses: t.MutableSequence[InteractionResponse] = []
         self._issued_response: bool = False
+        # The response type flare deferred with if the callback did not respond in time.
+        self._auto_deferred: hikari.ResponseType | None = None
+        self._response_lock = asyncio.Lock()
+        # Set once an initial response returned in an HTTP response was sent to Discord.
+        self._delivered: asyncio.Event | None = None
 
     @property
     def interaction(self) -> T:
@@ -220,6 +310,46 @@ class PartialContext(t.Generic[T]):
         self._responses.append(response)
         return response
 
+    async def _create_initial_response(
+        self,
+        response_type: hikari.ResponseType,
+        content: hikari.UndefinedNoneOr[t.Any] = hikari.UNDEFINED,
+        **kwargs: t.Any,
+    ) -> None:
+        """
+        Create the initial response. If the interaction was received by an
+        interaction server, the response is returned in the HTTP response
+        instead of being sent with a REST request.
+        """
+        pending = bootstrap.rest_responses.pop(self._interaction.id, None)
+
+        if pending is None:
+            await self.interaction.create_initial_response(response_type, content, **kwargs)  # type: ignore
+            return
+
+        future, self._delivered = pending
+        if response_type in (
+            hikari.ResponseType.DEFERRED_MESSAGE_CREATE,
+            hikari.ResponseType.DEFERRED_MESSAGE_UPDATE,
+        ):
+            builder = hikari.impl.InteractionDeferredBuilder(response_type)  # type: ignore
+            if kwargs.get("flags", hikari.UNDEFINED) is not hikari.UNDEFINED:
+                builder.set_flags(kwargs["flags"])
+            future.set_result(builder)
+        else:
+            future.set_result(_build_message_response(response_type, content, **kwargs))
+
+    async def _wait_delivered(self) -> None:
+        """
+        Wait until the interaction server took the initial response if it is
+        returned in an HTTP response, so later REST requests are not sent while
+        the server still waits for it. This doesn't guarantee that Discord
+        received the response first, because hikari writes the HTTP response
+        after the generator was resumed.
+        """
+        if self._delivered is not None:
+            await self._delivered.wait()
+
     def get_guild(self) -> t.Optional[hikari.GatewayGuild]:
         """Gets the guild this context represents, if any. Requires application cache."""
         return self._interaction.get_guild()
@@ -241,6 +371,7 @@ class PartialContext(t.Generic[T]):
             return self._responses[-1]
         raise RuntimeError("This interaction was not yet issued a response.")
 
+    @_locked
     async def respond(
         self,
         content: hikari.UndefinedOr[t.Any] = hikari.UNDEFINED,
@@ -292,7 +423,26 @@ class PartialContext(t.Generic[T]):
         Returns:
             InteractionResponse: A proxy object representing the response to the interaction.
         """
+        if self._auto_deferred is hikari.ResponseType.DEFERRED_MESSAGE_CREATE:
+            # The first response replaces the "thinking" message shown when flare deferred.
+            self._auto_deferred = None
+            await self._wait_delivered()
+            message = await self.interaction.edit_initial_response(
+                content,
+                component=component,
+                components=components,
+                attachment=attachment,
+                attachments=attachments,
+                embed=embed,
+                embeds=embeds,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
+            return self._create_response(message)
+
         if self._issued_response:
+            await self._wait_delivered()
             message = await self.interaction.execute(
                 content,
                 tts=tts,
@@ -309,7 +459,7 @@ class PartialContext(t.Generic[T]):
             )
             response = self._create_response(message)
         else:
-            await self.interaction.create_initial_response(
+            await self._create_initial_response(
                 hikari.ResponseType.MESSAGE_CREATE,
                 content,
                 tts=tts,
@@ -327,6 +477,7 @@ class PartialContext(t.Generic[T]):
             response = self._create_response()
         return response
 
+    @_locked
     async def edit_response(
         self,
         content: hikari.UndefinedNoneOr[t.Any] = hikari.UNDEFINED,
@@ -380,6 +531,7 @@ class PartialContext(t.Generic[T]):
             InteractionResponse: A proxy object representing the response to the interaction.
         """
         if self._issued_response:
+            await self._wait_delivered()
             message = await self.interaction.edit_initial_response(
                 content,
                 component=component,
@@ -395,7 +547,7 @@ class PartialContext(t.Generic[T]):
             return self._create_response(message)
 
         else:
-            await self.interaction.create_initial_response(
+            await self._create_initial_response(
                 hikari.ResponseType.MESSAGE_UPDATE,
                 content,
                 component=component,
@@ -412,6 +564,7 @@ class PartialContext(t.Generic[T]):
             )
             return self._create_response()
 
+    @_locked
     async def defer(
         self,
         response_type: t.Literal[
@@ -421,6 +574,7 @@ class PartialContext(t.Generic[T]):
         flags: hikari.UndefinedOr[t.Union[int, hikari.MessageFlag]] = hikari.UNDEFINED,
     ) -> None:
         """Short-hand method to defer an interaction response. Raises RuntimeError if the interaction was already responded to.
+        Does nothing if flare already deferred the interaction because the callback was slow.
 
         Parameters
         ----------
@@ -444,11 +598,31 @@ class PartialContext(t.Generic[T]):
                 "Parameter response_type must be ResponseType.DEFERRED_MESSAGE_CREATE or ResponseType.DEFERRED_MESSAGE_UPDATE."
             )
 
+        if self._auto_deferred is not None:
+            # Flare already deferred the interaction because the callback was slow.
+            return
+
         if self._issued_response:
             raise RuntimeError("Interaction was already responded to.")
 
-        await self.interaction.create_initial_response(response_type, flags=flags)
+        await self._create_initial_response(response_type, flags=flags)
+        self._issued_response = True
+
+    @_locked
+    async def _auto_defer(self) -> None:
+        """Defer the interaction if a response was not issued yet."""
+        if self._issued_response:
+            return
+
+        # Modals that were not opened from a message can't update a message.
+        if getattr(self._interaction, "message", None) is not None:
+            response_type = hikari.ResponseType.DEFERRED_MESSAGE_UPDATE
+        else:
+            response_type = hikari.ResponseType.DEFERRED_MESSAGE_CREATE
+
+        await self._create_initial_response(response_type)
         self._issued_response = True
+        self._auto_deferred = response_type
 
 
 # MIT License
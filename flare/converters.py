@@ -1,23 +1,40 @@
 import abc
+import asyncio
+import dataclasses
 import enum
 import functools
 import inspect
 import struct
+import time
 import types
 import typing as t
 
+import hikari
 import hikari.traits
 
 from flare import exceptions
+from flare.dataclass import Dataclass
 
 T = t.TypeVar("T")
 
 __all__: t.Final[t.Sequence[str]] = (
     "Converter",
+    "SyncConverter",
     "add_converter",
     "StringConverter",
     "IntConverter",
+    "SnowflakeConverter",
     "EnumConverter",
+    "SequenceConverter",
+    "TupleConverter",
+    "DictConverter",
+    "RecordConverter",
+    "EntityConverter",
+    "UserConverter",
+    "MemberConverter",
+    "RoleConverter",
+    "GuildChannelConverter",
+    "Range",
 )
 
 
@@ -53,9 +70,19 @@ class Converter(abc.ABC, t.Generic[T]):
             The type that is currently being serialized/deserialized. This will be
             different than the generic type if a subclass of the generic type is being
             serialized/deserialized.
+        cacheable:
+            If `True`, values decoded by this converter may be reused for later
+            interactions with the same custom_id when a deserialize cache is enabled.
+            This should be `False` if `from_str` fetches data that can change or
+            returns a mutable object.
+        generic:
+            If `True`, `type` is the full type hint including its arguments, such
+            as `list[int]`, instead of only the origin.
     """
 
     app: t.ClassVar[hikari.traits.EventManagerAware]
+    cacheable: t.ClassVar[bool] = False
+    generic: t.ClassVar[bool] = False
 
     def __init__(self, type: T) -> None:
         super().__init__()
@@ -70,8 +97,59 @@ class Converter(abc.ABC, t.Generic[T]):
         ...
 
 
+class SyncConverter(Converter[T]):
+    """
+    A converter that never needs to await anything. The serializer calls
+    `to_str_sync` and `from_str_sync` directly instead of creating a coroutine
+    for every field, so converters for simple types should use this class.
+
+    .. code-block:: python
+
+        import flare
+
+        class IntConverter(flare.SyncConverter[int]):
+            def to_str_sync(self, obj: int) -> str:
+                return str(obj)
+
+            def from_str_sync(self, obj: str) -> int:
+                return int(obj)
+
+        flare.add_converter(int, IntConverter)
+
+    Sync converters are cacheable by default.
+    """
+
+    cacheable: t.ClassVar[bool] = True
+
+    @abc.abstractmethod
+    def to_str_sync(self, obj: T) -> str:
+        ...
+
+    @abc.abstractmethod
+    def from_str_sync(self, obj: str) -> T:
+        ...
+
+    async def to_str(self, obj: T) -> str:
+        return self.to_str_sync(obj)
+
+    async def from_str(self, obj: str) -> T:
+        return self.from_str_sync(obj)
+
+
 _converters: dict[t.Any, tuple[type[Converter[t.Any]], bool]] = {}
 
+_converters_version: int = 0
+"""Incremented every time a converter is added so compiled codec plans know to recompile."""
+
+_resolved: dict[t.Any, tuple[Converter[t.Any], frozenset[t.Any]]] = {}
+"""
+Converters returned by `get_converter` by type hint, with every type that was
+looked up to create them, including the item types of containers and records.
+"""
+
+_resolving: list[set[t.Any]] = []
+"""The types looked up by each `get_converter` call that is creating a converter."""
+
 
 def add_converter(t: t.Any, converter: type[Converter[t.Any]], *, supports_subclass: bool = False) -> None:
     """
@@ -85,8 +163,18 @@ def add_converter(t: t.Any, converter: type[Converter[t.Any]], *, supports_subcl
         supports_subclass:
             If `True`, this converter will be used for subclasses of `t`.
     """
+    global _converters_version
+
     _converters[t] = (converter, supports_subclass)
-    get_converter.cache_clear()
+    _converters_version += 1
+
+    # Only converters that were found with `t` or one of its subclasses can change.
+    for key in [key for key, (_, lookups) in _resolved.items() if any(_affects(t, lookup) for lookup in lookups)]:
+        del _resolved[key]
+
+
+def _affects(registered: t.Any, lookup: t.Any) -> bool:
+    return registered == lookup or (inspect.isclass(registered) and _any_issubclass(lookup, registered))
 
 
 def _any_issubclass(t: t.Any, cls: t.Any) -> bool:
@@ -106,76 +194,618 @@ def _get_left(obj: t.Any) -> t.Any:
     return t.get_args(obj)[0]
 
 
-@functools.lru_cache(maxsize=128)
+def _strip_annotated(obj: t.Any) -> t.Any:
+    if t.get_origin(obj) is t.Annotated:
+        return t.get_args(obj)[0]
+    return obj
+
+
+class Range:
+    """
+    Declare the bounds of an `int` field with `typing.Annotated`. Like `range`,
+    `start` is inclusive and `stop` is exclusive.
+
+    Serializers that pack values into bits, such as
+    `flare.internal.dense.DenseSerde`, use the bounds to store the value in
+    the minimum number of bits. Other serializers ignore it.
+
+    .. code-block:: python
+
+        @flare.button(label="Button")
+        async def button(
+            ctx: flare.MessageContext,
+            # Stored in 3 bits by `DenseSerde`.
+            page: typing.Annotated[int, flare.Range(0, 8)],
+        ):
+            ...
+    """
+
+    __slots__ = ("start", "stop")
+
+    def __init__(self, start: int, stop: int) -> None:
+        if stop <= start:
+            raise ValueError("`stop` must be greater than `start`.")
+
+        self.start = start
+        self.stop = stop
+
+    def __repr__(self) -> str:
+        return f"Range({self.start}, {self.stop})"
+
+
 def get_converter(type_: t.Any) -> Converter[t.Any]:
     """
     Return the converter used for a certain type hint. If a Union is passed,
-    the left side of the Union will be used to find the converter.
+    the left side of the Union will be used to find the converter. Metadata
+    from `typing.Annotated` is ignored. Generic type hints such as `list[int]`
+    use the converter for their origin. Records without a converter, such as
+    dataclasses and `typing.NamedTuple` classes, use `RecordConverter`.
+
+    A converter added for the type itself is used first. Otherwise the type's
+    `__mro__` is searched, so the converter for the closest base class that
+    supports subclasses is used. Converters are created once for every type hint.
     """
-    origin = _get_left(type_)
+    cached = _resolved.get(type_)
+    if cached is not None:
+        converter, lookups = cached
+    else:
+        lookups_: set[t.Any] = set()
+        _resolving.append(lookups_)
+        try:
+            converter = _create_converter(type_, lookups_)
+        finally:
+            _resolving.pop()
+
+        lookups = frozenset(lookups_)
+        _resolved[type_] = (converter, lookups)
+
+    # A container or record depends on the types its item converters were found with.
+    if _resolving:
+        _resolving[-1].update(lookups)
+    return converter
+
+
+def _create_converter(type_: t.Any, lookups: set[t.Any]) -> Converter[t.Any]:
+    hint = origin = _strip_annotated(_get_left(_strip_annotated(type_)))
 
     origin_: t.Any = t.get_origin(origin)
     if origin_:
         origin = origin_
 
-    if origin in _converters:
-        converter, _ = _converters[origin]
-        return converter(origin)
-    else:
-        for k, (converter, supports_subclass) in _converters.items():
-            if supports_subclass and _any_issubclass(origin, k):
-                return converter(origin)
+    lookups.add(origin)
+
+    converter = _find_converter(origin)
+    if converter is not None:
+        return converter(hint if converter.generic else origin)
+
+    if _is_record(origin):
+        return RecordConverter(origin)
 
     raise exceptions.ConverterError(f"Could not find converter for type `{getattr(type_, '__name__', type_)}`.")
 
 
-class IntConverter(Converter[int]):
-    async def to_str(self, obj: int) -> str:
+def _find_converter(origin: t.Any) -> type[Converter[t.Any]] | None:
+    entry = _converters.get(origin)
+    if entry is not None:
+        return entry[0]
+
+    if not inspect.isclass(origin):
+        return None
+
+    for base in origin.__mro__[1:]:
+        entry = _converters.get(base)
+        if entry is not None and entry[1]:
+            return entry[0]
+
+    # Virtual subclasses registered with `abc.ABCMeta.register` are not in the MRO.
+    for k, (converter, supports_subclass) in _converters.items():
+        if supports_subclass and isinstance(k, abc.ABCMeta) and issubclass(origin, k):
+            return converter
+
+    return None
+
+
+class IntConverter(SyncConverter[int]):
+    def to_str_sync(self, obj: int) -> str:
         byte_length = obj.bit_length() // 8 + 1
         return obj.to_bytes(byte_length, "little").decode("latin1")
 
-    async def from_str(self, obj: str) -> int:
+    def from_str_sync(self, obj: str) -> int:
         return self.type.from_bytes(obj.encode("latin1"), "little")
 
 
-class FloatConverter(Converter[float]):
-    async def to_str(self, obj: float) -> str:
+class SnowflakeConverter(IntConverter):
+    """
+    Converter for `hikari.Snowflake`. Snowflakes are stored like ints, so
+    custom_ids created before this converter was added can still be decoded.
+
+    Serializers that pack values into bits, such as
+    `flare.internal.dense.DenseSerde`, split snowflakes into their timestamp,
+    worker, process and increment and store every snowflake after the first in
+    the custom_id relative to the first snowflake's timestamp.
+    """
+
+
+class FloatConverter(SyncConverter[float]):
+    def to_str_sync(self, obj: float) -> str:
         return struct.pack("d", obj).decode("latin1")
 
-    async def from_str(self, obj: str) -> float:
+    def from_str_sync(self, obj: str) -> float:
         return struct.unpack("d", obj.encode("latin1"))[0]
 
 
-class StringConverter(Converter[str]):
-    async def to_str(self, obj: str) -> str:
+class StringConverter(SyncConverter[str]):
+    def to_str_sync(self, obj: str) -> str:
         return obj
 
-    async def from_str(self, obj: str) -> str:
+    def from_str_sync(self, obj: str) -> str:
         return obj
 
 
-class EnumConverter(Converter[enum.Enum]):
-    async def to_str(self, obj: enum.Enum) -> str:
-        return await get_converter(int).to_str(obj.value)
+class EnumConverter(SyncConverter[enum.Enum]):
+    def __init__(self, type: t.Any) -> None:
+        super().__init__(type)
+        self._int_converter = IntConverter(int)  # type: ignore
+
+    def to_str_sync(self, obj: enum.Enum) -> str:
+        return self._int_converter.to_str_sync(obj.value)
 
-    async def from_str(self, obj: str) -> enum.Enum:
-        return self.type(get_converter(int).from_str(obj))  # type: ignore
+    def from_str_sync(self, obj: str) -> enum.Enum:
+        return self.type(self._int_converter.from_str_sync(obj))  # type: ignore
 
 
-class BoolConverter(Converter[bool]):
-    async def to_str(self, obj: bool) -> str:
+class BoolConverter(SyncConverter[bool]):
+    def to_str_sync(self, obj: bool) -> str:
         return "1" if obj else "0"
 
-    async def from_str(self, obj: str) -> bool:
+    def from_str_sync(self, obj: str) -> bool:
         return bool(int(obj))
 
 
+def _write_varint(value: int, out: list[str]) -> None:
+    while value > 0x7F:
+        out.append(chr(0x80 | value & 0x7F))
+        value >>= 7
+    out.append(chr(value))
+
+
+def _pack(values: t.Iterable[str | None]) -> str:
+    # Each value is prefixed with its length plus one. A length of 0 is `None`.
+    out: list[str] = []
+    for value in values:
+        if value is None:
+            out.append("\x00")
+        else:
+            _write_varint(len(value) + 1, out)
+            out.append(value)
+    return "".join(out)
+
+
+def _unpack(string: str) -> list[str | None]:
+    values: list[str | None] = []
+    pos = 0
+    end = len(string)
+
+    while pos < end:
+        length = 0
+        shift = 0
+        while True:
+            if pos >= end:
+                raise exceptions.SerializerError("Unexpected end of container.")
+            byte = ord(string[pos])
+            pos += 1
+            length |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+
+        if length == 0:
+            values.append(None)
+            continue
+
+        length -= 1
+        if pos + length > end:
+            raise exceptions.SerializerError("Unexpected end of container.")
+        values.append(string[pos : pos + length])
+        pos += length
+
+    return values
+
+
+def _element_converter(hint: t.Any) -> SyncConverter[t.Any]:
+    converter = get_converter(hint)
+    if not isinstance(converter, SyncConverter):
+        raise exceptions.ConverterError(
+            f"Containers can only store types with a `SyncConverter`, not `{getattr(hint, '__name__', hint)}`."
+        )
+    return converter
+
+
+def _type_args(hint: t.Any) -> tuple[t.Any, ...]:
+    args = t.get_args(hint)
+    if not args:
+        raise exceptions.ConverterError(f"`{getattr(hint, '__name__', hint)}` fields need a type for their items.")
+    return args
+
+
+class SequenceConverter(SyncConverter[t.Any]):
+    """
+    Converter for `list`, `set` and `frozenset` type hints, such as `list[int]`.
+    Each item is converted with the converter for the item type and prefixed
+    with its length as a varint, so no separator is needed between items.
+    """
+
+    generic: t.ClassVar[bool] = True
+
+    def __init__(self, type: t.Any) -> None:
+        super().__init__(type)
+        (item,) = _type_args(type)
+        self._origin: t.Any = t.get_origin(type)
+        self._item = _element_converter(item)
+        self.cacheable = self._item.cacheable and self._origin is frozenset  # type: ignore
+
+    def to_str_sync(self, obj: t.Iterable[t.Any]) -> str:
+        to_str = self._item.to_str_sync
+        return _pack(None if item is None else to_str(item) for item in obj)
+
+    def from_str_sync(self, obj: str) -> t.Any:
+        from_str = self._item.from_str_sync
+        return self._origin(None if item is None else from_str(item) for item in _unpack(obj))
+
+
+class TupleConverter(SyncConverter[tuple[t.Any, ...]]):
+    """
+    Converter for `tuple` type hints. Both fixed length tuples such as
+    `tuple[int, str]` and variable length tuples such as `tuple[int, ...]` are
+    supported. Items are stored like `SequenceConverter`.
+    """
+
+    generic: t.ClassVar[bool] = True
+
+    def __init__(self, type: t.Any) -> None:
+        super().__init__(type)
+        args = _type_args(type)
+
+        self._variadic = len(args) == 2 and args[1] is Ellipsis
+        self._items = [_element_converter(arg) for arg in (args[:1] if self._variadic else args)]
+        self.cacheable = all(item.cacheable for item in self._items)  # type: ignore
+
+    def to_str_sync(self, obj: tuple[t.Any, ...]) -> str:
+        if self._variadic:
+            to_str = self._items[0].to_str_sync
+            return _pack(None if item is None else to_str(item) for item in obj)
+
+        if len(obj) != len(self._items):
+            raise exceptions.SerializerError(f"Expected a tuple with {len(self._items)} items, got {len(obj)}.")
+        return _pack(None if item is None else converter.to_str_sync(item) for converter, item in zip(self._items, obj))
+
+    def from_str_sync(self, obj: str) -> tuple[t.Any, ...]:
+        items = _unpack(obj)
+
+        if self._variadic:
+            from_str = self._items[0].from_str_sync
+            return tuple(None if item is None else from_str(item) for item in items)
+
+        if len(items) != len(self._items):
+            raise exceptions.SerializerError(f"Expected a tuple with {len(self._items)} items, got {len(items)}.")
+        return tuple(
+            None if item is None else converter.from_str_sync(item) for converter, item in zip(self._items, items)
+        )
+
+
+class DictConverter(SyncConverter[dict[t.Any, t.Any]]):
+    """Converter for `dict` type hints such as `dict[str, int]`. Keys and values are stored alternately."""
+
+    generic: t.ClassVar[bool] = True
+
+    def __init__(self, type: t.Any) -> None:
+        super().__init__(type)
+        key, value = _type_args(type)
+        self._key = _element_converter(key)
+        self._value = _element_converter(value)
+        # Decoded dicts are mutable, so they can't be shared between interactions.
+        self.cacheable = False  # type: ignore
+
+    def to_str_sync(self, obj: dict[t.Any, t.Any]) -> str:
+        key_to_str = self._key.to_str_sync
+        value_to_str = self._value.to_str_sync
+        return _pack(
+            part
+            for key, value in obj.items()
+            for part in (key_to_str(key), None if value is None else value_to_str(value))
+        )
+
+    def from_str_sync(self, obj: str) -> dict[t.Any, t.Any]:
+        items = _unpack(obj)
+        if len(items) % 2:
+            raise exceptions.SerializerError("A dict must have a value for every key.")
+
+        key_from_str = self._key.from_str_sync
+        value_from_str = self._value.from_str_sync
+        return {
+            key_from_str(key or ""): None if value is None else value_from_str(value)
+            for key, value in zip(items[::2], items[1::2])
+        }
+
+
+def _is_record(type_: t.Any) -> bool:
+    if not inspect.isclass(type_):
+        return False
+    return (
+        dataclasses.is_dataclass(type_)
+        or issubclass(type_, Dataclass)
+        or (hasattr(type_, "_fields") and issubclass(type_, tuple))
+    )
+
+
+class RecordConverter(SyncConverter[t.Any]):
+    """
+    Converter for `flare.dataclass.Dataclass` subclasses, `dataclasses.dataclass`
+    classes and `typing.NamedTuple` classes. Fields are stored in order like the
+    items of a `tuple`, so field names are not stored. Each field is converted
+    with the converter for its type hint, which must be a `flare.SyncConverter`.
+
+    Field converters are found once for every record type.
+
+    .. warning::
+        Adding, removing or reordering the fields of a record changes the values
+        of existing components.
+
+    Attributes:
+        fields:
+            The name, type hint and converter of every field, in order.
+    """
+
+    def __init__(self, type: t.Any) -> None:
+        super().__init__(type)
+
+        if issubclass(type, Dataclass):
+            hints = {field.name: field.annotation for field in type._fields}
+            self._positional = False
+            frozen = False
+        elif dataclasses.is_dataclass(type):
+            annotations = t.get_type_hints(type, include_extras=True)
+            hints = {field.name: annotations[field.name] for field in dataclasses.fields(type) if field.init}
+            self._positional = False
+            frozen = type.__dataclass_params__.frozen  # type: ignore
+        else:
+            annotations = t.get_type_hints(type, include_extras=True)
+            hints = {name: annotations.get(name, t.Any) for name in type._fields}
+            self._positional = True
+            frozen = True
+
+        self.fields: tuple[tuple[str, t.Any, SyncConverter[t.Any]], ...] = tuple(
+            (name, hint, _element_converter(hint)) for name, hint in hints.items()
+        )
+        # Mutable records can't be shared between interactions.
+        self.cacheable = frozen and all(converter.cacheable for _, _, converter in self.fields)  # type: ignore
+
+    def values(self, obj: t.Any) -> list[t.Any]:
+        """Return the values of a record's fields in order."""
+        return [getattr(obj, name) for name, _, _ in self.fields]
+
+    def create(self, values: t.Sequence[t.Any]) -> t.Any:
+        """Create a record from the values of its fields in order."""
+        if len(values) != len(self.fields):
+            raise exceptions.SerializerError(
+                f"Expected {len(self.fields)} fields for `{self.type.__name__}`, got {len(values)}."
+            )
+
+        if self._positional:
+            return self.type(*values)
+        return self.type(**{name: value for (name, _, _), value in zip(self.fields, values)})
+
+    def to_str_sync(self, obj: t.Any) -> str:
+        return _pack(
+            None if value is None else converter.to_str_sync(value)
+            for (_, _, converter), value in zip(self.fields, self.values(obj))
+        )
+
+    def from_str_sync(self, obj: str) -> t.Any:
+        values = _unpack(obj)
+        if len(values) != len(self.fields):
+            raise exceptions.SerializerError(
+                f"Expected {len(self.fields)} fields for `{self.type.__name__}`, got {len(values)}."
+            )
+
+        return self.create(
+            [
+                None if value is None else converter.from_str_sync(value)
+                for (_, _, converter), value in zip(self.fields, values)
+            ]
+        )
+
+
+class EntityConverter(Converter[T]):
+    """
+    Base class for converters of hikari entities. Entities are stored as their
+    ids, and are taken from the bot's cache when they are deserialized. Entities
+    that are not cached are fetched with REST. Concurrent deserializations that
+    need the same entity share one request, and fetched entities are reused for
+    `ttl` seconds, so busy components only fetch each entity once.
+
+    Ids can be passed to a component instead of users and channels when it is
+    created. Members and roles are stored with their guild id, so the entity
+    must be passed for them.
+
+    Attributes:
+        ttl:
+            The number of seconds fetched entities are reused for.
+    """
+
+    ttl: t.ClassVar[float] = 30
+
+    _fetched: t.ClassVar[dict[t.Hashable, tuple[float, asyncio.Future[t.Any]]]] = {}
+    """Fetched and pending entities by key, with the time they expire."""
+    _sweep_at: t.ClassVar[int] = 64
+
+    def __init__(self, type: t.Any) -> None:
+        super().__init__(type)
+        self._snowflake = SnowflakeConverter(hikari.Snowflake)  # type: ignore
+
+    @property
+    def cache(self) -> hikari.api.Cache | None:
+        """The bot's cache, or `None` if the bot doesn't have a cache."""
+        app: t.Any = self.app
+        return app.cache if isinstance(app, hikari.CacheAware) else None
+
+    @property
+    def rest(self) -> hikari.api.RESTClient:
+        """The bot's REST client."""
+        return t.cast(hikari.RESTAware, self.app).rest
+
+    async def fetch(self, key: t.Hashable, fetch: t.Callable[[], t.Awaitable[t.Any]]) -> t.Any:
+        """
+        Return the result of `fetch`, or the result of a previous `fetch` with
+        the same key if it is pending or finished less than `ttl` seconds ago.
+        Exceptions are not reused.
+
+        Raises:
+            EntityNotFoundError: The entity was deleted or the bot can't access it.
+            EntityFetchError: The request failed, but might succeed if it is retried.
+        """
+        fetched = EntityConverter._fetched
+        now = time.monotonic()
+        if len(fetched) >= EntityConverter._sweep_at:
+            _sweep_fetched(now)
+
+        loop = asyncio.get_running_loop()
+        entry = fetched.get(key)
+        if entry is None or entry[1].get_loop() is not loop or (entry[1].done() and entry[0] <= now):
+            future = asyncio.ensure_future(fetch())
+            entry = fetched[key] = (now + self.ttl, future)
+            future.add_done_callback(functools.partial(_fetch_done, key))
+
+        try:
+            # One deserialization being cancelled doesn't cancel the request for the others.
+            return await asyncio.shield(entry[1])
+        except (hikari.NotFoundError, hikari.ForbiddenError) as e:
+            raise exceptions.EntityNotFoundError(f"Could not find entity {key}.") from e
+        except hikari.HTTPError as e:
+            raise exceptions.EntityFetchError(f"Could not fetch entity {key}.") from e
+
+    def _ids_to_str(self, *ids: int) -> str:
+        return _pack(self._snowflake.to_str_sync(hikari.Snowflake(id)) for id in ids)
+
+    def _ids_from_str(self, obj: str, count: int) -> list[int]:
+        ids = _unpack(obj)
+        if len(ids) != count or None in ids:
+            raise exceptions.SerializerError(f"Expected {count} ids, got {obj!r}.")
+        return [self._snowflake.from_str_sync(id) for id in t.cast("list[str]", ids)]
+
+
+def _fetch_done(key: t.Hashable, future: asyncio.Future[t.Any]) -> None:
+    if future.cancelled() or future.exception() is not None:
+        entry = EntityConverter._fetched.get(key)
+        if entry is not None and entry[1] is future:
+            del EntityConverter._fetched[key]
+
+
+def _sweep_fetched(now: float) -> None:
+    fetched = EntityConverter._fetched
+    for key in [key for key, (expires, future) in fetched.items() if future.done() and expires <= now]:
+        del fetched[key]
+    EntityConverter._sweep_at = max(64, len(fetched) * 2)
+
+
+class UserConverter(EntityConverter[hikari.User]):
+    """Converter for `hikari.User`. Users are fetched with `hikari.api.RESTClient.fetch_user`."""
+
+    async def to_str(self, obj: hikari.SnowflakeishOr[hikari.User]) -> str:
+        return self._snowflake.to_str_sync(hikari.Snowflake(obj))
+
+    async def from_str(self, obj: str) -> hikari.User:
+        id = self._snowflake.from_str_sync(obj)
+
+        cache = self.cache
+        user = cache.get_user(id) if cache else None
+        if user is None:
+            user = await self.fetch(("user", id), lambda: self.rest.fetch_user(id))
+        return user
+
+
+class MemberConverter(EntityConverter[hikari.Member]):
+    """
+    Converter for `hikari.Member`. The guild id is stored with the member's id.
+    Members are fetched with `hikari.api.RESTClient.fetch_member`.
+    """
+
+    async def to_str(self, obj: hikari.Member) -> str:
+        return self._ids_to_str(obj.guild_id, obj.id)
+
+    async def from_str(self, obj: str) -> hikari.Member:
+        guild_id, id = self._ids_from_str(obj, 2)
+
+        cache = self.cache
+        member = cache.get_member(guild_id, id) if cache else None
+        if member is None:
+            member = await self.fetch(("member", guild_id, id), lambda: self.rest.fetch_member(guild_id, id))
+        return member
+
+
+class RoleConverter(EntityConverter[hikari.Role]):
+    """
+    Converter for `hikari.Role`. The guild id is stored with the role's id.
+    Roles are fetched with `hikari.api.RESTClient.fetch_roles`, so a single
+    request is shared by every role in the same guild.
+    """
+
+    async def to_str(self, obj: hikari.Role) -> str:
+        return self._ids_to_str(obj.guild_id, obj.id)
+
+    async def from_str(self, obj: str) -> hikari.Role:
+        guild_id, id = self._ids_from_str(obj, 2)
+
+        cache = self.cache
+        role = cache.get_role(id) if cache else None
+        if role is not None:
+            return role
+
+        roles: t.Sequence[hikari.Role] = await self.fetch(("roles", guild_id), lambda: self.rest.fetch_roles(guild_id))
+        for role in roles:
+            if role.id == id:
+                return role
+        raise exceptions.EntityNotFoundError(f"Role {id} does not exist in guild {guild_id}.")
+
+
+class GuildChannelConverter(EntityConverter[hikari.GuildChannel]):
+    """
+    Converter for `hikari.GuildChannel` and its subclasses. Channels are fetched
+    with `hikari.api.RESTClient.fetch_channel`.
+    """
+
+    async def to_str(self, obj: hikari.SnowflakeishOr[hikari.GuildChannel]) -> str:
+        return self._snowflake.to_str_sync(hikari.Snowflake(obj))
+
+    async def from_str(self, obj: str) -> hikari.GuildChannel:
+        id = self._snowflake.from_str_sync(obj)
+
+        cache = self.cache
+        channel: hikari.PartialChannel | None = cache.get_guild_channel(id) if cache else None
+        if channel is None:
+            channel = await self.fetch(("channel", id), lambda: self.rest.fetch_channel(id))
+
+        if not isinstance(channel, self.type):  # type: ignore
+            raise exceptions.EntityNotFoundError(f"Channel {id} is not a `{self.type.__name__}`.")  # type: ignore
+        return t.cast(hikari.GuildChannel, channel)
+
+
 add_converter(float, FloatConverter, supports_subclass=True)
 add_converter(int, IntConverter, supports_subclass=True)
+add_converter(hikari.Snowflake, SnowflakeConverter)
 add_converter(str, StringConverter, supports_subclass=True)
 add_converter(t.Literal, StringConverter)
 add_converter(enum.Enum, EnumConverter, supports_subclass=True)
 add_converter(bool, BoolConverter)
+add_converter(list, SequenceConverter)
+add_converter(set, SequenceConverter)
+add_converter(frozenset, SequenceConverter)
+add_converter(tuple, TupleConverter)
+add_converter(dict, DictConverter)
+add_converter(hikari.Member, MemberConverter, supports_subclass=True)
+add_converter(hikari.User, UserConverter, supports_subclass=True)
+add_converter(hikari.Role, RoleConverter)
+add_converter(hikari.GuildChannel, GuildChannelConverter, supports_subclass=True)
 
 # MIT License
 #
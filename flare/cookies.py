@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import typing as t
+
+__all__: t.Final[t.Sequence[str]] = ("CookieManifest",)
+
+_ALPHABET: t.Final[str] = "".join(chr(i) for i in range(0xA0, 0x100))
+"""
+Short cookies are made from non-ASCII latin1 characters so they are one
+character each in a custom_id and are unlikely to match a cookie chosen by
+the user.
+"""
+
+
+def _short_cookies() -> t.Iterator[str]:
+    yield from _ALPHABET
+    for a, b in itertools.product(_ALPHABET, repeat=2):
+        yield a + b
+
+
+def _frozen_manifest(cookies: dict[str, str]) -> CookieManifest:
+    manifest = CookieManifest(update=False)
+    manifest._cookies = dict(cookies)
+    manifest._used = set(cookies.values())
+    return manifest
+
+
+class CookieManifest:
+    """
+    Assigns every component a one or two character cookie instead of the
+    eight character hash flare uses by default, leaving more of the custom_id
+    for state. Assignments are saved to a JSON file so a component keeps the
+    same cookie when the bot restarts. The file should be kept with the bot's
+    source code and shared by every process running the bot.
+
+    .. code-block:: python
+
+        flare.install(bot, cookies=flare.CookieManifest("cookies.json"))
+
+    Components can still be deserialized from their old cookie, so buttons
+    sent before the manifest was enabled keep working.
+
+    Args:
+        path:
+            The path to the manifest file. If `None`, cookies are assigned in
+            the order components are created and are not saved.
+        update:
+            If `True`, components that are not in the manifest are assigned a
+            new cookie and the file is updated. If `False`, these components
+            keep their default cookie.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None, *, update: bool = True) -> None:
+        self._path = path
+        self._update = update
+
+        self._cookies: dict[str, str] = {}
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._cookies = json.load(f)
+
+        self._used: set[str] = set(self._cookies.values())
+        self._free = (cookie for cookie in _short_cookies() if cookie not in self._used)
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        # A manifest sent to another process can't assign cookies, so every process uses the same cookies.
+        return (_frozen_manifest, (self._cookies,))
+
+    def __contains__(self, cookie: object) -> bool:
+        return cookie in self._cookies
+
+    def __len__(self) -> int:
+        return len(self._cookies)
+
+    def get(self, cookie: str) -> str | None:
+        """Return the short cookie assigned to a component's default cookie."""
+        return self._cookies.get(cookie)
+
+    def assign(self, cookie: str, reserved: t.Container[str] = ()) -> str | None:
+        """
+        Return the short cookie for a component's default cookie, assigning a
+        new one if the manifest can be updated.
+
+        Args:
+            cookie:
+                The component's default cookie.
+            reserved:
+                Cookies that are already used and should not be assigned.
+
+        Returns:
+            The short cookie, or `None` if the component should keep its default cookie.
+        """
+        short = self._cookies.get(cookie)
+        if short is not None or not self._update:
+            return short
+
+        short = next((short for short in self._free if short not in reserved), None)
+        if short is None:
+            return None
+
+        self._cookies[cookie] = short
+        self._used.add(short)
+        self.save()
+        return short
+
+    def save(self) -> None:
+        """Write the manifest to its file. Does nothing if the manifest does not have a path."""
+        if self._path is None:
+            return
+
+        tmp = f"{os.fspath(self._path)}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._cookies, f, indent=4, sort_keys=True)
+        os.replace(tmp, self._path)
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -15,6 +15,21 @@ class SerializerVersionViolation(SerializerError):
     """An exception raised when a serializer fails to deserialize a custom_id due to a version mismatch."""
 
 
+class CustomIDTooLongError(SerializerError):
+    """An exception raised when a serialized custom_id is longer than 100 characters."""
+
+
+class EntityNotFoundError(SerializerError):
+    """An exception raised when an entity stored in a custom_id was deleted or can't be accessed."""
+
+
+class EntityFetchError(SerializerError):
+    """
+    An exception raised when an entity stored in a custom_id could not be fetched
+    because of a temporary error, for example a rate limit or a server error.
+    """
+
+
 class ConverterError(Exception):
     """Exception raised when there is a error with converters."""
 
@@ -31,6 +46,14 @@ class RowMaxWidthError(ComponentError):
     """Exception raised when a row exceeds the maximum width."""
 
 
+class CookieCollisionError(ComponentError):
+    """Raised when two different components are registered with the same cookie."""
+
+
+class RegistryMismatchError(ComponentError):
+    """Raised when a worker process did not register the same components as the main process."""
+
+
 class CustomIDNotSetError(ComponentError):
     """Raised when a component's custom ID is not set because the row it is in was not awaited."""
 
@@ -1,8 +1,23 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import concurrent.futures
+import hashlib
 import typing as t
 
 import hikari
 
-from flare.internal.serde import Serde, SerdeABC
+from flare.exceptions import CookieCollisionError
+from flare.internal.middleware import Middleware, Pipeline, compile_middleware
+from flare.internal.serde import CacheSerde, Serde, SerdeABC, StoreSerde
+
+if t.TYPE_CHECKING:
+    from flare.cookies import CookieManifest
+    from flare.internal.event_handler import Dispatcher
+    from flare.internal.processes import ProcessDispatcher
+    from flare.internal.ratelimit import RateLimit
+    from flare.store import StateStore
 
 __all__: t.Final[t.Sequence[str]] = ("install",)
 
@@ -13,27 +28,262 @@ components: dict[str, t.Any] = {}
 active_serde: SerdeABC = Serde()
 """The currently active serializer."""
 
+rejected: collections.OrderedDict[str, None] = collections.OrderedDict()
+"""
+Recent custom_ids that looked like they were created by flare but could not be
+deserialized, so they are ignored without being deserialized again.
+"""
+
+REJECTED_SIZE: t.Final[int] = 1024
+"""The maximum number of custom_ids in `rejected`."""
+
+active_dispatcher: Dispatcher | None = None
+"""Limits the number of callbacks that run at the same time if set."""
+
+rest_responses: dict[hikari.Snowflake, tuple[asyncio.Future[hikari.api.InteractionResponseBuilder], asyncio.Event]] = {}
+"""
+Interactions received by an interaction server that are waiting for their initial
+response. The response is returned in the HTTP response instead of being sent
+with a REST request. The event is set once the interaction server took the
+response. Later REST requests for the interaction wait for it, although the HTTP
+response may not have been written yet.
+"""
+
+active_processes: ProcessDispatcher | None = None
+"""Runs callbacks in worker processes if set."""
+
+auto_defer_after: float | None = None
+"""The number of seconds before flare defers interactions that weren't responded to."""
+
+cookie_manifest: CookieManifest | None = None
+"""Assigns short cookies to components if enabled."""
+
+active_ratelimit: RateLimit | None = None
+"""Limits how often every component's callbacks are run if set."""
+
+callback_timeout: float | None = None
+"""The number of seconds before callbacks without their own timeout are cancelled."""
+
+draining: bool = False
+"""`True` once the bot is stopping. New interactions are ignored."""
+
+detach_rest_callbacks: bool = False
+"""
+`True` if the interaction server should not wait for callbacks when it closes.
+They are waited for by the shutdown callback that drains them instead.
+"""
+
+installed_middleware: t.Sequence[Middleware] = ()
+"""The middleware passed to `install`."""
+
+active_middleware: Pipeline | None = None
+"""The hooks of `installed_middleware` combined, or `None` if there isn't any middleware."""
+
+callback_executor: concurrent.futures.ThreadPoolExecutor | None = None
+"""The executor that runs callbacks that are not `async`. The event loop's default executor is used if `None`."""
+
+_cookie_owners: dict[str, str] = {}
+"""The default cookie of the component each registered cookie belongs to."""
+
+
+def _add_cookie(component: t.Any, cookie: str, owner: str) -> None:
+    existing = _cookie_owners.get(cookie)
+    if existing is not None and existing != owner:
+        raise CookieCollisionError(
+            f"Cookie {cookie!r} for `{component.__name__}` is already used by `{components[cookie].__name__}`."
+        )
+
+    components[cookie] = component
+    _cookie_owners[cookie] = owner
+    # A rejected custom_id may belong to this component.
+    rejected.clear()
+
+
+def register(component: t.Any, cookie: str) -> str:
+    """
+    Register a component under its default cookie, and under its short cookie if
+    a cookie manifest is installed. The default cookie is always registered so
+    custom_ids created before the manifest was enabled can still be deserialized.
+
+    Returns:
+        The cookie the component should be serialized with.
+    """
+    _add_cookie(component, cookie, cookie)
+
+    if cookie_manifest is None:
+        return cookie
 
-def install(app: hikari.EventManagerAware, serde: SerdeABC | None = None) -> None:
+    short = cookie_manifest.assign(cookie, _cookie_owners)
+    if short is None:
+        return cookie
+
+    _add_cookie(component, short, cookie)
+    return short
+
+
+def registry_fingerprint() -> str:
+    """
+    A hash of every registered cookie and the fields of its component. Processes
+    that registered the same components have the same fingerprint.
+    """
+    registry = sorted(
+        (cookie, component.__name__, [(name, repr(type_)) for name, type_ in component._codec_plan.items()])
+        for cookie, component in components.items()
+    )
+    return hashlib.blake2s(repr(registry).encode()).hexdigest()
+
+
+def install(
+    app: hikari.EventManagerAware | hikari.InteractionServerAware,
+    serde: SerdeABC | None = None,
+    store: StateStore | None = None,
+    cache_size: int | None = None,
+    cookies: CookieManifest | None = None,
+    dispatcher: Dispatcher | None = None,
+    auto_defer: float | None = None,
+    processes: ProcessDispatcher | None = None,
+    ratelimit: RateLimit | None = None,
+    timeout: float | None = None,
+    drain: float | None = None,
+    executor: concurrent.futures.ThreadPoolExecutor | None = None,
+    middleware: t.Sequence[Middleware] = (),
+    listen: bool = True,
+) -> None:
     """Install flare under the given bot instance.
 
     Args:
         bot:
-            The bot to install flare under.
+            The bot to install flare under. If the bot is a `hikari.RESTBot`, flare
+            handles component and modal interactions received by its interaction
+            server and returns the initial response in the HTTP response.
         serde:
             For advanced usage, you can pass a custom serializer. By default uses the default serializer.
+        store:
+            A store to save the state of components whose custom_id would be too long.
+            If `None`, a `flare.exceptions.CustomIDTooLongError` is raised instead.
+        cache_size:
+            If provided, up to this many decoded custom_ids are cached so repeated
+            clicks on the same component are not deserialized again.
+        cookies:
+            If provided, components are given the short cookies from this manifest
+            instead of their default cookie.
+        dispatcher:
+            If provided, limits the number of callbacks that run at the same time.
+            By default every callback is run as soon as its interaction is received.
+        auto_defer:
+            If provided, flare defers interactions that were not responded to this
+            many seconds after they were received. Discord requires a response within
+            3 seconds, so `2.2` leaves time for the request to reach Discord.
+        processes:
+            If provided, callbacks are run in worker processes. Only supported for
+            gateway bots.
+        ratelimit:
+            If provided, limits how often interactions with any component are handled.
+            Interactions are checked before their custom_id is deserialized. Each
+            worker process has its own limit if `processes` is used.
+        timeout:
+            If provided, callbacks are cancelled if they run for longer than this
+            many seconds. Components can set their own timeout.
+        drain:
+            If provided, flare stops handling new interactions when the bot is
+            stopping, and waits up to this many seconds for running callbacks to
+            finish. Callbacks that are still running are cancelled.
+        executor:
+            The executor used to run callbacks that are not `async`. By default
+            they are run in the event loop's default executor.
+        middleware:
+            Middleware that runs around every interaction, in order. The first
+            middleware's `around_callback` hook is the outermost.
+        listen:
+            If `False`, flare doesn't listen for interactions. Interactions must
+            be passed to `flare.dispatch` by another handler instead.
     """
-    global active_serde
+    global active_serde, active_dispatcher, active_middleware, active_processes, active_ratelimit, installed_middleware
+    global auto_defer_after, callback_executor, callback_timeout, cookie_manifest, detach_rest_callbacks, draining
 
     if serde is not None:
         active_serde = serde
 
+    if store is not None:
+        active_serde = StoreSerde(active_serde, store)
+
+    if cache_size is not None:
+        active_serde = CacheSerde(active_serde, cache_size)
+
+    rejected.clear()
+
+    active_dispatcher = dispatcher
+    auto_defer_after = auto_defer
+    active_ratelimit = ratelimit
+    callback_timeout = timeout
+    callback_executor = executor
+    installed_middleware = tuple(middleware)
+    active_middleware = compile_middleware(installed_middleware)
+    draining = False
+    detach_rest_callbacks = False
+
+    if cookies is not None:
+        cookie_manifest = cookies
+
+        # Components are usually created before `install` is called.
+        for cookie, owner in list(_cookie_owners.items()):
+            if cookie == owner:
+                component = components[cookie]
+                component._cookie = register(component, cookie)
+
     from flare.converters import Converter
-    from flare.internal.event_handler import on_inter
+    from flare.internal.event_handler import drain_callbacks, on_inter, on_rest_inter
+
+    Converter.app = app  # type: ignore
+
+    if isinstance(app, hikari.InteractionServerAware):
+        if processes is not None:
+            raise ValueError("`processes` can only be used with gateway bots.")
+
+        if listen:
+            app.interaction_server.set_listener(hikari.ComponentInteraction, on_rest_inter)  # type: ignore
+            app.interaction_server.set_listener(hikari.ModalInteraction, on_rest_inter)  # type: ignore
+
+        if drain is not None and isinstance(app, hikari.RESTBot):
+            # `RESTBot.close` closes the interaction server, which waits for every
+            # callback without a timeout, before it runs shutdown callbacks.
+            detach_rest_callbacks = True
+
+            async def drain_rest(_: hikari.RESTBot) -> None:
+                await drain_callbacks(drain)
+
+            app.add_shutdown_callback(drain_rest)
+    elif processes is not None:
+        if not listen:
+            raise ValueError("`processes` can't be used if `listen` is `False`.")
+
+        from flare.internal.processes import on_payload
+
+        active_processes = processes
+
+        async def start(_: hikari.StartingEvent) -> None:
+            await asyncio.to_thread(processes.start)
+
+        async def stop(_: hikari.StoppingEvent) -> None:
+            # Workers finish the interactions they received before they exit.
+            if drain is None:
+                await asyncio.to_thread(processes.stop)
+            else:
+                await asyncio.to_thread(processes.stop, drain)
+
+        app.event_manager.subscribe(hikari.StartingEvent, start)
+        app.event_manager.subscribe(hikari.StoppingEvent, stop)
+        app.event_manager.subscribe(hikari.ShardPayloadEvent, on_payload)
+    else:
+        if listen:
+            app.event_manager.subscribe(hikari.InteractionCreateEvent, on_inter)
+
+        if drain is not None:
 
-    Converter.app = app
+            async def drain_gateway(_: hikari.StoppingEvent) -> None:
+                await drain_callbacks(drain)
 
-    app.event_manager.subscribe(hikari.InteractionCreateEvent, on_inter)
+            app.event_manager.subscribe(hikari.StoppingEvent, drain_gateway)
 
 
 # MIT License
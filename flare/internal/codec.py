@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import typing as t
+
+from flare import converters
+from flare.exceptions import ConverterError
+
+__all__: t.Final[t.Sequence[str]] = ("FieldCodec", "CodecPlan")
+
+
+class FieldCodec(t.NamedTuple):
+    """The converter functions used to encode and decode a single field."""
+
+    name: str
+    """The name of the field."""
+    type: t.Any
+    """The type hint of the field."""
+    to_str: t.Callable[[t.Any], t.Awaitable[str]]
+    """Encode a value of this field to a string."""
+    from_str: t.Callable[[str], t.Awaitable[t.Any]]
+    """Decode a string to a value of this field."""
+    to_str_sync: t.Callable[[t.Any], str] | None
+    """Encode a value of this field without awaiting if the converter is a `flare.SyncConverter`."""
+    from_str_sync: t.Callable[[str], t.Any] | None
+    """Decode a value of this field without awaiting if the converter is a `flare.SyncConverter`."""
+    cacheable: bool
+    """Whether decoded values of this field can be reused."""
+
+
+class CodecPlan(t.Mapping[str, t.Any]):
+    """
+    An ordered tuple of field codecs for a component, compiled once when the
+    component is created instead of every time it is serialized or deserialized.
+
+    A codec plan is a mapping of field names to type hints, so it can be passed
+    anywhere a `types` dictionary is expected.
+
+    Args:
+        types:
+            A dictionary of field names to field type hints.
+    """
+
+    __slots__ = ("_types", "_fields", "_version")
+
+    def __init__(self, types: t.Mapping[str, t.Any]) -> None:
+        self._types: dict[str, t.Any] = dict(types)
+        self._fields: tuple[FieldCodec, ...] = ()
+        self._version: int = -1
+
+        try:
+            self.compile()
+        except ConverterError:
+            # The converter for a field may be added after the component is
+            # created, so the plan is compiled again when it is first used.
+            pass
+
+    def __getitem__(self, key: str) -> t.Any:
+        return self._types[key]
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._types)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._types!r})"
+
+    @property
+    def fields(self) -> tuple[FieldCodec, ...]:
+        """
+        The compiled field codecs in field order. The plan is recompiled if a
+        converter was added since it was last compiled.
+        """
+        if self._version != converters._converters_version:
+            self.compile()
+        return self._fields
+
+    @property
+    def cacheable(self) -> bool:
+        """Whether the decoded values of every field can be reused."""
+        return all(field.cacheable for field in self.fields)
+
+    def compile(self) -> None:
+        """
+        Resolve the converter for every field.
+
+        Raises:
+            ConverterError: A converter could not be found for a field.
+        """
+        fields: list[FieldCodec] = []
+        for name, type_ in self._types.items():
+            converter = converters.get_converter(type_)
+            if isinstance(converter, converters.SyncConverter):
+                fields.append(
+                    FieldCodec(
+                        name,
+                        type_,
+                        converter.to_str,
+                        converter.from_str,
+                        converter.to_str_sync,
+                        converter.from_str_sync,
+                        converter.cacheable,
+                    )
+                )
+            else:
+                fields.append(
+                    FieldCodec(name, type_, converter.to_str, converter.from_str, None, None, converter.cacheable)
+                )
+
+        self._fields = tuple(fields)
+        self._version = converters._converters_version
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+import hikari
+
+__all__: t.Final[t.Sequence[str]] = ("Debounce",)
+
+_Key = t.Tuple[hikari.Snowflake, hikari.Snowflake, str]
+
+
+class Debounce:
+    """
+    Ignores repeated clicks on a component. After a user clicks a component,
+    clicks by the same user on the same component and message are acknowledged
+    without running the callback until `window` seconds passed and the callback
+    finished.
+
+    .. code-block:: python
+
+        @flare.button(label="Roll", debounce=flare.Debounce(0.5))
+        async def roll(ctx: flare.MessageContext) -> None:
+            ...
+
+    A policy can be shared by several components to count their ignored clicks together.
+
+    Args:
+        window:
+            The number of seconds after a click that repeated clicks are ignored.
+    """
+
+    def __init__(self, window: float = 1) -> None:
+        self.window = window
+        self._suppressed = 0
+
+    @property
+    def suppressed(self) -> int:
+        """The number of clicks that were ignored."""
+        return self._suppressed
+
+
+class _Entry:
+    __slots__ = ("policy", "expires", "running")
+
+    def __init__(self, policy: Debounce, expires: float) -> None:
+        self.policy = policy
+        self.expires = expires
+        self.running = True
+
+
+_entries: dict[_Key, _Entry] = {}
+"""Clicks that repeated clicks are ignored for."""
+
+_sweep_at: int = 64
+"""Expired entries are removed when `_entries` grows to this size."""
+
+
+def _key(interaction: hikari.ComponentInteraction) -> _Key:
+    return (interaction.user.id, interaction.message.id, interaction.custom_id)
+
+
+def is_duplicate(interaction: hikari.ComponentInteraction) -> bool:
+    """
+    Check if an interaction repeats a click that is debounced. The interaction is
+    counted as suppressed if it is.
+    """
+    entry = _entries.get(_key(interaction))
+    if entry is None or not entry.running and entry.expires <= asyncio.get_running_loop().time():
+        return False
+
+    entry.policy._suppressed += 1
+    return True
+
+
+def start(interaction: hikari.ComponentInteraction, policy: Debounce) -> _Key:
+    """Start ignoring repeats of an interaction. `finish` must be called when its callback returns."""
+    global _sweep_at
+
+    now = asyncio.get_running_loop().time()
+    if len(_entries) >= _sweep_at:
+        for expired in [key for key, entry in _entries.items() if not entry.running and entry.expires <= now]:
+            del _entries[expired]
+        _sweep_at = max(64, len(_entries) * 2)
+
+    key = _key(interaction)
+    _entries[key] = _Entry(policy, now + policy.window)
+    return key
+
+
+def finish(key: _Key) -> None:
+    """Mark the callback for an interaction as finished. Repeats are ignored until the window ends."""
+    entry = _entries.get(key)
+    if entry is not None:
+        entry.running = False
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,662 @@
+from __future__ import annotations
+
+import abc
+import re
+import struct
+import types
+import typing as t
+
+import hikari
+
+from flare import converters
+from flare.exceptions import (
+    CustomIDTooLongError,
+    SerializerError,
+    SerializerVersionViolation,
+)
+from flare.internal.codec import CodecPlan, FieldCodec
+from flare.internal.serde import SerdeABC
+
+if t.TYPE_CHECKING:
+    from flare.components import base
+
+__all__: t.Final[t.Sequence[str]] = ("DenseSerde",)
+
+_CHAR_BITS = 15
+"""The number of bits stored in each character of a custom_id."""
+
+# Characters are taken from two blocks of assigned code points in the basic
+# multilingual plane that are not changed by NFC or NFKC normalization. The
+# first block is CJK Unified Ideographs Extension A through CJK Unified
+# Ideographs, and the second is the start of Hangul Syllables. Hangul syllables
+# are decomposed by NFD and NFKD, so custom_ids are assumed to be returned
+# unchanged or normalized to NFC.
+_FIRST_BLOCK_START = 0x3400
+_FIRST_BLOCK_SIZE = 0xA000 - _FIRST_BLOCK_START
+_SECOND_BLOCK_START = 0xAC00
+_SECOND_BLOCK_SIZE = 2**_CHAR_BITS - _FIRST_BLOCK_SIZE
+
+_DENSE_PATTERN = re.compile(
+    f"[{chr(_FIRST_BLOCK_START)}-{chr(_FIRST_BLOCK_START + _FIRST_BLOCK_SIZE - 1)}"
+    f"{chr(_SECOND_BLOCK_START)}-{chr(_SECOND_BLOCK_START + _SECOND_BLOCK_SIZE - 1)}]+"
+)
+"""Matches strings that only contain characters used by `DenseSerde`."""
+
+
+def _to_char(value: int) -> str:
+    if value < _FIRST_BLOCK_SIZE:
+        return chr(_FIRST_BLOCK_START + value)
+    return chr(_SECOND_BLOCK_START + value - _FIRST_BLOCK_SIZE)
+
+
+def _from_char(char: str) -> int:
+    code_point = ord(char)
+    if _FIRST_BLOCK_START <= code_point < _FIRST_BLOCK_START + _FIRST_BLOCK_SIZE:
+        return code_point - _FIRST_BLOCK_START
+    if _SECOND_BLOCK_START <= code_point < _SECOND_BLOCK_START + _SECOND_BLOCK_SIZE:
+        return code_point - _SECOND_BLOCK_START + _FIRST_BLOCK_SIZE
+    raise SerializerError(f"Character {char!r} can not be decoded by DenseSerde.")
+
+
+class _BitWriter:
+    __slots__ = ("value", "length", "snowflake_base")
+
+    def __init__(self) -> None:
+        self.value = 0
+        self.length = 0
+        self.snowflake_base: int | None = None
+        """The timestamp of the first snowflake written, which later snowflakes are stored relative to."""
+
+    def write(self, value: int, bits: int) -> None:
+        self.value = (self.value << bits) | value
+        self.length += bits
+
+    def write_varuint(self, value: int, group_bits: int = 7) -> None:
+        """Write an unsigned int in groups of `group_bits`, each followed by a continuation bit."""
+        mask = (1 << group_bits) - 1
+        while True:
+            group = value & mask
+            value >>= group_bits
+            self.write(group, group_bits)
+            self.write(1 if value else 0, 1)
+            if not value:
+                return
+
+    def to_str(self) -> str:
+        length = -(-self.length // _CHAR_BITS)
+        value = self.value << (length * _CHAR_BITS - self.length)
+        mask = 2**_CHAR_BITS - 1
+        return "".join(_to_char((value >> (_CHAR_BITS * i)) & mask) for i in range(length - 1, -1, -1))
+
+
+class _BitReader:
+    __slots__ = ("value", "remaining", "snowflake_base")
+
+    def __init__(self, string: str) -> None:
+        value = 0
+        for char in string:
+            value = (value << _CHAR_BITS) | _from_char(char)
+
+        self.value = value
+        self.remaining = len(string) * _CHAR_BITS
+        self.snowflake_base: int | None = None
+
+    def read(self, bits: int) -> int:
+        if bits > self.remaining:
+            raise SerializerError("Unexpected end of custom_id.")
+        self.remaining -= bits
+        return (self.value >> self.remaining) & ((1 << bits) - 1)
+
+    def read_varuint(self, group_bits: int = 7) -> int:
+        value = 0
+        shift = 0
+        while True:
+            value |= self.read(group_bits) << shift
+            shift += group_bits
+            if not self.read(1):
+                return value
+
+
+class _BitCodec(abc.ABC):
+    @abc.abstractmethod
+    def write(self, writer: _BitWriter, value: t.Any) -> None:
+        ...
+
+    @abc.abstractmethod
+    def read(self, reader: _BitReader) -> t.Any:
+        ...
+
+
+class _RangeCodec(_BitCodec):
+    """An int stored in the minimum number of bits needed for its `Range`."""
+
+    def __init__(self, type: t.Any, range: converters.Range) -> None:
+        self.type = type
+        self.start = range.start
+        self.stop = range.stop
+        self.bits = (range.stop - range.start - 1).bit_length()
+
+    def write(self, writer: _BitWriter, value: int) -> None:
+        if not self.start <= value < self.stop:
+            raise SerializerError(f"{value} is not in Range({self.start}, {self.stop}).")
+        writer.write(value - self.start, self.bits)
+
+    def read(self, reader: _BitReader) -> int:
+        value = self.start + reader.read(self.bits)
+        if value >= self.stop:
+            raise SerializerError(f"{value} is not in Range({self.start}, {self.stop}).")
+        return self.type(value)
+
+
+class _IntCodec(_BitCodec):
+    """An unbounded int stored as a zigzag encoded varint."""
+
+    def __init__(self, type: t.Any) -> None:
+        self.type = type
+
+    def write(self, writer: _BitWriter, value: int) -> None:
+        writer.write_varuint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def read(self, reader: _BitReader) -> int:
+        value = reader.read_varuint()
+        return self.type(value // 2 if not value & 1 else -(value + 1) // 2)
+
+
+_TIMESTAMP_BITS = 42
+"""The number of bits of a snowflake's timestamp, in milliseconds since the Discord epoch."""
+_RELATIVE_GROUPS = 5
+"""Timestamp deltas that fit in this many varint groups are cheaper than a full timestamp."""
+
+
+class _SnowflakeCodec(_BitCodec):
+    """
+    A snowflake stored as its timestamp, worker and process ids, and increment.
+    The first snowflake's timestamp is stored in full. Every later snowflake
+    stores a flag bit, then its timestamp as a zigzag encoded delta from the
+    first snowflake's timestamp if that is shorter. Snowflakes created around
+    the same time, such as ids from the same guild, usually differ by a few bytes.
+    """
+
+    def write(self, writer: _BitWriter, value: int) -> None:
+        if not 0 <= value < 1 << 64:
+            raise SerializerError(f"{value} is not a valid snowflake.")
+
+        timestamp = value >> 22
+        base = writer.snowflake_base
+
+        if base is None:
+            writer.snowflake_base = timestamp
+            writer.write(timestamp, _TIMESTAMP_BITS)
+        else:
+            delta = timestamp - base
+            delta = delta * 2 if delta >= 0 else -delta * 2 - 1
+            if delta >> (7 * _RELATIVE_GROUPS):
+                writer.write(0, 1)
+                writer.write(timestamp, _TIMESTAMP_BITS)
+            else:
+                writer.write(1, 1)
+                writer.write_varuint(delta)
+
+        # The worker and process ids, then the increment, which is usually small.
+        writer.write((value >> 12) & 0x3FF, 10)
+        writer.write_varuint(value & 0xFFF, 4)
+
+    def read(self, reader: _BitReader) -> hikari.Snowflake:
+        base = reader.snowflake_base
+
+        if base is None:
+            timestamp = reader.snowflake_base = reader.read(_TIMESTAMP_BITS)
+        elif reader.read(1):
+            delta = reader.read_varuint()
+            timestamp = base + (delta // 2 if not delta & 1 else -(delta + 1) // 2)
+        else:
+            timestamp = reader.read(_TIMESTAMP_BITS)
+
+        ids = reader.read(10)
+        increment = reader.read_varuint(4)
+        if timestamp < 0 or increment > 0xFFF:
+            raise SerializerError("custom_id contains an invalid snowflake.")
+
+        return hikari.Snowflake(timestamp << 22 | ids << 12 | increment)
+
+
+class _BoolCodec(_BitCodec):
+    def write(self, writer: _BitWriter, value: bool) -> None:
+        writer.write(1 if value else 0, 1)
+
+    def read(self, reader: _BitReader) -> bool:
+        return bool(reader.read(1))
+
+
+class _FloatCodec(_BitCodec):
+    def write(self, writer: _BitWriter, value: float) -> None:
+        writer.write(int.from_bytes(struct.pack("<d", value), "little"), 64)
+
+    def read(self, reader: _BitReader) -> float:
+        return struct.unpack("<d", reader.read(64).to_bytes(8, "little"))[0]
+
+
+class _ChoiceCodec(_BitCodec):
+    """One of a fixed sequence of values, such as enum members or `typing.Literal` arguments, stored by index."""
+
+    def __init__(self, choices: t.Sequence[t.Any]) -> None:
+        self.choices = tuple(choices)
+        self.indexes = {choice: index for index, choice in enumerate(self.choices)}
+        self.bits = (len(self.choices) - 1).bit_length()
+
+    def write(self, writer: _BitWriter, value: t.Any) -> None:
+        index = self.indexes.get(value)
+        if index is None:
+            raise SerializerError(f"{value!r} is not one of {self.choices}.")
+        writer.write(index, self.bits)
+
+    def read(self, reader: _BitReader) -> t.Any:
+        index = reader.read(self.bits)
+        if index >= len(self.choices):
+            raise SerializerError(f"Index {index} is out of range for {self.choices}.")
+        return self.choices[index]
+
+
+class _StrCodec(_BitCodec):
+    """
+    A length prefixed string. Strings that only contain latin1 characters use
+    8 bits per character, otherwise the string is stored as utf-8.
+    """
+
+    def write(self, writer: _BitWriter, value: str) -> None:
+        try:
+            data = value.encode("latin1")
+            writer.write(1, 1)
+        except UnicodeEncodeError:
+            data = value.encode("utf-8")
+            writer.write(0, 1)
+
+        writer.write_varuint(len(data))
+        writer.write(int.from_bytes(data, "big"), len(data) * 8)
+
+    def read(self, reader: _BitReader) -> str:
+        is_latin1 = reader.read(1)
+        length = reader.read_varuint()
+        data = reader.read(length * 8).to_bytes(length, "big")
+
+        try:
+            return data.decode("latin1" if is_latin1 else "utf-8")
+        except UnicodeDecodeError as e:
+            raise SerializerError("custom_id contains an invalid string.") from e
+
+
+_str_codec = _StrCodec()
+
+
+class _DenseField(t.NamedTuple):
+    name: str
+    optional: bool
+    """If `True`, a bit is stored to signify whether the value is `None`."""
+    codec: _BitCodec
+    converter: FieldCodec | None
+    """
+    The converter for types without a bit codec. The value is converted to a
+    string with the converter, then stored with `_StrCodec`.
+    """
+
+
+def _unwrap(hint: t.Any) -> tuple[t.Any, list[t.Any], bool]:
+    """Return the type hint without `typing.Annotated` and `None`, the annotated metadata and if `None` is allowed."""
+    metadata: list[t.Any] = []
+    optional = False
+
+    while True:
+        if t.get_origin(hint) is t.Annotated:
+            hint, *extra = t.get_args(hint)
+            metadata.extend(extra)
+        elif converters._is_union(hint):
+            args = t.get_args(hint)
+            not_none = [arg for arg in args if arg is not types.NoneType]
+            optional = optional or len(not_none) != len(args)
+            hint = not_none[0]
+        else:
+            return hint, metadata, optional
+
+
+class _ItemCodec(t.NamedTuple):
+    codec: _BitCodec
+    optional: bool
+    """If `True`, a bit is stored to signify whether the item is `None`."""
+
+    def write(self, writer: _BitWriter, value: t.Any) -> None:
+        if self.optional:
+            writer.write(0 if value is None else 1, 1)
+            if value is None:
+                return
+        self.codec.write(writer, value)
+
+    def read(self, reader: _BitReader) -> t.Any:
+        if self.optional and not reader.read(1):
+            return None
+        return self.codec.read(reader)
+
+
+_MAX_ITEMS: t.Final[int] = 100 * _CHAR_BITS
+"""
+The most items a container can have. Items take at least one bit unless every
+value of their type is stored in 0 bits, so this only limits those.
+"""
+
+
+def _write_count(writer: _BitWriter, count: int) -> None:
+    if count > _MAX_ITEMS:
+        raise SerializerError(f"Containers can have at most {_MAX_ITEMS} items, got {count}.")
+    writer.write_varuint(count)
+
+
+def _read_count(reader: _BitReader) -> int:
+    count = reader.read_varuint()
+    # A crafted custom_id could otherwise make reading items of 0 bits loop for a very long time.
+    if count > max(reader.remaining, _MAX_ITEMS):
+        raise SerializerError(f"custom_id contains a container with {count} items.")
+    return count
+
+
+class _SequenceCodec(_BitCodec):
+    """A `list`, `set`, `frozenset` or variable length `tuple` stored as a varint length followed by its items."""
+
+    def __init__(self, origin: t.Any, item: _ItemCodec) -> None:
+        self.origin = origin
+        self.item = item
+
+    def write(self, writer: _BitWriter, value: t.Collection[t.Any]) -> None:
+        _write_count(writer, len(value))
+        for item in value:
+            self.item.write(writer, item)
+
+    def read(self, reader: _BitReader) -> t.Any:
+        return self.origin(self.item.read(reader) for _ in range(_read_count(reader)))
+
+
+class _TupleCodec(_BitCodec):
+    """A fixed length `tuple`. The length is part of the type hint so it is not stored."""
+
+    def __init__(self, items: t.Sequence[_ItemCodec]) -> None:
+        self.items = tuple(items)
+
+    def write(self, writer: _BitWriter, value: tuple[t.Any, ...]) -> None:
+        if len(value) != len(self.items):
+            raise SerializerError(f"Expected a tuple with {len(self.items)} items, got {len(value)}.")
+        for codec, item in zip(self.items, value):
+            codec.write(writer, item)
+
+    def read(self, reader: _BitReader) -> tuple[t.Any, ...]:
+        return tuple(codec.read(reader) for codec in self.items)
+
+
+class _DictCodec(_BitCodec):
+    """A `dict` stored as a varint length followed by each key and value."""
+
+    def __init__(self, key: _ItemCodec, value: _ItemCodec) -> None:
+        self.key = key
+        self.value = value
+
+    def write(self, writer: _BitWriter, value: dict[t.Any, t.Any]) -> None:
+        _write_count(writer, len(value))
+        for key, item in value.items():
+            self.key.write(writer, key)
+            self.value.write(writer, item)
+
+    def read(self, reader: _BitReader) -> dict[t.Any, t.Any]:
+        return {self.key.read(reader): self.value.read(reader) for _ in range(_read_count(reader))}
+
+
+class _RecordCodec(_BitCodec):
+    """A record stored as each of its fields in order."""
+
+    def __init__(self, converter: converters.RecordConverter, fields: t.Sequence[_ItemCodec]) -> None:
+        self.converter = converter
+        self.fields = tuple(fields)
+
+    def write(self, writer: _BitWriter, value: t.Any) -> None:
+        for codec, item in zip(self.fields, self.converter.values(value)):
+            codec.write(writer, item)
+
+    def read(self, reader: _BitReader) -> t.Any:
+        return self.converter.create([codec.read(reader) for codec in self.fields])
+
+
+def _compile_item(hint: t.Any) -> _ItemCodec | None:
+    hint, metadata, optional = _unwrap(hint)
+    codec = _compile_hint(hint, metadata)
+    return None if codec is None else _ItemCodec(codec, optional)
+
+
+def _compile_hint(hint: t.Any, metadata: list[t.Any]) -> _BitCodec | None:
+    """Return the bit codec for a type hint, or `None` if the type's converter must be used."""
+    converter = converters.get_converter(hint)
+
+    # Exact types are compared because a subclass of a built-in converter may use a different format.
+    converter_type = type(converter)
+
+    if converter_type is converters.IntConverter:
+        range = next((m for m in metadata if isinstance(m, converters.Range)), None)
+        return _RangeCodec(converter.type, range) if range else _IntCodec(converter.type)
+    if converter_type is converters.SnowflakeConverter:
+        return _SnowflakeCodec()
+    if converter_type is converters.BoolConverter:
+        return _BoolCodec()
+    if converter_type is converters.FloatConverter:
+        return _FloatCodec()
+    if converter_type is converters.EnumConverter:
+        return _ChoiceCodec(list(converter.type))  # type: ignore
+    if converter_type is converters.StringConverter and t.get_origin(hint) is t.Literal:
+        return _ChoiceCodec(t.get_args(hint))
+    if converter_type is converters.StringConverter:
+        return _str_codec
+
+    # Containers are packed item by item if every item type has a bit codec.
+    if converter_type is converters.SequenceConverter or converter_type is converters.TupleConverter:
+        args = t.get_args(hint)
+        if converter_type is converters.TupleConverter and not (len(args) == 2 and args[1] is Ellipsis):
+            items = [_compile_item(arg) for arg in args]
+            return None if None in items else _TupleCodec(t.cast("list[_ItemCodec]", items))
+
+        item = _compile_item(args[0])
+        return None if item is None else _SequenceCodec(t.get_origin(hint), item)
+    if converter_type is converters.DictConverter:
+        key, value = (_compile_item(arg) for arg in t.get_args(hint))
+        return None if key is None or value is None else _DictCodec(key, value)
+    if converter_type is converters.RecordConverter:
+        assert isinstance(converter, converters.RecordConverter)
+        fields = [_compile_item(field_hint) for _, field_hint, _ in converter.fields]
+        return None if None in fields else _RecordCodec(converter, t.cast("list[_ItemCodec]", fields))
+
+    return None
+
+
+def _compile_field(field: FieldCodec) -> _DenseField:
+    hint, metadata, optional = _unwrap(field.type)
+    codec = _compile_hint(hint, metadata)
+
+    if codec is None:
+        return _DenseField(field.name, optional, _str_codec, field)
+    return _DenseField(field.name, optional, codec, None)
+
+
+class DenseSerde(SerdeABC):
+    """
+    A serializer that packs a component's state into a bitstream and stores
+    15 bits in every character of the custom_id. Discord limits custom_ids by
+    characters instead of bytes, so much more state fits in a custom_id than
+    with `flare.internal.serde.Serde`.
+
+    Ints annotated with `flare.Range` are stored in the minimum number of
+    bits. Other ints are stored as varints, snowflakes after the first are
+    stored relative to the first snowflake's timestamp, enums and
+    `typing.Literal` values are stored by index, containers are stored as their
+    length followed by their items, records are stored as their fields, and
+    types with a custom converter are stored as the converter's string.
+
+    Only fields with an optional type hint, such as `int | None`, can be `None`.
+
+    .. code-block:: python
+
+        from flare.internal.dense import DenseSerde
+
+        flare.install(bot, serde=DenseSerde())
+
+    .. warning::
+        Custom ids created by a different serializer can not be deserialized.
+        Enum members are stored by index, so reordering the members of an enum
+        changes the values of existing components.
+
+    Args:
+        increment_bits:
+            The number of bits for `increment`, a unique number to allow buttons for the
+            same values in the same message. `increment_bits` can be set to `0` if
+            identical buttons are never used in the same message.
+        version:
+            The serializer version number.
+    """
+
+    def __init__(self, increment_bits: int = 3, version: int = 0) -> None:
+        self._increment_bits = increment_bits
+        self._increment = 0
+        self._VER = version
+
+        self._fields: dict[str, tuple[int, tuple[_DenseField, ...]]] = {}
+
+    @property
+    def VER(self) -> int:
+        """The version of the serialization format."""
+        return self._VER
+
+    def get_inc(self) -> int:
+        self._increment += 1
+        if self._increment > 2**self._increment_bits - 1:
+            self._increment = 0
+
+        return self._increment
+
+    def get_fields(self, cookie: str, plan: CodecPlan) -> tuple[_DenseField, ...]:
+        """Return the compiled fields for a component. Fields are compiled once for every cookie."""
+        cached = self._fields.get(cookie)
+        if cached is not None and cached[0] == converters._converters_version:
+            return cached[1]
+
+        fields = tuple(_compile_field(field) for field in plan.fields)
+        self._fields[cookie] = (converters._converters_version, fields)
+        return fields
+
+    async def serialize(self, cookie: str, types: t.Mapping[str, t.Any], kwargs: dict[str, t.Any]) -> str:
+        plan = types if isinstance(types, CodecPlan) else CodecPlan(types)
+
+        writer = _BitWriter()
+        writer.write_varuint(self.VER, 3)
+        writer.write(self.get_inc(), self._increment_bits)
+        _str_codec.write(writer, cookie)
+
+        for field in self.get_fields(cookie, plan):
+            val = kwargs.get(field.name)
+
+            if field.optional:
+                writer.write(0 if val is None else 1, 1)
+                if val is None:
+                    continue
+            elif val is None:
+                raise SerializerError(
+                    f"Field `{field.name}` for component {cookie} is not optional so it can not be `None`."
+                )
+
+            if field.converter is not None:
+                if field.converter.to_str_sync is not None:
+                    val = field.converter.to_str_sync(val)
+                else:
+                    val = await field.converter.to_str(val)
+
+            field.codec.write(writer, val)
+
+        out = writer.to_str()
+
+        if len(out) > 100:
+            raise CustomIDTooLongError(
+                f"The serialized custom_id for component {cookie} may be too long."
+                " Try reducing the number of parameters the component takes."
+                f" Got length: {len(out)} Expected length: 100 or less"
+            )
+        return out
+
+    def accepts(self, custom_id: str, map: t.Mapping[str, t.Any]) -> bool:
+        cookie = self.cookie(custom_id)
+        return cookie is not None and cookie in map
+
+    def cookie(self, custom_id: str) -> str | None:
+        # Custom_ids from other libraries almost never only contain these characters.
+        if not _DENSE_PATTERN.fullmatch(custom_id):
+            return None
+
+        reader = _BitReader(custom_id)
+        try:
+            if reader.read_varuint(3) != self.VER:
+                return None
+            reader.read(self._increment_bits)
+            return _str_codec.read(reader)
+        except SerializerError:
+            return None
+
+    async def deserialize(
+        self, custom_id: str, map: dict[str, t.Any]
+    ) -> tuple[type[base.SupportsCallback[t.Any]], dict[str, t.Any]]:
+        reader = _BitReader(custom_id)
+
+        version = reader.read_varuint(3)
+        if version != self.VER:
+            raise SerializerVersionViolation(
+                f"Serializer {self.__class__.__name__} cannot deserialize version {version}."
+            )
+
+        reader.read(self._increment_bits)
+        cookie = _str_codec.read(reader)
+
+        component_ = map.get(cookie)
+
+        if component_ is None:
+            raise SerializerError(f"Component with cookie {cookie} does not exist.")
+
+        kwargs: dict[str, t.Any] = {}
+
+        for field in self.get_fields(cookie, component_._codec_plan):
+            if field.optional and not reader.read(1):
+                kwargs[field.name] = None
+                continue
+
+            val = field.codec.read(reader)
+
+            if field.converter is not None:
+                if field.converter.from_str_sync is not None:
+                    val = field.converter.from_str_sync(val)
+                else:
+                    val = await field.converter.from_str(val)
+
+            kwargs[field.name] = val
+
+        return (component_, kwargs)
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -1,40 +1,630 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import enum
+import functools
 import logging
+import time
+import typing as t
 
 import hikari
 
 from flare.components import CallbackComponent, Modal
 from flare.context import MessageContext, ModalContext
-from flare.exceptions import SerializerError
-from flare.internal import bootstrap
+from flare.exceptions import EntityFetchError, EntityNotFoundError, SerializerError
+from flare.internal import bootstrap, debounce
+from flare.internal.middleware import DispatchInfo
+from flare.internal.ratelimit import RateLimit
+
+if t.TYPE_CHECKING:
+    from flare.context import PartialContext
+
+__all__: t.Final[t.Sequence[str]] = (
+    "Overflow",
+    "DispatcherStats",
+    "Dispatcher",
+    "on_inter",
+    "on_rest_inter",
+    "dispatch",
+    "drain_callbacks",
+)
 
 logger = logging.getLogger(__name__)
 
 
+class Overflow(enum.Enum):
+    """What a `Dispatcher` does with an interaction when its queue is full."""
+
+    REJECT = enum.auto()
+    """Respond with an ephemeral message telling the user to try again."""
+    DROP = enum.auto()
+    """Ignore the interaction. The user will see "This interaction failed"."""
+    WAIT = enum.auto()
+    """Wait for a free slot even though the queue is full."""
+
+
+@dataclasses.dataclass(frozen=True)
+class DispatcherStats:
+    """A snapshot of the statistics of a `Dispatcher`."""
+
+    in_flight: int
+    """The number of callbacks that are running."""
+    queued: int
+    """The number of callbacks waiting for a free slot or an earlier interaction on their message."""
+    completed: int
+    """The number of callbacks that finished, including callbacks that raised an exception."""
+    rejected: int
+    """The number of interactions rejected with a message because the queue was full."""
+    dropped: int
+    """The number of interactions ignored because the queue was full."""
+    messages: int
+    """The number of messages with interactions running or waiting if `per_message` is enabled."""
+    expired: int
+    """The number of interactions ignored because they were older than the `deadline`."""
+
+
+class _MessageQueue:
+    """Runs the interactions for a single message one at a time."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class Dispatcher:
+    """
+    Limits the number of component and modal callbacks that run at the same time.
+    Interactions received while every slot is used wait in a queue, and are
+    handled in the order they were received.
+
+    .. code-block:: python
+
+        flare.install(bot, dispatcher=flare.Dispatcher(max_concurrency=50, max_queue=500))
+
+    Args:
+        max_concurrency:
+            The maximum number of callbacks that run at the same time.
+        max_queue:
+            The maximum number of interactions waiting for a slot, including
+            interactions waiting for an earlier interaction on their message.
+        overflow:
+            What to do with interactions received while the queue is full.
+        reject_message:
+            The message sent to the user if `overflow` is `Overflow.REJECT`.
+        per_message:
+            If `True`, interactions on the same message run one at a time in the
+            order they were received, so callbacks that read and edit the message
+            don't overwrite each other. Interactions on different messages still
+            run at the same time.
+        deadline:
+            If provided, interactions that were not responded to this many seconds
+            after they were created are ignored instead of being run. Discord
+            requires a response within 3 seconds, so the callback would fail anyway.
+            Interactions are checked before their custom_id is deserialized and
+            again once they have a slot. Interactions that were deferred are always run.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        max_queue: int = 1000,
+        overflow: Overflow = Overflow.REJECT,
+        reject_message: str = "Too many people are using this right now. Please try again in a moment.",
+        per_message: bool = False,
+        deadline: float | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1.")
+
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.reject_message = reject_message
+        self.per_message = per_message
+        self.deadline = deadline
+
+        self._in_flight = 0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+        # Queues are removed as soon as they are empty, so only active messages are stored.
+        self._messages: dict[hikari.Snowflake, _MessageQueue] = {}
+        # The number of interactions waiting for an earlier interaction on their message.
+        self._message_waiters = 0
+
+        self._completed = 0
+        self._rejected = 0
+        self._dropped = 0
+        self._expired: dict[str | None, int] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """The number of callbacks that are running."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of callbacks waiting for a free slot or an earlier interaction on their message."""
+        return len(self._waiters) + self._message_waiters
+
+    @property
+    def expired(self) -> t.Mapping[str | None, int]:
+        """
+        The number of interactions ignored because they were older than the
+        `deadline` for each component name. Interactions whose component isn't
+        known before their custom_id is deserialized are counted under `None`.
+        """
+        return dict(self._expired)
+
+    @property
+    def stats(self) -> DispatcherStats:
+        """The statistics for this dispatcher."""
+        return DispatcherStats(
+            in_flight=self._in_flight,
+            queued=len(self._waiters) + self._message_waiters,
+            completed=self._completed,
+            rejected=self._rejected,
+            dropped=self._dropped,
+            messages=len(self._messages),
+            expired=sum(self._expired.values()),
+        )
+
+    async def run(
+        self, ctx: PartialContext[t.Any], callback: t.Callable[[], t.Awaitable[None]], name: str | None = None
+    ) -> None:
+        """
+        Run a callback once a slot is free.
+
+        Args:
+            ctx:
+                The context for the interaction, used to reject it if the queue is full.
+            callback:
+                The function that runs the component's callback.
+            name:
+                The name of the component, used to count expired interactions.
+        """
+        if self._expire(ctx, name):
+            return
+
+        message = ctx.interaction.message if self.per_message else None
+        if message is None:
+            await self._run(ctx, callback, name)
+            return
+
+        # The message's queue is waited on before a slot so waiting interactions don't use slots.
+        queue = self._messages.get(message.id)
+        if queue is None:
+            queue = self._messages[message.id] = _MessageQueue()
+
+        queue.users += 1
+        try:
+            if queue.lock.locked() and self._queue_full() and await self._overflowed(ctx):
+                return
+
+            self._message_waiters += 1
+            try:
+                await queue.lock.acquire()
+            finally:
+                self._message_waiters -= 1
+
+            try:
+                await self._run(ctx, callback, name)
+            finally:
+                queue.lock.release()
+        finally:
+            queue.users -= 1
+            if not queue.users:
+                del self._messages[message.id]
+
+    async def _run(
+        self, ctx: PartialContext[t.Any], callback: t.Callable[[], t.Awaitable[None]], name: str | None
+    ) -> None:
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+        else:
+            if self._queue_full() and await self._overflowed(ctx):
+                return
+
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                # The slot is handed over by `_release`, so `_in_flight` is not changed here.
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+
+        # The interaction may have expired while it was waiting for a slot or an earlier interaction.
+        if self._expire(ctx, name):
+            self._release()
+            return
+
+        try:
+            await callback()
+        finally:
+            self._completed += 1
+            self._release()
+
+    def _queue_full(self) -> bool:
+        return len(self._waiters) + self._message_waiters >= self.max_queue
+
+    async def _overflowed(self, ctx: PartialContext[t.Any]) -> bool:
+        """Apply the overflow policy to an interaction. Returns `True` if it was dropped or rejected."""
+        if self.overflow is Overflow.DROP:
+            self._dropped += 1
+            return True
+        if self.overflow is Overflow.REJECT:
+            self._rejected += 1
+            await ctx.respond(self.reject_message, flags=hikari.MessageFlag.EPHEMERAL)
+            return True
+        return False
+
+    def _is_expired(self, ctx: PartialContext[t.Any]) -> bool:
+        if self.deadline is None or ctx._issued_response:
+            return False
+
+        age = time.time() - ctx.interaction.id.created_at.timestamp()
+        if age < self.deadline:
+            return False
+
+        logger.debug("Flare ignored interaction %s because it was created %.2f seconds ago.", ctx.interaction.id, age)
+        return True
+
+    def _count_expired(self, name: str | None) -> None:
+        self._expired[name] = self._expired.get(name, 0) + 1
+
+    def _expire(self, ctx: PartialContext[t.Any], name: str | None) -> bool:
+        """Count the interaction as expired if it is older than the deadline. Returns `True` if it expired."""
+        if not self._is_expired(ctx):
+            return False
+
+        self._count_expired(name)
+        return True
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._in_flight -= 1
+
+
 async def on_inter(event: hikari.InteractionCreateEvent) -> None:
     """
     Function called to respond to an interaction.
     """
-    if not isinstance(event.interaction, (hikari.ComponentInteraction, hikari.ModalInteraction)):
-        return
+    await dispatch(event.interaction)
+
+
+async def dispatch(interaction: hikari.PartialInteraction) -> bool:
+    """
+    Handle an interaction if it is for a flare component or modal. This lets a
+    command handler send interactions to flare from its own listener instead of
+    flare listening for interactions too. Install flare with `listen=False` when
+    using this function.
 
+    .. code-block:: python
+
+        @bot.listen()
+        async def on_interaction(event: hikari.InteractionCreateEvent) -> None:
+            if await flare.dispatch(event.interaction):
+                return
+            ...
+
+    The callback is run before this function returns. On a `hikari.RESTBot`
+    with `listen=False`, the initial response is sent with a REST request instead
+    of being returned in the HTTP response to the interaction.
+
+    Interactions for flare are ignored while the bot is stopping if `drain` was
+    passed to `flare.install`, but `True` is still returned for them.
+
+    Args:
+        interaction:
+            The interaction received by the bot.
+
+    Returns:
+        `True` if the interaction was for flare, otherwise `False`.
+    """
+    if not isinstance(interaction, (hikari.ComponentInteraction, hikari.ModalInteraction)):
+        return False
+
+    return await _handle(interaction)
+
+
+_REST_RESPONSE_TIMEOUT: t.Final[float] = 3
+"""The number of seconds Discord waits for the HTTP response to an interaction."""
+
+
+async def on_rest_inter(
+    interaction: hikari.ComponentInteraction | hikari.ModalInteraction,
+) -> t.AsyncGenerator[hikari.api.InteractionResponseBuilder | None, None]:
+    """
+    Function called by an interaction server to respond to an interaction.
+    The initial response is yielded so it is returned in the HTTP response,
+    then the rest of the callback is run.
+    """
+    response: asyncio.Future[hikari.api.InteractionResponseBuilder] = asyncio.get_running_loop().create_future()
+    delivered = asyncio.Event()
+    bootstrap.rest_responses[interaction.id] = (response, delivered)
+
+    task = asyncio.create_task(_handle(interaction))
     try:
-        component, kwargs = await bootstrap.active_serde.deserialize(event.interaction.custom_id, bootstrap.components)
-    except SerializerError:  # If the custom_id is invalid, it was probably not created by flare.
-        logger.debug(
-            f"Flare received custom_id '{event.interaction.custom_id}' which it cannot deserialize.", exc_info=True
-        )
-        return
+        await asyncio.wait((response, task), timeout=_REST_RESPONSE_TIMEOUT, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # Responses after this point are sent with a REST request.
+        bootstrap.rest_responses.pop(interaction.id, None)
+
+    if bootstrap.detach_rest_callbacks:
+        _detached.add(task)
+        task.add_done_callback(_finish_detached)
 
-    if isinstance(event.interaction, hikari.ComponentInteraction):
+    try:
+        yield response.result() if response.done() else None
+    finally:
+        # The interaction server resumes the generator once it took the response,
+        # but before the HTTP response is written. Later REST requests wait for this
+        # so they are not sent while the server still waits for the response, but
+        # they can still reach Discord before the response does.
+        delivered.set()
+
+    if not bootstrap.detach_rest_callbacks:
+        await task
+
+
+_detached: set[asyncio.Task[bool]] = set()
+"""Interactions from an interaction server that are waited for by `drain_callbacks` instead of the server."""
+
+
+def _finish_detached(task: asyncio.Task[bool]) -> None:
+    _detached.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Flare failed to handle an interaction.", exc_info=task.exception())
+
+
+async def _handle(interaction: hikari.ComponentInteraction | hikari.ModalInteraction) -> bool:
+    custom_id = interaction.custom_id
+
+    if custom_id in bootstrap.rejected:
+        bootstrap.rejected.move_to_end(custom_id)
+        return False
+
+    # Custom_ids created by other libraries are ignored here so an exception isn't raised for them.
+    if not bootstrap.active_serde.accepts(custom_id, bootstrap.components):
+        return False
+
+    # The interaction is still flare's, so a handler that called `flare.dispatch`
+    # doesn't treat it as unknown while the bot is stopping.
+    if bootstrap.draining:
+        return True
+
+    ctx: PartialContext[t.Any]
+    if isinstance(interaction, hikari.ComponentInteraction):
         ctx = MessageContext(
-            interaction=event.interaction,
+            interaction=interaction,
         )
+
+        if debounce.is_duplicate(interaction):
+            # The click is acknowledged so the user doesn't see "This interaction failed".
+            await _auto_defer(ctx)
+            return True
+    else:
+        ctx = ModalContext(interaction=interaction)
+
+    # The component is found from its cookie so it can be limited before paying
+    # to deserialize the custom_id. It's `None` if the cookie isn't known yet.
+    cookie = bootstrap.active_serde.cookie(custom_id)
+    component = bootstrap.components.get(cookie) if cookie is not None else None
+
+    # Stale interactions are ignored before paying to deserialize them.
+    dispatcher = bootstrap.active_dispatcher
+    if dispatcher is not None and dispatcher._is_expired(ctx):
+        dispatcher._count_expired(component.__name__ if component is not None else None)
+        return True
+
+    if bootstrap.active_ratelimit is not None and not bootstrap.active_ratelimit.acquire(interaction):
+        await _rate_limited(ctx, bootstrap.active_ratelimit)
+        return True
+
+    if component is not None and component._ratelimit is not None and not component._ratelimit.acquire(interaction):
+        await _rate_limited(ctx, component._ratelimit)
+        return True
+
+    info: DispatchInfo | None = None
+    pipeline = bootstrap.active_middleware
+    if pipeline is not None:
+        info = DispatchInfo(ctx)
+        if pipeline.before_deserialize is not None and not await pipeline.before_deserialize(info):
+            return True
+
+    # The timer starts before the callback is queued so waiting for a slot counts towards the deadline.
+    timer: asyncio.TimerHandle | None = None
+    if bootstrap.auto_defer_after is not None:
+        timer = asyncio.get_running_loop().call_later(bootstrap.auto_defer_after, _start_auto_defer, ctx)
+
+    try:
+        return await _dispatch(ctx, custom_id, info, component)
+    finally:
+        if timer is not None:
+            timer.cancel()
+
+
+async def _dispatch(
+    ctx: PartialContext[t.Any], custom_id: str, info: DispatchInfo | None, limited: type[t.Any] | None
+) -> bool:
+    start = time.perf_counter()
+    try:
+        component, kwargs = await bootstrap.active_serde.deserialize(custom_id, bootstrap.components)
+    except EntityFetchError:
+        # The custom_id is valid, so it isn't rejected. The user can click again.
+        logger.warning("Flare could not fetch an entity for custom_id %r.", custom_id, exc_info=True)
+        return True
+    except EntityNotFoundError as error:
+        pipeline = bootstrap.active_middleware
+        if info is None or pipeline is None or pipeline.on_error is None:
+            _reject(custom_id)
+            return False
+
+        # Middleware can tell the user the entity no longer exists, so later clicks aren't rejected.
+        await pipeline.on_error(info, error)
+        return True
+    except SerializerError:
+        _reject(custom_id)
+        return False
+
+    policy: debounce.Debounce | None = None
+    if isinstance(ctx, MessageContext):
         assert issubclass(component, CallbackComponent)
-        await component(**kwargs).callback(ctx)
+        instance = component(**kwargs)
+        policy = component._debounce
     else:
-        ctx = ModalContext(interaction=event.interaction)
         assert issubclass(component, Modal)
-        await component(**kwargs, _ctx=ctx).callback(ctx)  # type: ignore
+        instance = component(**kwargs, _ctx=ctx)  # type: ignore
+
+    callback = functools.partial(instance.callback, ctx)
+
+    pipeline = bootstrap.active_middleware
+    if info is not None and pipeline is not None:
+        info.component = instance
+        info.deserialize_time = time.perf_counter() - start
+        if pipeline.after_deserialize is not None and not await pipeline.after_deserialize(info):
+            return True
+
+        if pipeline.around_callback is not None:
+            callback = functools.partial(pipeline.around_callback, info, callback)
+
+    # `limited` is the component whose rate limit was already checked by `_handle`.
+    if (
+        component is not limited
+        and component._ratelimit is not None
+        and not component._ratelimit.acquire(ctx.interaction)
+    ):
+        await _rate_limited(ctx, component._ratelimit)
+        return True
+
+    debounced = debounce.start(ctx.interaction, policy) if policy is not None else None
+
+    timeout = component._timeout if component._timeout is not None else bootstrap.callback_timeout
+    if timeout is not None:
+        callback = functools.partial(_run_with_timeout, callback, timeout, component.__name__)
+
+    # The callback runs in a task flare owns, so `drain_callbacks` never cancels
+    # the task of a handler that passed the interaction to `flare.dispatch`.
+    task = asyncio.create_task(_run_callback(ctx, component, callback, info))
+    _running[task] = (ctx.interaction.id, component.__name__)
+
+    try:
+        await asyncio.wait((task,))
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        _running.pop(task, None)
+        if debounced is not None:
+            debounce.finish(debounced)
+
+    if not task.cancelled():
+        task.result()
+    return True
+
+
+async def _run_callback(
+    ctx: PartialContext[t.Any],
+    component: type[CallbackComponent | Modal],
+    callback: t.Callable[[], t.Awaitable[None]],
+    info: DispatchInfo | None,
+) -> None:
+    pipeline = bootstrap.active_middleware
+    try:
+        if component._defer:
+            await _auto_defer(ctx)
+
+        if bootstrap.active_dispatcher is None:
+            await callback()
+        else:
+            await bootstrap.active_dispatcher.run(ctx, callback, component.__name__)
+    except Exception as error:
+        if info is None or pipeline is None or pipeline.on_error is None:
+            raise
+        await pipeline.on_error(info, error)
+
+
+def _reject(custom_id: str) -> None:
+    logger.debug("Flare received custom_id %r which it cannot deserialize.", custom_id, exc_info=True)
+
+    bootstrap.rejected[custom_id] = None
+    if len(bootstrap.rejected) > bootstrap.REJECTED_SIZE:
+        bootstrap.rejected.popitem(last=False)
+
+
+_running: dict[asyncio.Task[t.Any], tuple[hikari.Snowflake, str]] = {}
+"""The tasks handling interactions, and the interaction and component each task is for."""
+
+
+async def _run_with_timeout(callback: t.Callable[[], t.Awaitable[None]], timeout: float, name: str) -> None:
+    try:
+        await asyncio.wait_for(callback(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("The callback for `%s` was cancelled because it ran for more than %s seconds.", name, timeout)
+
+
+async def drain_callbacks(timeout: float) -> None:
+    """
+    Stop handling new interactions and wait up to `timeout` seconds for running
+    callbacks to finish. Callbacks that are still running are cancelled and logged.
+    """
+    bootstrap.draining = True
+
+    # Detached interactions that are still being deserialized are not in `_running` yet.
+    tasks = {*_running, *_detached}
+    if not tasks:
+        return
+
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    if not pending:
+        return
+
+    abandoned = [_running[task] for task in pending if task in _running]
+    for task in pending:
+        task.cancel()
+
+    logger.warning(
+        "Flare cancelled %s interactions that were running when the bot stopped: %s",
+        len(abandoned),
+        ", ".join(f"{interaction} (`{name}`)" for interaction, name in abandoned),
+    )
+
+
+async def _rate_limited(ctx: PartialContext[t.Any], ratelimit: RateLimit) -> None:
+    logger.debug("Flare rate limited interaction %s from user %s.", ctx.interaction.id, ctx.user.id)
+
+    if ratelimit.message is None:
+        await _auto_defer(ctx)
+    else:
+        await ctx.respond(ratelimit.message, flags=hikari.MessageFlag.EPHEMERAL)
+
+
+_auto_defer_tasks: set[asyncio.Task[None]] = set()
+"""Running auto defers. A reference is kept so the tasks are not garbage collected."""
+
+
+def _start_auto_defer(ctx: PartialContext[t.Any]) -> None:
+    task = asyncio.create_task(_auto_defer(ctx))
+    _auto_defer_tasks.add(task)
+    task.add_done_callback(_auto_defer_tasks.discard)
+
+
+async def _auto_defer(ctx: PartialContext[t.Any]) -> None:
+    try:
+        await ctx._auto_defer()
+    except hikari.HTTPError:
+        logger.warning("Flare could not defer interaction %s.", ctx.interaction.id, exc_info=True)
 
 
 # MIT License
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import typing as t
+
+from flare.internal import bootstrap
+
+__all__: t.Final[t.Sequence[str]] = ("run_coroutine", "wrap_sync_callback")
+
+T = t.TypeVar("T")
+
+_callback_loop: contextvars.ContextVar[asyncio.AbstractEventLoop] = contextvars.ContextVar("_callback_loop")
+"""The event loop that started the synchronous callback running in this thread."""
+
+_callback_cancelled: contextvars.ContextVar[threading.Event] = contextvars.ContextVar("_callback_cancelled")
+"""Set once flare stopped waiting for the synchronous callback running in this thread."""
+
+
+def run_coroutine(coroutine: t.Coroutine[t.Any, t.Any, T]) -> T:
+    """
+    Run a coroutine on the bot's event loop from a synchronous callback and wait
+    for its result. This is used to respond to interactions from callbacks that
+    are not `async`.
+
+    .. code-block:: python
+
+        @flare.button(label="Render")
+        def render(ctx: flare.MessageContext) -> None:
+            image = draw_chart()
+            flare.run_coroutine(ctx.respond(attachment=image))
+
+    A thread can't be stopped, so a synchronous callback keeps running after it
+    timed out or was cancelled by `drain`. This function raises
+    `asyncio.CancelledError` from then on, so the callback can't respond to the
+    interaction any more.
+
+    Raises:
+        RuntimeError: This function was not called from a synchronous callback.
+        asyncio.CancelledError: The callback was cancelled.
+    """
+    loop = _callback_loop.get(None)
+    if loop is None:
+        coroutine.close()
+        raise RuntimeError("`flare.run_coroutine` can only be called from a synchronous callback.")
+
+    if _callback_cancelled.get().is_set():
+        coroutine.close()
+        raise asyncio.CancelledError("The callback was cancelled.")
+
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+
+def wrap_sync_callback(callback: t.Callable[..., t.Any]) -> t.Callable[..., t.Awaitable[None]]:
+    """
+    Wrap a synchronous callback so it is run in the executor passed to
+    `flare.install`, or the event loop's default executor.
+
+    A callback that isn't a coroutine function can still return an awaitable,
+    for example an `async def` callback wrapped by a decorator defined with
+    `def`. The awaitable is awaited on the event loop.
+    """
+
+    @functools.wraps(callback)
+    async def inner(*args: t.Any, **kwargs: t.Any) -> None:
+        loop = asyncio.get_running_loop()
+
+        cancelled = threading.Event()
+        context = contextvars.copy_context()
+        context.run(_callback_loop.set, loop)
+        context.run(_callback_cancelled.set, cancelled)
+
+        try:
+            result = await loop.run_in_executor(
+                bootstrap.callback_executor, functools.partial(context.run, callback, *args, **kwargs)
+            )
+            if inspect.isawaitable(result):
+                await result
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    return inner
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from flare.context import PartialContext
+
+__all__: t.Final[t.Sequence[str]] = ("DispatchInfo", "Middleware", "Pipeline", "compile_middleware")
+
+CallNext = t.Callable[[], t.Awaitable[None]]
+
+
+@dataclasses.dataclass
+class DispatchInfo:
+    """Information about an interaction that is passed to `Middleware` hooks."""
+
+    ctx: PartialContext[t.Any]
+    """The context for the interaction."""
+    received_at: float = dataclasses.field(default_factory=time.perf_counter)
+    """The `time.perf_counter` value when flare started handling the interaction."""
+    component: t.Any | None = None
+    """The component or modal that was deserialized from the custom_id."""
+    deserialize_time: float | None = None
+    """The number of seconds it took to deserialize the custom_id."""
+    callback_time: float | None = None
+    """
+    The number of seconds the callback ran for, including the `around_callback`
+    hooks. This is only measured if a middleware overrides `around_callback`.
+    """
+
+    @property
+    def elapsed(self) -> float:
+        """The number of seconds since flare started handling the interaction."""
+        return time.perf_counter() - self.received_at
+
+
+class Middleware:
+    """
+    Runs code around every interaction flare handles. Subclasses override the hooks
+    they need, and are passed to `flare.install`. Hooks that are not overridden
+    are not called.
+
+    .. code-block:: python
+
+        class Timing(flare.Middleware):
+            async def around_callback(self, info: flare.DispatchInfo, call_next) -> None:
+                await call_next()
+                print(type(info.component).__name__, info.elapsed)
+
+        flare.install(bot, middleware=[Timing()])
+    """
+
+    async def before_deserialize(self, info: DispatchInfo) -> bool | None:
+        """
+        Called before the custom_id is deserialized. Return `False` to ignore the
+        interaction.
+        """
+
+    async def after_deserialize(self, info: DispatchInfo) -> bool | None:
+        """
+        Called after the custom_id is deserialized. `info.component` is set.
+        Return `False` to not run the callback.
+        """
+
+    async def around_callback(self, info: DispatchInfo, call_next: CallNext) -> None:
+        """Called instead of the callback. `call_next` must be awaited to run the callback."""
+        await call_next()
+
+    async def on_error(self, info: DispatchInfo, error: Exception) -> None:
+        """
+        Called if the callback raises an exception, or with `EntityNotFoundError`
+        if an entity stored in the custom_id was deleted. `info.component` is
+        `None` then. Exceptions are not logged by flare if any middleware
+        overrides this hook.
+        """
+
+
+@dataclasses.dataclass(frozen=True)
+class Pipeline:
+    """Every middleware's hooks combined into one function for each hook. Unused hooks are `None`."""
+
+    before_deserialize: t.Callable[[DispatchInfo], t.Awaitable[bool]] | None
+    after_deserialize: t.Callable[[DispatchInfo], t.Awaitable[bool]] | None
+    around_callback: t.Callable[[DispatchInfo, CallNext], t.Awaitable[None]] | None
+    on_error: t.Callable[[DispatchInfo, Exception], t.Awaitable[None]] | None
+
+
+def _overrides(middleware: t.Sequence[Middleware], name: str) -> list[t.Any]:
+    return [getattr(item, name) for item in middleware if getattr(type(item), name) is not getattr(Middleware, name)]
+
+
+def _layer(
+    hook: t.Callable[[DispatchInfo, CallNext], t.Awaitable[None]],
+    inner: t.Callable[[DispatchInfo, CallNext], t.Awaitable[None]],
+) -> t.Callable[[DispatchInfo, CallNext], t.Awaitable[None]]:
+    async def layer(info: DispatchInfo, call_next: CallNext) -> None:
+        await hook(info, functools.partial(inner, info, call_next))
+
+    return layer
+
+
+def compile_middleware(middleware: t.Sequence[Middleware]) -> Pipeline | None:
+    """
+    Combine the hooks of every middleware once, so handling an interaction only
+    calls one function for each hook. `None` is returned if there isn't any middleware.
+    """
+    if not middleware:
+        return None
+
+    def chain_filters(hooks: list[t.Callable[[DispatchInfo], t.Awaitable[bool | None]]]):
+        if not hooks:
+            return None
+
+        async def run(info: DispatchInfo) -> bool:
+            for hook in hooks:
+                if await hook(info) is False:
+                    return False
+            return True
+
+        return run
+
+    def chain_around(hooks: list[t.Callable[[DispatchInfo, CallNext], t.Awaitable[None]]]):
+        if not hooks:
+            return None
+
+        # The first middleware is the outermost. The innermost hook is passed the callback.
+        chain = hooks[-1]
+        for hook in reversed(hooks[:-1]):
+            chain = _layer(hook, chain)
+
+        async def run(info: DispatchInfo, call_next: CallNext) -> None:
+            start = time.perf_counter()
+            try:
+                await chain(info, call_next)
+            finally:
+                info.callback_time = time.perf_counter() - start
+
+        return run
+
+    error_hooks = _overrides(middleware, "on_error")
+
+    async def on_error(info: DispatchInfo, error: Exception) -> None:
+        for hook in error_hooks:
+            await hook(info, error)
+
+    return Pipeline(
+        before_deserialize=chain_filters(_overrides(middleware, "before_deserialize")),
+        after_deserialize=chain_filters(_overrides(middleware, "after_deserialize")),
+        around_callback=chain_around(_overrides(middleware, "around_callback")),
+        on_error=on_error if error_hooks else None,
+    )
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import multiprocessing.process
+import multiprocessing.queues
+import typing as t
+
+import hikari
+
+from flare.exceptions import RegistryMismatchError
+from flare.internal import bootstrap
+from flare.internal.middleware import compile_middleware
+from flare.internal.serde import CacheSerde, SerdeABC, StoreSerde
+
+if t.TYPE_CHECKING:
+    from flare.store import StateStore
+
+__all__: t.Final[t.Sequence[str]] = ("ProcessDispatcher",)
+
+logger = logging.getLogger(__name__)
+
+_COMPONENT_INTERACTION: t.Final[int] = 3
+_MODAL_INTERACTION: t.Final[int] = 5
+
+
+class ProcessDispatcher:
+    """
+    Runs component and modal callbacks in worker processes so CPU heavy callbacks
+    don't block the bot's event loop. Every interaction for the same message is
+    sent to the same worker, so they are started in the order they were received.
+    Workers respond to interactions with REST requests.
+
+    Each worker imports `modules` to register the bot's components. The workers
+    are started when the bot starts, and `flare.exceptions.RegistryMismatchError`
+    is raised if a worker did not register the same components as the bot.
+
+    .. code-block:: python
+
+        flare.install(bot, processes=flare.ProcessDispatcher(TOKEN, ["bot.components"], processes=4))
+
+    Only gateway bots are supported. The serializer, dispatcher, `auto_defer`,
+    cookie manifest, rate limit and middleware passed to `flare.install` are
+    sent to every worker, so they must be picklable. Every worker gets its own
+    copy, so a `flare.StateStore` must be shared between processes, such as a
+    `flare.SQLiteStore` with a database file. `flare.MemoryStore` can't be used.
+
+    Workers don't have a cache, so converters that use `flare.Converter.app`
+    fetch entities with REST. Limits are kept by each worker, so a dispatcher's
+    `max_concurrency` and `max_queue` and every rate limit apply per worker.
+
+    Workers are started with the `spawn` start method, which imports the bot's
+    main module in every worker. `bot.run()` must be under an
+    `if __name__ == "__main__":` guard, otherwise every worker runs the bot too.
+
+    Args:
+        token:
+            The bot's token, used by workers to respond to interactions.
+        modules:
+            The modules that create the bot's components.
+        processes:
+            The number of worker processes. Defaults to the number of CPUs.
+        token_type:
+            The type of `token`.
+        start_timeout:
+            The number of seconds to wait for a worker to import `modules`.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        modules: t.Sequence[str],
+        processes: int | None = None,
+        token_type: str | hikari.TokenType = hikari.TokenType.BOT,
+        start_timeout: float = 60,
+    ) -> None:
+        self.token = token
+        self.modules = tuple(modules)
+        self.processes = processes or multiprocessing.cpu_count()
+        self.token_type = token_type
+        self.start_timeout = start_timeout
+
+        self._workers: list[multiprocessing.process.BaseProcess] = []
+        self._queues: list[multiprocessing.queues.Queue[t.Any]] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker processes are running."""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """
+        Start the worker processes and wait until they registered their components.
+
+        Raises:
+            RegistryMismatchError: A worker did not register the same components as this process.
+            ValueError: The installed state store is not shared between processes.
+        """
+        store = _store(bootstrap.active_serde)
+        if store is not None and not store.shared:
+            raise ValueError(
+                f"`{store.__class__.__name__}` can't be used with worker processes because each worker would have"
+                " its own copy. Use a store that is shared between processes, such as `flare.SQLiteStore`."
+            )
+
+        context = multiprocessing.get_context("spawn")
+        ready: multiprocessing.queues.Queue[str] = context.Queue()
+        config = (
+            bootstrap.active_serde,
+            bootstrap.active_dispatcher,
+            bootstrap.auto_defer_after,
+            bootstrap.cookie_manifest,
+            bootstrap.active_ratelimit,
+            bootstrap.callback_timeout,
+            bootstrap.installed_middleware,
+        )
+
+        for _ in range(self.processes):
+            queue: multiprocessing.queues.Queue[t.Any] = context.Queue()
+            worker = context.Process(
+                target=_run_worker,
+                args=(self.token, self.token_type, self.modules, config, queue, ready),
+                daemon=True,
+            )
+            worker.start()
+            self._queues.append(queue)
+            self._workers.append(worker)
+
+        fingerprint = bootstrap.registry_fingerprint()
+        try:
+            fingerprints = [ready.get(timeout=self.start_timeout) for _ in self._workers]
+        except Exception:
+            self.stop()
+            raise
+
+        if any(worker_fingerprint != fingerprint for worker_fingerprint in fingerprints):
+            self.stop()
+            raise RegistryMismatchError(
+                "A worker process registered different components than the main process."
+                " Make sure `modules` creates every component and the components are created before the bot starts."
+            )
+
+    def stop(self, timeout: float | None = 10) -> None:
+        """Stop the worker processes after they finish the interactions they received."""
+        for queue in self._queues:
+            queue.put(None)
+
+        for worker in self._workers:
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+
+        self._workers.clear()
+        self._queues.clear()
+
+    def submit(self, payload: t.Mapping[str, t.Any]) -> None:
+        """
+        Send a raw interaction payload to a worker. Interactions for the same
+        message are always sent to the same worker.
+        """
+        message = payload.get("message")
+        key = int(message["id"] if message else payload["id"])
+        self._queues[key % len(self._queues)].put(payload)
+
+
+def _store(serde: SerdeABC) -> StateStore | None:
+    """Return the state store used by a serializer, or `None` if it doesn't use one."""
+    while isinstance(serde, (CacheSerde, StoreSerde)):
+        if isinstance(serde, StoreSerde):
+            return serde.store
+        serde = serde.serde
+    return None
+
+
+class _WorkerApp:
+    """
+    The `flare.Converter.app` of a worker process. Workers only have a REST
+    client, so this implements `hikari.RESTAware` with it.
+    """
+
+    __slots__ = ("_rest",)
+
+    def __init__(self, rest: hikari.api.RESTClient) -> None:
+        self._rest = rest
+
+    @property
+    def rest(self) -> hikari.api.RESTClient:
+        return self._rest
+
+    @property
+    def entity_factory(self) -> hikari.api.EntityFactory:
+        return self._rest.entity_factory
+
+    @property
+    def http_settings(self) -> hikari.api.HTTPSettings:
+        return self._rest.http_settings
+
+    @property
+    def proxy_settings(self) -> hikari.api.ProxySettings:
+        return self._rest.proxy_settings
+
+    @property
+    def executor(self) -> None:
+        return None
+
+
+async def on_payload(event: hikari.ShardPayloadEvent) -> None:
+    """
+    Function called when the bot receives a raw event if flare is installed with a
+    `ProcessDispatcher`. Interactions with flare components are sent to a worker.
+    """
+    if event.name != "INTERACTION_CREATE" or bootstrap.active_processes is None:
+        return
+
+    payload = event.payload
+    if payload.get("type") not in (_COMPONENT_INTERACTION, _MODAL_INTERACTION):
+        return
+
+    custom_id: str = payload["data"]["custom_id"]
+    if custom_id in bootstrap.rejected or not bootstrap.active_serde.accepts(custom_id, bootstrap.components):
+        return
+
+    bootstrap.active_processes.submit(payload)
+
+
+def _run_worker(
+    token: str,
+    token_type: str | hikari.TokenType,
+    modules: t.Sequence[str],
+    config: tuple[t.Any, ...],
+    queue: multiprocessing.queues.Queue[t.Any],
+    ready: multiprocessing.queues.Queue[str],
+) -> None:
+    # The configuration is set before components are created so cookies are assigned the same way.
+    (
+        bootstrap.active_serde,
+        bootstrap.active_dispatcher,
+        bootstrap.auto_defer_after,
+        bootstrap.cookie_manifest,
+        bootstrap.active_ratelimit,
+        bootstrap.callback_timeout,
+        bootstrap.installed_middleware,
+    ) = config
+    bootstrap.active_middleware = compile_middleware(bootstrap.installed_middleware)
+
+    for module in modules:
+        importlib.import_module(module)
+
+    ready.put(bootstrap.registry_fingerprint())
+
+    asyncio.run(_worker_loop(token, token_type, queue))
+
+
+async def _worker_loop(
+    token: str, token_type: str | hikari.TokenType, queue: multiprocessing.queues.Queue[t.Any]
+) -> None:
+    from flare.converters import Converter
+    from flare.internal.event_handler import _handle
+
+    loop = asyncio.get_running_loop()
+    tasks: set[asyncio.Task[bool]] = set()
+
+    rest_app = hikari.RESTApp()
+    await rest_app.start()
+
+    try:
+        async with rest_app.acquire(token, token_type) as rest:
+            Converter.app = _WorkerApp(rest)  # type: ignore
+            while True:
+                payload = await loop.run_in_executor(None, queue.get)
+                if payload is None:
+                    break
+
+                interaction = rest.entity_factory.deserialize_interaction(payload)
+                assert isinstance(interaction, (hikari.ComponentInteraction, hikari.ModalInteraction))
+
+                task = asyncio.create_task(_handle(interaction))
+                tasks.add(task)
+                task.add_done_callback(_log_exception)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.wait(tasks)
+    finally:
+        await rest_app.close()
+
+
+def _log_exception(task: asyncio.Task[t.Any]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Exception in component callback.", exc_info=task.exception())
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import enum
+import time
+import typing as t
+
+import hikari
+
+__all__: t.Final[t.Sequence[str]] = ("Bucket", "RateLimit")
+
+
+class Bucket(enum.Enum):
+    """What a `RateLimit` counts interactions by."""
+
+    USER = enum.auto()
+    """Each user has their own limit."""
+    GUILD = enum.auto()
+    """Each guild has its own limit. Interactions in DMs are limited by user."""
+    CHANNEL = enum.auto()
+    """Each channel has its own limit."""
+    GLOBAL = enum.auto()
+    """Every interaction shares the same limit."""
+
+
+class RateLimit:
+    """
+    Limits how often interactions are handled with a token bucket. Each bucket
+    holds up to `limit` tokens and is refilled at `limit` tokens every `period`
+    seconds. An interaction uses a token, and is not handled if its bucket is empty.
+
+    .. code-block:: python
+
+        # Each user can click the button 3 times every 10 seconds.
+        @flare.button(label="Roll", ratelimit=flare.RateLimit(3, 10))
+        async def roll(ctx: flare.MessageContext) -> None:
+            ...
+
+    A rate limit passed to a component only counts interactions with that
+    component, so `Bucket.GLOBAL` limits every user of the component together.
+
+    Buckets are removed once they refilled, so only users that recently used a
+    component are stored.
+
+    Args:
+        limit:
+            The number of interactions allowed every `period` seconds.
+        period:
+            The number of seconds it takes for an empty bucket to refill.
+        bucket:
+            What interactions are counted by.
+        message:
+            If provided, this message is sent to users who are rate limited.
+            Otherwise, their interaction is acknowledged without a response.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        period: float,
+        bucket: Bucket = Bucket.USER,
+        message: str | None = None,
+    ) -> None:
+        if limit < 1:
+            raise ValueError("`limit` must be at least 1.")
+
+        self.limit = limit
+        self.period = period
+        self.bucket = bucket
+        self.message = message
+
+        # The number of tokens in each bucket and when it was last updated.
+        self._buckets: dict[hikari.Snowflake | None, tuple[float, float]] = {}
+        self._sweep_at = 64
+        self._limited = 0
+
+    @property
+    def limited(self) -> int:
+        """The number of interactions that were rate limited."""
+        return self._limited
+
+    @property
+    def size(self) -> int:
+        """The number of buckets that are stored."""
+        return len(self._buckets)
+
+    def acquire(self, interaction: hikari.PartialInteraction) -> bool:
+        """
+        Use a token for an interaction.
+
+        Returns:
+            `False` if the interaction is rate limited.
+        """
+        now = time.monotonic()
+        if len(self._buckets) >= self._sweep_at:
+            self._sweep(now)
+
+        key = self._key(interaction)
+        bucket = self._buckets.get(key)
+        tokens = self.limit if bucket is None else self._refill(bucket, now)
+
+        if tokens < 1:
+            self._limited += 1
+            return False
+
+        self._buckets[key] = (tokens - 1, now)
+        return True
+
+    def _key(self, interaction: hikari.PartialInteraction) -> hikari.Snowflake | None:
+        if self.bucket is Bucket.USER:
+            return interaction.user.id
+        if self.bucket is Bucket.GUILD:
+            return interaction.guild_id or interaction.user.id
+        if self.bucket is Bucket.CHANNEL:
+            return interaction.channel_id
+        return None
+
+    def _refill(self, bucket: tuple[float, float], now: float) -> float:
+        tokens, updated = bucket
+        return min(self.limit, tokens + (now - updated) * self.limit / self.period)
+
+    def _sweep(self, now: float) -> None:
+        # A full bucket is the same as a bucket that isn't stored.
+        for key in [key for key, bucket in self._buckets.items() if self._refill(bucket, now) >= self.limit]:
+            del self._buckets[key]
+        self._sweep_at = max(64, len(self._buckets) * 2)
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
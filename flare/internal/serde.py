@@ -1,23 +1,33 @@
 from __future__ import annotations
 
 import abc
+import collections
+import hashlib
+import json
+import re
+import sys
 import typing as t
 
-from flare.converters import get_converter
-from flare.exceptions import SerializerError, SerializerVersionViolation
-from flare.utils import gather_iter
+from flare import converters
+from flare.exceptions import (
+    CustomIDTooLongError,
+    SerializerError,
+    SerializerVersionViolation,
+)
+from flare.internal.codec import CodecPlan
 
 if t.TYPE_CHECKING:
     from flare.components import base
+    from flare.store import StateStore, StoreStats
 
-__all__: t.Final[t.Sequence[str]] = ("Serde",)
+__all__: t.Final[t.Sequence[str]] = ("Serde", "StoreSerde", "CacheSerde")
 
 
 class SerdeABC(abc.ABC):
     """Abstract class for implementing a custom serializer and deserializer."""
 
     @abc.abstractmethod
-    async def serialize(self, cookie: str, types: dict[str, t.Any], kwargs: dict[str, t.Any]) -> str:
+    async def serialize(self, cookie: str, types: t.Mapping[str, t.Any], kwargs: dict[str, t.Any]) -> str:
         """
         Encode a custom_id for a component.
 
@@ -25,8 +35,9 @@ class SerdeABC(abc.ABC):
             cookie:
                 A unique identifier for the component.
             types:
-                A dictionary of argument names to argument type hints. The type hint
-                is used to encode a value to a string.
+                A mapping of argument names to argument type hints. The type hint
+                is used to encode a value to a string. Components pass their
+                precompiled `flare.internal.codec.CodecPlan`.
             kwargs:
                 Values that the user passes to save state.
         """
@@ -45,6 +56,36 @@ class SerdeABC(abc.ABC):
                 A dictionary of cookies to components.
         """
 
+    def accepts(self, custom_id: str, map: t.Mapping[str, t.Any]) -> bool:
+        """
+        Cheaply check if a custom_id could have been created by this serializer
+        for a component in `map`. This is run before `deserialize` so custom_ids
+        created by other libraries are ignored without raising an exception.
+
+        Returning `True` does not mean `deserialize` will succeed. The default
+        implementation always returns `True`.
+
+        Args:
+            custom_id:
+                The custom_id of the component.
+            map:
+                A dictionary of cookies to components.
+        """
+        return True
+
+    def cookie(self, custom_id: str) -> str | None:
+        """
+        Return the cookie of the component a custom_id was created for without
+        deserializing it, or `None` if it can't be found cheaply. This is used
+        to attribute interactions that are ignored before they are deserialized.
+        The default implementation always returns `None`.
+
+        Args:
+            custom_id:
+                The custom_id of the component.
+        """
+        return None
+
 
 class Serde(SerdeABC):
     """
@@ -84,6 +125,11 @@ class Serde(SerdeABC):
         self._increment_length = increment_length
         self._increment = 0
 
+        ver = self.VER
+        self._version_prefix: str = (
+            "" if ver is None else ver.to_bytes(ver.bit_length() // 8 + 1, "little").decode("latin1")
+        )
+
         if len(sep) != 1:
             raise ValueError("Separator must be a single character.")
 
@@ -93,6 +139,10 @@ class Serde(SerdeABC):
         if len(esc) != 1:
             raise ValueError("Escape must be a single character.")
 
+        self._escape_table = str.maketrans({char: f"{self.ESC}{char}" for char in (self.ESC, self.NULL, self.SEP)})
+        # Matches an escaped character (or an escape character at the end of the string) or a separator.
+        self._token_pattern = re.compile(f"{re.escape(self.ESC)}(.?)|{re.escape(self.SEP)}", re.DOTALL)
+
     @property
     def SEP(self) -> str:
         """The separator used to separate arguments."""
@@ -125,130 +175,342 @@ class Serde(SerdeABC):
 
     def escape(self, string: str) -> str:
         """Escape a string using `self.ESC`, `self.NULL` and `self.SEP`."""
-        out: list[str] = []
-        for char in string:
-            if char in [self.ESC, self.NULL, self.SEP]:
-                out.append(f"{self.ESC}{char}")
-            else:
-                out.append(char)
-        return "".join(out)
+        return string.translate(self._escape_table)
 
-    def unescape(self, string: str) -> list[tuple[str, bool]]:
-        """Returns a list of tuples signifying (the character, whether it was escaped)"""
-        out: list[tuple[str, bool]] = []
-        last_was_esc = False
+    def split(self, string: str) -> list[str | None]:
+        """Split the provided string on the separator, ignoring separators that are escaped, and unescape each field.
 
-        for char in string:
-            if not last_was_esc and char != self.ESC:
-                out.append((char, False))
-                continue
+        Args:
+            string:
+                The provided string.
+
+        Returns:
+            list[str | None]
+                The split string. Fields that are an unescaped `self.NULL` are `None`.
+        """
+        if self.ESC not in string:
+            return [None if field == self.NULL else field for field in string.split(self.SEP)]
 
-            if last_was_esc:
-                out.append((char, True))
-                last_was_esc = False
+        out: list[str | None] = []
+        pieces: list[str] = []
+        field_start = 0
+        pos = 0
+
+        for match in self._token_pattern.finditer(string):
+            pieces.append(string[pos : match.start()])
+            pos = match.end()
+
+            escaped = match.group(1)
+            if escaped is not None:
+                pieces.append(escaped)
                 continue
 
-            last_was_esc = True
+            out.append(self._join_field(string, field_start, pieces))
+            pieces.clear()
+            field_start = pos
 
-        return out
+        pieces.append(string[pos:])
+        out.append(self._join_field(string, field_start, pieces))
 
-    async def serialize(self, cookie: str, types: dict[str, t.Any], kwargs: dict[str, t.Any]) -> str:
-        version = "" if self.VER is None else await get_converter(int).to_str(self.VER)
+        return out
 
-        async def serialize_one(k: str, v: t.Any) -> str:
-            val = kwargs.get(k)
-            converter = get_converter(v)
-            return self.escape(await converter.to_str(val)) if val is not None else self.NULL
+    def _join_field(self, string: str, field_start: int, pieces: list[str]) -> str | None:
+        field = "".join(pieces)
+        # A field is only `None` if the null character was not escaped.
+        if field == self.NULL and string[field_start] == self.NULL:
+            return None
+        return field
+
+    def _raw_cookie(self, custom_id: str) -> str | None:
+        """Return the cookie of a custom_id without unescaping it, or `None` if it has no cookie."""
+        if not custom_id.startswith(self._version_prefix):
+            return None
+
+        start = len(self._version_prefix) + self._increment_length
+        if len(custom_id) <= start:
+            return None
+
+        end = custom_id.find(self.SEP, start)
+        return custom_id[start:] if end == -1 else custom_id[start:end]
+
+    def accepts(self, custom_id: str, map: t.Mapping[str, t.Any]) -> bool:
+        cookie = self._raw_cookie(custom_id)
+        if cookie is None:
+            return False
+
+        if self.ESC in cookie:
+            # Escaped cookies are left to `deserialize`.
+            return True
+
+        return cookie in map
+
+    def cookie(self, custom_id: str) -> str | None:
+        cookie = self._raw_cookie(custom_id)
+        if cookie is None or self.ESC not in cookie:
+            return cookie
+
+        # The cookie is escaped, so it ends at the first separator that isn't escaped.
+        pieces: list[str] = []
+        pos = len(self._version_prefix) + self._increment_length
+        for match in self._token_pattern.finditer(custom_id, pos):
+            pieces.append(custom_id[pos : match.start()])
+            pos = match.end()
+
+            escaped = match.group(1)
+            if escaped is None:
+                return "".join(pieces)
+            pieces.append(escaped)
+
+        pieces.append(custom_id[pos:])
+        return "".join(pieces)
+
+    async def serialize(self, cookie: str, types: t.Mapping[str, t.Any], kwargs: dict[str, t.Any]) -> str:
+        plan = types if isinstance(types, CodecPlan) else CodecPlan(types)
+
+        out = [f"{self._version_prefix}{self.get_inc()}{self.escape(cookie)}"]
+        for field in plan.fields:
+            val = kwargs.get(field.name)
+            if val is None:
+                out.append(self.NULL)
+            elif field.to_str_sync is not None:
+                out.append(self.escape(field.to_str_sync(val)))
+            else:
+                out.append(self.escape(await field.to_str(val)))
 
-        out = self.SEP.join(
-            (
-                f"{version}{self.get_inc()}{self.escape(cookie)}",
-                *await gather_iter(serialize_one(k, v) for k, v in types.items()),
-            )
-        )
+        custom_id = self.SEP.join(out)
 
-        if len(out) > 100:
-            raise SerializerError(
+        if len(custom_id) > 100:
+            raise CustomIDTooLongError(
                 f"The serialized custom_id for component {cookie} may be too long."
                 " Try reducing the number of parameters the component takes."
-                f" Got length: {len(out)} Expected length: 100 or less"
+                f" Got length: {len(custom_id)} Expected length: 100 or less"
             )
-        return out
+        return custom_id
 
-    def split_on_sep(self, string: list[tuple[str, bool]]) -> list[list[tuple[str, bool]]]:
-        """Split the provided string on the separator, but ignore separators that are escaped.
+    async def deserialize(
+        self, custom_id: str, map: dict[str, t.Any]
+    ) -> tuple[type[base.SupportsCallback[t.Any]], dict[str, t.Any]]:
+        if self.VER is not None:  # Allow for no version to disable verification
+            version = ord(custom_id[0]) if custom_id else None
 
-        Args:
-            string:
-                The provided string.
+            if version != self.VER:
+                raise SerializerVersionViolation(
+                    f"Serializer {self.__class__.__name__} cannot deserialize version {version}."
+                )
 
-        Returns:
-            list[str]
-                The split string.
-        """
-        out: list[list[tuple[str, bool]]] = [[]]
+            custom_id = custom_id[1:]
+
+        custom_id = custom_id[self._increment_length :]
+
+        cookie, *args = self.split(custom_id)
 
-        for char, is_escaped in string:
-            if char == self.SEP and not is_escaped:
-                out.append([])
+        component_ = map.get(cookie) if cookie is not None else None
+
+        if component_ is None:
+            raise SerializerError(f"Component with cookie {cookie} does not exist.")
+
+        plan: CodecPlan = component_._codec_plan
+
+        kwargs: dict[str, t.Any] = {}
+
+        for field, arg in zip(plan.fields, args):
+            if arg is None:
+                kwargs[field.name] = None
+            elif field.from_str_sync is not None:
+                kwargs[field.name] = field.from_str_sync(arg)
             else:
-                out[-1].append((char, is_escaped))
+                kwargs[field.name] = await field.from_str(arg)
 
-        return out
+        return (component_, kwargs)
+
+
+class _StoredState:
+    """A placeholder component for custom_ids that refer to state saved in a `flare.store.StateStore`."""
+
+    cookie: t.Final[str] = "\x00"
+    _codec_plan: t.ClassVar[CodecPlan] = CodecPlan({"cookie": str, "key": str})
+
+
+class StoreSerde(SerdeABC):
+    """
+    A serializer that wraps another serializer. If a custom_id would be too long,
+    the component's state is saved in a `flare.store.StateStore` and the custom_id
+    only contains the component's cookie and the key for the state.
+
+    This serializer is used when a store is passed to `flare.install`.
+
+    Args:
+        serde:
+            The serializer used to create custom_ids.
+        store:
+            The store for state that does not fit in a custom_id.
+    """
 
-    @staticmethod
-    def tuple_list_to_string(string: list[tuple[str, bool]]) -> str:
-        """Combine a list of tuples into a string, ignoring the second value."""
-        out: list[str] = []
-        for char, _ in string:
-            out.append(char)
-        return "".join(out)
+    def __init__(self, serde: SerdeABC, store: StateStore) -> None:
+        self.serde = serde
+        self.store = store
+
+    async def serialize(self, cookie: str, types: t.Mapping[str, t.Any], kwargs: dict[str, t.Any]) -> str:
+        try:
+            return await self.serde.serialize(cookie, types, kwargs)
+        except CustomIDTooLongError:
+            pass
+
+        plan = types if isinstance(types, CodecPlan) else CodecPlan(types)
+
+        values: list[str | None] = []
+        for field in plan.fields:
+            val = kwargs.get(field.name)
+            if val is None:
+                values.append(None)
+            elif field.to_str_sync is not None:
+                values.append(field.to_str_sync(val))
+            else:
+                values.append(await field.to_str(val))
+
+        payload = json.dumps(values, separators=(",", ":"))
+        # The key is a hash of the state so identical state is only stored once.
+        key = hashlib.blake2s(payload.encode("utf-8"), digest_size=8).digest().decode("latin1")
 
-    async def cast_kwargs(self, kwargs: dict[str, t.Any], types: dict[str, t.Any]) -> dict[str, t.Any]:
-        ret: dict[str, t.Any] = {}
+        await self.store.set(key, payload)
 
-        async def convert_one(k: str, v: t.Any) -> None:
-            if v is None:
-                ret[k] = None
-                return
-            cast_to = types[k]
-            ret[k] = await get_converter(cast_to).from_str(v)
+        return await self.serde.serialize(_StoredState.cookie, _StoredState._codec_plan, {"cookie": cookie, "key": key})
 
-        await gather_iter(convert_one(k, v) for k, v in kwargs.items())
+    def accepts(self, custom_id: str, map: t.Mapping[str, t.Any]) -> bool:
+        return self.serde.accepts(custom_id, collections.ChainMap({_StoredState.cookie: _StoredState}, map))  # type: ignore
 
-        return ret
+    def cookie(self, custom_id: str) -> str | None:
+        cookie = self.serde.cookie(custom_id)
+        # The component of stored state is only known once the state was loaded.
+        return None if cookie == _StoredState.cookie else cookie
 
     async def deserialize(
         self, custom_id: str, map: dict[str, t.Any]
     ) -> tuple[type[base.SupportsCallback[t.Any]], dict[str, t.Any]]:
-        if self.VER is not None:  # Allow for no version to disable verification
-            version = await get_converter(int).from_str(custom_id[0])
-
-            if version != self.VER:
-                raise SerializerVersionViolation(
-                    f"Serializer {self.__class__.__name__} cannot deserialize version {version}."
-                )
+        component_: t.Any
+        kwargs: dict[str, t.Any]
+        component_, kwargs = await self.serde.deserialize(
+            custom_id, collections.ChainMap({_StoredState.cookie: _StoredState}, map)  # type: ignore
+        )
 
-            custom_id = custom_id[1:]
+        if component_ is not _StoredState:
+            return component_, kwargs
 
-        custom_id = custom_id[self._increment_length :]
+        cookie: str = kwargs["cookie"]
+        payload = await self.store.get(kwargs["key"])
 
-        cookie, *args = self.split_on_sep(self.unescape(custom_id))
+        if payload is None:
+            raise SerializerError(f"The state for component {cookie} does not exist or expired.")
 
-        component_ = map.get(self.tuple_list_to_string(cookie))
+        component_ = map.get(cookie)
 
         if component_ is None:
             raise SerializerError(f"Component with cookie {cookie} does not exist.")
 
-        types = component_._dataclass_annotations
+        plan: CodecPlan = component_._codec_plan
+
+        state: dict[str, t.Any] = {}
+        values: list[str | None] = json.loads(payload)
+
+        for field, arg in zip(plan.fields, values):
+            if arg is None:
+                state[field.name] = None
+            elif field.from_str_sync is not None:
+                state[field.name] = field.from_str_sync(arg)
+            else:
+                state[field.name] = await field.from_str(arg)
+
+        return (component_, state)
+
+
+class CacheSerde(SerdeABC):
+    """
+    A serializer that wraps another serializer and keeps the most recently
+    deserialized custom_ids. Repeated clicks on the same component skip parsing
+    and converting entirely.
+
+    Components are only cached if every field's converter is `cacheable`. Each
+    deserialize returns a new kwargs dictionary so callers can't change the
+    cached values.
+
+    This serializer is used when `cache_size` is passed to `flare.install`.
+
+    Args:
+        serde:
+            The serializer used to create and decode custom_ids.
+        max_size:
+            The maximum number of custom_ids to keep.
+    """
+
+    def __init__(self, serde: SerdeABC, max_size: int = 10_000) -> None:
+        self.serde = serde
+        self.max_size = max_size
+
+        self._cache: collections.OrderedDict[
+            str, tuple[type[base.SupportsCallback[t.Any]], tuple[tuple[str, t.Any], ...]]
+        ] = collections.OrderedDict()
+        self._converters_version = converters._converters_version
+        self._memory = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> StoreStats:
+        """The statistics for this cache."""
+        from flare.store import StoreStats
+
+        return StoreStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=0,
+            size=len(self._cache),
+            memory=self._memory,
+        )
+
+    def clear(self) -> None:
+        """Remove every custom_id from the cache."""
+        self._cache.clear()
+        self._memory = 0
+
+    async def serialize(self, cookie: str, types: t.Mapping[str, t.Any], kwargs: dict[str, t.Any]) -> str:
+        return await self.serde.serialize(cookie, types, kwargs)
+
+    def accepts(self, custom_id: str, map: t.Mapping[str, t.Any]) -> bool:
+        return custom_id in self._cache or self.serde.accepts(custom_id, map)
+
+    def cookie(self, custom_id: str) -> str | None:
+        return self.serde.cookie(custom_id)
+
+    async def deserialize(
+        self, custom_id: str, map: dict[str, t.Any]
+    ) -> tuple[type[base.SupportsCallback[t.Any]], dict[str, t.Any]]:
+        if self._converters_version != converters._converters_version:
+            # Cached values may have been decoded by a converter that was replaced.
+            self.clear()
+            self._converters_version = converters._converters_version
+
+        cached = self._cache.get(custom_id)
+
+        if cached is not None:
+            self._cache.move_to_end(custom_id)
+            self._hits += 1
+            return cached[0], dict(cached[1])
+
+        self._misses += 1
+
+        component_, kwargs = await self.serde.deserialize(custom_id, map)
 
-        transformed_args: dict[str, t.Any] = {}
+        plan: CodecPlan | None = getattr(component_, "_codec_plan", None)
+        if plan is not None and plan.cacheable:
+            self._cache[custom_id] = (component_, tuple(kwargs.items()))
+            self._memory += sys.getsizeof(custom_id)
 
-        for k, arg in zip(types.keys(), args):
-            if len(arg) == 1:
-                if arg[0] == (self.NULL, False):
-                    transformed_args[k] = None
-                    continue
-            transformed_args[k] = self.tuple_list_to_string(arg)
+            if len(self._cache) > self.max_size:
+                key, _ = self._cache.popitem(last=False)
+                self._memory -= sys.getsizeof(key)
+                self._evictions += 1
 
-        return (component_, await self.cast_kwargs(transformed_args, types))
+        return component_, kwargs
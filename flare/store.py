@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import collections
+import dataclasses
+import os
+import sqlite3
+import sys
+import threading
+import time
+import typing as t
+
+__all__: t.Final[t.Sequence[str]] = ("StateStore", "StoreStats", "MemoryStore", "SQLiteStore")
+
+
+@dataclasses.dataclass(frozen=True)
+class StoreStats:
+    """A snapshot of the statistics of a `StateStore`."""
+
+    hits: int
+    """The number of lookups that found a value."""
+    misses: int
+    """The number of lookups that did not find a value."""
+    evictions: int
+    """The number of values removed to make space for new values."""
+    expirations: int
+    """The number of values removed because their TTL passed."""
+    size: int
+    """The number of values in the store."""
+    memory: int
+    """The approximate number of bytes used by the store."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found a value."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class StateStore(abc.ABC):
+    """
+    Stores the state of components whose custom_id would be longer than 100
+    characters. The state is saved in the store and the custom_id only contains
+    the component's cookie and a key.
+
+    .. code-block:: python
+
+        flare.install(bot, store=flare.MemoryStore(max_size=100_000, ttl=60 * 60 * 24))
+    """
+
+    @property
+    def shared(self) -> bool:
+        """
+        Whether copies of this store in other processes see the same values.
+        Only shared stores can be used with `flare.ProcessDispatcher`.
+        """
+        return True
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Return the value for `key`, or `None` if it does not exist or expired."""
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        """Set the value for `key`."""
+
+    @abc.abstractmethod
+    async def stats(self) -> StoreStats:
+        """Return the statistics for this store."""
+
+
+class MemoryStore(StateStore):
+    """
+    A state store that keeps values in memory. When the store is full, the least
+    recently used value is evicted. State is lost when the bot restarts.
+
+    Args:
+        max_size:
+            The maximum number of values to store.
+        ttl:
+            The number of seconds a value is kept after it is set. If `None`,
+            values are only removed when the store is full.
+    """
+
+    def __init__(self, max_size: int = 100_000, ttl: float | None = None) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+
+        # Values are ordered from least to most recently used.
+        self._values: collections.OrderedDict[str, tuple[float, str]] = collections.OrderedDict()
+        self._memory = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def shared(self) -> bool:
+        return False
+
+    def _remove(self, key: str) -> None:
+        _, value = self._values.pop(key)
+        self._memory -= sys.getsizeof(key) + sys.getsizeof(value)
+
+    async def get(self, key: str) -> str | None:
+        item = self._values.get(key)
+
+        if item is None:
+            self._misses += 1
+            return None
+
+        expires, value = item
+        if expires < time.monotonic():
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._values.move_to_end(key)
+        self._hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        if key in self._values:
+            self._remove(key)
+
+        expires = time.monotonic() + self._ttl if self._ttl is not None else float("inf")
+        self._values[key] = (expires, value)
+        self._memory += sys.getsizeof(key) + sys.getsizeof(value)
+
+        now = time.monotonic()
+        while self._values:
+            oldest_key, (oldest_expires, _) = next(iter(self._values.items()))
+
+            if oldest_expires < now:
+                self._expirations += 1
+            elif len(self._values) > self._max_size:
+                self._evictions += 1
+            else:
+                break
+
+            self._remove(oldest_key)
+
+    async def stats(self) -> StoreStats:
+        return StoreStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            size=len(self._values),
+            memory=self._memory,
+        )
+
+
+class SQLiteStore(StateStore):
+    """
+    A state store backed by a SQLite database, so state is kept when the bot
+    restarts. Queries are run in a thread so the event loop is not blocked.
+
+    A store is pickled as its arguments, so every process opens its own
+    connection to the same database file.
+
+    Args:
+        path:
+            The path to the database file.
+        ttl:
+            The number of seconds a value is kept after it is set. If `None`,
+            values are never removed.
+        purge_interval:
+            Expired values are deleted from the database after this many values
+            are set. Must be at least 1.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], ttl: float | None = None, purge_interval: int = 1000) -> None:
+        if purge_interval < 1:
+            raise ValueError("`purge_interval` must be at least 1.")
+
+        self._path = path
+        self._ttl = ttl
+        self._purge_interval = purge_interval
+        self._sets = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS flare_state (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+        )
+
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return (self.__class__, (self._path, self._ttl, self._purge_interval))
+
+    @property
+    def shared(self) -> bool:
+        # In-memory and temporary databases are private to their connection.
+        return os.fspath(self._path) not in (":memory:", "")
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute("SELECT value, expires FROM flare_state WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            value, expires = row
+            if expires is not None and expires < time.time():
+                self._connection.execute("DELETE FROM flare_state WHERE key = ?", (key,))
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO flare_state (key, value, expires) VALUES (?, ?, ?)",
+                (key, value, now + self._ttl if self._ttl is not None else None),
+            )
+
+            self._sets += 1
+            if self._sets % self._purge_interval == 0:
+                cursor = self._connection.execute("DELETE FROM flare_state WHERE expires < ?", (now,))
+                self._expirations += cursor.rowcount
+
+    def _stats(self) -> StoreStats:
+        with self._lock:
+            (size,) = self._connection.execute("SELECT COUNT(*) FROM flare_state").fetchone()
+            (page_count,) = self._connection.execute("PRAGMA page_count").fetchone()
+            (page_size,) = self._connection.execute("PRAGMA page_size").fetchone()
+
+            return StoreStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=0,
+                expirations=self._expirations,
+                size=size,
+                memory=page_count * page_size,
+            )
+
+    async def get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+    async def stats(self) -> StoreStats:
+        return await asyncio.to_thread(self._stats)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
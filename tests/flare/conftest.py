@@ -0,0 +1,24 @@
+import asyncio
+import typing
+from unittest import mock
+
+import hikari
+import pytest
+
+import flare
+
+
+@pytest.fixture
+def component_event() -> typing.Callable[[flare.Button], mock.Mock]:
+    """A factory for `hikari.InteractionCreateEvent` mocks of a click on a component."""
+
+    def create(component: flare.Button) -> mock.Mock:
+        asyncio.run(component.set_custom_id())
+        interaction = mock.Mock(spec=hikari.ComponentInteraction)
+        interaction.custom_id = component.custom_id
+        interaction.create_initial_response = mock.AsyncMock()
+        interaction.execute = mock.AsyncMock()
+        interaction.edit_initial_response = mock.AsyncMock()
+        return mock.Mock(interaction=interaction)
+
+    return create
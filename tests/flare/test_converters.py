@@ -1,6 +1,27 @@
+import asyncio
+import dataclasses
+import enum
 import typing
+from unittest import mock
 
-from flare.converters import _get_left, _is_union
+import hikari
+import pytest
+
+from flare.converters import (
+    Converter,
+    EntityConverter,
+    EnumConverter,
+    IntConverter,
+    RecordConverter,
+    StringConverter,
+    SyncConverter,
+    _get_left,
+    _is_union,
+    add_converter,
+    get_converter,
+)
+from flare.dataclass import Dataclass
+from flare.exceptions import ConverterError, EntityFetchError, EntityNotFoundError
 
 
 def test_get_left():
@@ -14,6 +35,231 @@ def test_is_union():
     assert not _is_union(int)
 
 
+def test_builtin_converters_are_sync():
+    for type_ in (int, float, str, bool, enum.Enum):
+        assert isinstance(get_converter(type_), SyncConverter)
+
+
+def test_sync_converter_async_api():
+    converter = IntConverter(int)
+    encoded = converter.to_str_sync(1234)
+
+    assert isinstance(converter, Converter)
+    assert asyncio.run(converter.to_str(1234)) == encoded
+    assert asyncio.run(converter.from_str(encoded)) == 1234
+
+
+def test_enum_converter():
+    class Color(enum.Enum):
+        RED = 1
+        BLUE = 300
+
+    converter = EnumConverter(Color)
+
+    assert converter.from_str_sync(converter.to_str_sync(Color.RED)) is Color.RED
+    assert converter.from_str_sync(converter.to_str_sync(Color.BLUE)) is Color.BLUE
+
+
+@pytest.mark.parametrize(
+    ("hint", "value"),
+    [
+        (list[int], [1, 300, 70000]),
+        (set[str], {"a", "héllo✓"}),
+        (frozenset[int], frozenset({1, 2})),
+        (tuple[int, ...], (0, 1, 2, 0)),
+        (tuple[int, str, bool], (4, "x", True)),
+        (dict[str, int], {"a": 1, "bb": 1000}),
+        (list[typing.Optional[int]], [1, None, 3]),
+        (list[list[int]], [[1, 2], [], [3]]),
+    ],
+)
+def test_container_converters(hint: typing.Any, value: typing.Any):
+    converter = get_converter(hint)
+
+    assert isinstance(converter, SyncConverter)
+    assert converter.from_str_sync(converter.to_str_sync(value)) == value
+
+
+def test_container_is_compact():
+    converter = get_converter(list[int])
+
+    # Each item only uses one extra character for its length.
+    assert len(converter.to_str_sync([1, 2, 3])) == 6
+
+
+def test_container_needs_item_type():
+    with pytest.raises(ConverterError):
+        get_converter(list)
+
+
+class Point(typing.NamedTuple):
+    x: int
+    y: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Move:
+    start: Point
+    end: typing.Optional[Point]
+
+
+class GameState(Dataclass):
+    turn: int
+    player: str
+    moves: typing.List[Move]
+
+
+def test_record_converter():
+    state = GameState(3, "héllo", [Move(Point(1, 2), None), Move(Point(0, 0), Point(7, 300))])
+    converter = get_converter(GameState)
+
+    assert isinstance(converter, RecordConverter)
+    assert not converter.cacheable
+    assert get_converter(Move).cacheable
+
+    decoded = converter.from_str_sync(converter.to_str_sync(state))
+
+    assert decoded._dataclass_values == state._dataclass_values
+    assert type(decoded.moves[0].start) is Point
+
+
+def test_closest_base_converter_is_used():
+    class Base:
+        ...
+
+    class Middle(Base):
+        ...
+
+    class Leaf(Middle):
+        ...
+
+    class MiddleConverter(StringConverter):
+        ...
+
+    add_converter(Base, StringConverter, supports_subclass=True)
+    assert type(get_converter(Leaf)) is StringConverter
+
+    add_converter(Middle, MiddleConverter, supports_subclass=True)
+    assert type(get_converter(Leaf)) is MiddleConverter
+    assert type(get_converter(Base)) is StringConverter
+
+
+def test_add_converter_only_invalidates_affected_types():
+    class Item:
+        ...
+
+    class ItemConverter(StringConverter):
+        ...
+
+    add_converter(Item, StringConverter)
+    items = get_converter(list[Item])
+    numbers = get_converter(list[int])
+
+    assert get_converter(list[Item]) is items
+
+    add_converter(Item, ItemConverter)
+
+    assert get_converter(list[Item]) is not items
+    assert get_converter(list[int]) is numbers
+
+
+def test_converters_are_not_evicted():
+    hints = [typing.Tuple[(int,) * length] for length in range(1, 200)]
+    converters = [get_converter(hint) for hint in hints]
+
+    assert all(get_converter(hint) is converter for hint, converter in zip(hints, converters))
+
+
+def _app(cached: typing.Any = None) -> typing.Any:
+    async def fetch_user(id: int) -> typing.Any:
+        await asyncio.sleep(0)
+        return mock.Mock(id=id)
+
+    app = mock.Mock(spec=hikari.GatewayBot)
+    app.cache.get_user.return_value = cached
+    app.rest.fetch_user = mock.Mock(side_effect=fetch_user)
+    return app
+
+
+def test_entity_converter_coalesces_fetches():
+    app = _app()
+    converter = get_converter(hikari.User)
+    encoded = asyncio.run(converter.to_str(hikari.Snowflake(1234)))
+
+    async def deserialize():
+        return await asyncio.gather(*(converter.from_str(encoded) for _ in range(5)))
+
+    with mock.patch.object(Converter, "app", app, create=True), mock.patch.dict(EntityConverter._fetched, clear=True):
+        users = asyncio.run(deserialize())
+
+    assert app.rest.fetch_user.call_count == 1
+    assert all(user is users[0] for user in users)
+    assert users[0].id == 1234
+
+
+def test_entity_converter_reuses_fetches_within_ttl():
+    app = _app()
+    converter = get_converter(hikari.User)
+    encoded = asyncio.run(converter.to_str(hikari.Snowflake(1234)))
+
+    async def deserialize():
+        return await converter.from_str(encoded), await converter.from_str(encoded)
+
+    with mock.patch.object(Converter, "app", app, create=True), mock.patch.dict(EntityConverter._fetched, clear=True):
+        first, second = asyncio.run(deserialize())
+
+        with mock.patch.object(EntityConverter, "ttl", 0):
+            EntityConverter._fetched.clear()
+            asyncio.run(deserialize())
+
+    assert first is second
+    assert app.rest.fetch_user.call_count == 3
+
+
+def test_entity_converter_uses_cache():
+    user = mock.Mock()
+    app = _app(cached=user)
+    converter = get_converter(hikari.User)
+    encoded = asyncio.run(converter.to_str(hikari.Snowflake(1234)))
+
+    with mock.patch.object(Converter, "app", app, create=True):
+        assert asyncio.run(converter.from_str(encoded)) is user
+
+    app.cache.get_user.assert_called_once_with(1234)
+    app.rest.fetch_user.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (hikari.NotFoundError("", {}, b""), EntityNotFoundError),
+        (hikari.ForbiddenError("", {}, b""), EntityNotFoundError),
+        (hikari.InternalServerError("", 500, {}, b""), EntityFetchError),
+    ],
+)
+def test_entity_converter_fetch_errors(error: Exception, expected: type[Exception]):
+    app = _app()
+    app.rest.fetch_user = mock.AsyncMock(side_effect=error)
+    converter = get_converter(hikari.User)
+    encoded = asyncio.run(converter.to_str(hikari.Snowflake(1234)))
+
+    with mock.patch.object(Converter, "app", app, create=True), mock.patch.dict(EntityConverter._fetched, clear=True):
+        with pytest.raises(expected):
+            asyncio.run(converter.from_str(encoded))
+
+
+def test_deleted_role():
+    app = _app()
+    app.cache.get_role.return_value = None
+    app.rest.fetch_roles = mock.AsyncMock(return_value=[mock.Mock(id=1)])
+    converter = get_converter(hikari.Role)
+    encoded = asyncio.run(converter.to_str(mock.Mock(guild_id=hikari.Snowflake(10), id=hikari.Snowflake(2))))
+
+    with mock.patch.object(Converter, "app", app, create=True), mock.patch.dict(EntityConverter._fetched, clear=True):
+        with pytest.raises(EntityNotFoundError):
+            asyncio.run(converter.from_str(encoded))
+
+
 # MIT License
 #
 # Copyright (c) 2022-present Lunarmagpie
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+import flare
+from flare.components.base import write_cookie
+from flare.exceptions import CookieCollisionError
+from flare.internal import bootstrap
+from flare.internal.serde import Serde
+
+
+def test_short_cookie(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    path = tmp_path / "cookies.json"
+    monkeypatch.setattr(bootstrap, "cookie_manifest", flare.CookieManifest(path))
+
+    @flare.button(label="Test")
+    async def short_button(ctx: flare.MessageContext, number: int) -> None:
+        ...
+
+    serde = Serde()
+    long_cookie = write_cookie(f"{__name__}.short_button")
+    custom_id = asyncio.run(serde.serialize(short_button._cookie, short_button._codec_plan, {"number": 3}))
+    legacy_id = asyncio.run(serde.serialize(long_cookie, short_button._codec_plan, {"number": 3}))
+
+    assert len(short_button._cookie) == 1
+    assert len(custom_id) == len(legacy_id) - 7
+    assert asyncio.run(serde.deserialize(custom_id, bootstrap.components))[0] is short_button
+    assert asyncio.run(serde.deserialize(legacy_id, bootstrap.components))[0] is short_button
+
+    # Cookies are the same after a restart.
+    assert flare.CookieManifest(path).get(long_cookie) == short_button._cookie
+
+
+def test_frozen_manifest(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(bootstrap, "cookie_manifest", flare.CookieManifest(update=False))
+
+    @flare.button(label="Test", cookie="frozen")
+    async def frozen_button(ctx: flare.MessageContext) -> None:
+        ...
+
+    assert frozen_button._cookie == "frozen"
+
+
+def test_cookie_collision(monkeypatch: pytest.MonkeyPatch):
+    manifest = flare.CookieManifest()
+    monkeypatch.setattr(bootstrap, "cookie_manifest", manifest)
+
+    @flare.button(label="Test", cookie="first")
+    async def first(ctx: flare.MessageContext) -> None:
+        ...
+
+    with pytest.raises(CookieCollisionError):
+
+        @flare.button(label="Test", cookie=manifest.get("first"))
+        async def second(ctx: flare.MessageContext) -> None:
+            ...
@@ -0,0 +1,202 @@
+import asyncio
+import enum
+import typing
+
+import hikari
+import pytest
+
+import flare
+from flare.exceptions import SerializerError
+from flare.internal import bootstrap
+from flare.internal.dense import DenseSerde, _BitWriter, _str_codec
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+
+@flare.button(label="Test")
+async def dense_button(
+    ctx: flare.MessageContext,
+    user: hikari.Snowflake,
+    page: typing.Annotated[int, flare.Range(0, 8)],
+    number: int,
+    string: str,
+    decimal: float = 1.5,
+    maybe: typing.Optional[bool] = None,
+    color: Color = Color.BLUE,
+    literal: typing.Literal["a", "b"] = "b",
+) -> None:
+    ...
+
+
+def test_round_trip():
+    serde = DenseSerde()
+    component = dense_button(hikari.Snowflake(1031337777777777777), 7, -1234, "héllo\x81✓")
+
+    async def round_trip():
+        custom_id = await serde.serialize(component.cookie, component._codec_plan, component._dataclass_values)
+        return custom_id, await serde.deserialize(custom_id, bootstrap.components)
+
+    custom_id, (cls, kwargs) = asyncio.run(round_trip())
+
+    assert cls is dense_button
+    assert kwargs == component._dataclass_values
+    assert type(kwargs["user"]) is hikari.Snowflake
+    assert len(custom_id) < 30
+
+
+def test_range_out_of_bounds():
+    serde = DenseSerde()
+    component = dense_button(hikari.Snowflake(1), 8, 0, "")
+
+    with pytest.raises(SerializerError):
+        asyncio.run(serde.serialize(component.cookie, component._codec_plan, component._dataclass_values))
+
+
+def test_foreign_custom_id():
+    serde = DenseSerde()
+
+    with pytest.raises(SerializerError):
+        asyncio.run(serde.deserialize("not a flare custom_id", bootstrap.components))
+
+
+def test_accepts():
+    serde = DenseSerde()
+    component = dense_button(hikari.Snowflake(1), 0, 0, "")
+    custom_id = asyncio.run(serde.serialize(component.cookie, component._codec_plan, component._dataclass_values))
+
+    assert serde.accepts(custom_id, bootstrap.components)
+    assert not serde.accepts(custom_id, {})
+    assert not serde.accepts("ticket:open:123", bootstrap.components)
+    assert not serde.accepts(custom_id[:1], bootstrap.components)
+
+
+@flare.button(label="Test")
+async def container_button(
+    ctx: flare.MessageContext,
+    board: typing.Tuple[typing.Annotated[int, flare.Range(0, 3)], ...],
+    scores: typing.Dict[str, int],
+    selected: typing.List[typing.Optional[bool]],
+) -> None:
+    ...
+
+
+def test_containers():
+    serde = DenseSerde()
+    component = container_button((0, 1, 2) * 3, {"a": 10, "b": 300}, [True, None, False])
+
+    async def round_trip():
+        custom_id = await serde.serialize(component.cookie, component._codec_plan, component._dataclass_values)
+        return custom_id, await serde.deserialize(custom_id, bootstrap.components)
+
+    custom_id, (_, kwargs) = asyncio.run(round_trip())
+
+    assert kwargs == component._dataclass_values
+    assert len(custom_id) < 20
+
+
+@flare.button(label="Test")
+async def snowflake_button(
+    ctx: flare.MessageContext,
+    message: hikari.Snowflake,
+    user: hikari.Snowflake,
+    channel: typing.Optional[hikari.Snowflake],
+    roles: typing.List[hikari.Snowflake],
+) -> None:
+    ...
+
+
+def test_snowflakes():
+    serde = DenseSerde()
+    message = hikari.Snowflake(1158079622000000000)
+    component = snowflake_button(
+        message,
+        # Created years before the first snowflake, so stored in full.
+        hikari.Snowflake(175928847299117063),
+        None,
+        [hikari.Snowflake(message - 4096 * 1000), hikari.Snowflake(message + (5 << 22) + 3)],
+    )
+
+    async def round_trip():
+        custom_id = await serde.serialize(component.cookie, component._codec_plan, component._dataclass_values)
+        return custom_id, await serde.deserialize(custom_id, bootstrap.components)
+
+    custom_id, (_, kwargs) = asyncio.run(round_trip())
+
+    assert kwargs == component._dataclass_values
+    assert all(type(role) is hikari.Snowflake for role in kwargs["roles"])
+    assert len(custom_id) < 20
+
+
+class Board(typing.NamedTuple):
+    turn: typing.Annotated[int, flare.Range(0, 2)]
+    cells: typing.Tuple[typing.Optional[Color], ...]
+
+
+@flare.button(label="Test")
+async def record_button(ctx: flare.MessageContext, board: Board) -> None:
+    ...
+
+
+def test_records():
+    serde = DenseSerde()
+    component = record_button(Board(1, (Color.RED, None, Color.BLUE) * 3))
+
+    async def round_trip():
+        custom_id = await serde.serialize(component.cookie, component._codec_plan, component._dataclass_values)
+        return custom_id, await serde.deserialize(custom_id, bootstrap.components)
+
+    custom_id, (_, kwargs) = asyncio.run(round_trip())
+
+    assert kwargs == component._dataclass_values
+    assert type(kwargs["board"]) is Board
+    assert len(custom_id) < 10
+
+
+@flare.button(label="Test")
+async def empty_items_button(ctx: flare.MessageContext, items: typing.List[typing.Literal["only"]]) -> None:
+    ...
+
+
+def test_crafted_item_count():
+    serde = DenseSerde()
+    component = empty_items_button(["only"] * 3)
+    custom_id = asyncio.run(serde.serialize(component.cookie, component._codec_plan, component._dataclass_values))
+    _, kwargs = asyncio.run(serde.deserialize(custom_id, bootstrap.components))
+    assert kwargs == {"items": ["only"] * 3}
+
+    # The items take 0 bits, so only the count limits how long reading them takes.
+    writer = _BitWriter()
+    writer.write_varuint(serde.VER, 3)
+    writer.write(0, serde._increment_bits)
+    _str_codec.write(writer, component.cookie)
+    writer.write_varuint(2**60)
+
+    with pytest.raises(SerializerError):
+        asyncio.run(serde.deserialize(writer.to_str(), bootstrap.components))
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,456 @@
+import asyncio
+import datetime
+import logging
+import typing
+from unittest import mock
+
+import hikari
+import pytest
+
+import flare
+from flare.converters import Converter, EntityConverter
+from flare.exceptions import EntityNotFoundError
+from flare.internal import bootstrap
+from flare.internal.event_handler import drain_callbacks, on_inter, on_rest_inter
+from flare.internal.middleware import compile_middleware
+
+calls: list[int] = []
+
+
+@flare.button(label="Test")
+async def handler_button(ctx: flare.MessageContext, number: int) -> None:
+    calls.append(number)
+
+
+def _event(custom_id: str) -> mock.Mock:
+    interaction = mock.Mock(spec=hikari.ComponentInteraction)
+    interaction.custom_id = custom_id
+    return mock.Mock(interaction=interaction)
+
+
+def test_dispatch():
+    button = handler_button(5)
+    asyncio.run(button.set_custom_id())
+    asyncio.run(on_inter(_event(button.custom_id)))
+
+    assert calls[-1] == 5
+
+
+def test_public_dispatch():
+    button = handler_button(6)
+    asyncio.run(button.set_custom_id())
+
+    assert asyncio.run(flare.dispatch(_event(button.custom_id).interaction))
+    assert calls[-1] == 6
+    assert not asyncio.run(flare.dispatch(_event("ticket:open:123").interaction))
+    assert not asyncio.run(flare.dispatch(mock.Mock(spec=hikari.CommandInteraction)))
+
+
+def test_foreign_custom_id(caplog: pytest.LogCaptureFixture):
+    with caplog.at_level(logging.DEBUG, "flare"):
+        asyncio.run(on_inter(_event("ticket:open:123")))
+
+    assert not caplog.records
+    assert "ticket:open:123" not in bootstrap.rejected
+
+
+def test_rejected_custom_id(caplog: pytest.LogCaptureFixture):
+    # Escaped cookies are left to `deserialize`, which can't find this one.
+    custom_id = "\x00\x00\x00\x00un\\known\x81\x00"
+
+    with caplog.at_level(logging.DEBUG, "flare"):
+        asyncio.run(on_inter(_event(custom_id)))
+        asyncio.run(on_inter(_event(custom_id)))
+
+    assert custom_id in bootstrap.rejected
+    assert len(caplog.records) == 1
+
+
+def test_dispatcher_limits_concurrency():
+    dispatcher = flare.Dispatcher(max_concurrency=2, max_queue=10)
+    running: list[int] = []
+    peak = 0
+
+    async def callback() -> None:
+        nonlocal peak
+        running.append(1)
+        peak = max(peak, len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    async def run():
+        tasks = [asyncio.create_task(dispatcher.run(mock.Mock(), callback)) for _ in range(6)]
+        await asyncio.sleep(0)
+        depth = dispatcher.queue_depth
+        await asyncio.gather(*tasks)
+        return depth
+
+    assert asyncio.run(run()) == 4
+    assert peak == 2
+    assert dispatcher.stats == flare.DispatcherStats(
+        in_flight=0, queued=0, completed=6, rejected=0, dropped=0, messages=0, expired=0
+    )
+
+
+@pytest.mark.parametrize("overflow", [flare.Overflow.REJECT, flare.Overflow.DROP])
+def test_dispatcher_overflow(overflow: flare.Overflow):
+    dispatcher = flare.Dispatcher(max_concurrency=1, max_queue=1, overflow=overflow)
+    ctx = mock.Mock(respond=mock.AsyncMock())
+
+    async def run():
+        tasks = [asyncio.create_task(dispatcher.run(ctx, lambda: asyncio.sleep(0.01))) for _ in range(3)]
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    stats = dispatcher.stats
+    assert stats.completed == 2
+    assert (stats.rejected, stats.dropped) == ((1, 0) if overflow is flare.Overflow.REJECT else (0, 1))
+    assert ctx.respond.await_count == stats.rejected
+
+
+def test_dispatcher_per_message():
+    dispatcher = flare.Dispatcher(per_message=True)
+    events: list[tuple[int, str]] = []
+
+    def ctx(message_id: int) -> mock.Mock:
+        return mock.Mock(interaction=mock.Mock(message=mock.Mock(id=hikari.Snowflake(message_id))))
+
+    def callback(message_id: int):
+        async def inner() -> None:
+            events.append((message_id, "start"))
+            await asyncio.sleep(0.01)
+            events.append((message_id, "end"))
+
+        return inner
+
+    async def run():
+        tasks = [asyncio.create_task(dispatcher.run(ctx(id_), callback(id_))) for id_ in (1, 1, 2)]
+        await asyncio.sleep(0)
+        messages = dispatcher.stats.messages
+        await asyncio.gather(*tasks)
+        return messages
+
+    assert asyncio.run(run()) == 2
+    # Clicks on message 1 don't overlap, but message 2 runs at the same time.
+    assert events == [(1, "start"), (2, "start"), (1, "end"), (2, "end"), (1, "start"), (1, "end")]
+    assert dispatcher.stats.messages == 0
+
+
+def test_dispatcher_per_message_overflow():
+    dispatcher = flare.Dispatcher(max_queue=1, overflow=flare.Overflow.DROP, per_message=True)
+    ctx = mock.Mock(interaction=mock.Mock(message=mock.Mock(id=hikari.Snowflake(1))))
+    runs: list[int] = []
+
+    async def callback() -> None:
+        runs.append(1)
+        await asyncio.sleep(0.01)
+
+    async def run():
+        tasks = [asyncio.create_task(dispatcher.run(ctx, callback)) for _ in range(3)]
+        await asyncio.sleep(0)
+        depth = dispatcher.queue_depth
+        await asyncio.gather(*tasks)
+        return depth
+
+    # The second click waits for the first, so the queue is full for the third.
+    assert asyncio.run(run()) == 1
+    assert len(runs) == 2
+    assert dispatcher.stats.dropped == 1
+
+
+def test_dispatcher_deadline():
+    dispatcher = flare.Dispatcher(deadline=2.5)
+    callback = mock.AsyncMock()
+
+    def ctx(age: float, deferred: bool = False) -> mock.Mock:
+        created_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=age)
+        interaction = mock.Mock(id=hikari.Snowflake.from_datetime(created_at))
+        return mock.Mock(interaction=interaction, _issued_response=deferred)
+
+    async def run():
+        await dispatcher.run(ctx(0), callback, "fresh")
+        await dispatcher.run(ctx(5), callback, "stale")
+        await dispatcher.run(ctx(5, deferred=True), callback, "deferred")
+
+    asyncio.run(run())
+
+    assert callback.await_count == 2
+    assert dispatcher.expired == {"stale": 1}
+    assert dispatcher.stats.expired == 1
+
+
+@flare.button(label="Test")
+async def slow_button(ctx: flare.MessageContext) -> None:
+    await asyncio.sleep(0.05)
+    await ctx.respond("done")
+
+
+@flare.button(label="Test", defer=True)
+async def deferred_button(ctx: flare.MessageContext) -> None:
+    await ctx.defer()
+    await ctx.edit_response("done")
+
+
+def test_auto_defer(component_event: typing.Callable[[flare.Button], mock.Mock], monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(bootstrap, "auto_defer_after", 0.01)
+    event = component_event(slow_button())
+
+    asyncio.run(on_inter(event))
+
+    event.interaction.create_initial_response.assert_awaited_once()
+    assert event.interaction.create_initial_response.await_args.args[0] is hikari.ResponseType.DEFERRED_MESSAGE_UPDATE
+    event.interaction.execute.assert_awaited_once()
+
+
+def test_defer_flag(component_event: typing.Callable[[flare.Button], mock.Mock]):
+    event = component_event(deferred_button())
+
+    asyncio.run(on_inter(event))
+
+    event.interaction.create_initial_response.assert_awaited_once()
+    assert event.interaction.create_initial_response.await_args.args[0] is hikari.ResponseType.DEFERRED_MESSAGE_UPDATE
+    event.interaction.edit_initial_response.assert_awaited_once()
+
+
+debounce = flare.Debounce(60)
+
+
+@flare.button(label="Test", debounce=debounce)
+async def debounced_button(ctx: flare.MessageContext) -> None:
+    calls.append(-1)
+    await asyncio.sleep(0.01)
+    await ctx.respond("done")
+
+
+def test_debounce(component_event: typing.Callable[[flare.Button], mock.Mock]):
+    calls.clear()
+    event = component_event(debounced_button())
+
+    async def run():
+        await asyncio.gather(on_inter(event), on_inter(event))
+        # The callback finished, but the window did not end.
+        await on_inter(event)
+
+    asyncio.run(run())
+
+    assert calls == [-1]
+    assert debounce.suppressed == 2
+    response_types = [call.args[0] for call in event.interaction.create_initial_response.await_args_list]
+    assert response_types.count(hikari.ResponseType.DEFERRED_MESSAGE_UPDATE) == 2
+
+
+@flare.button(label="Test", ratelimit=flare.RateLimit(1, 60, message="Slow down!"))
+async def limited_button(ctx: flare.MessageContext) -> None:
+    calls.append(-2)
+
+
+def test_ratelimit(component_event: typing.Callable[[flare.Button], mock.Mock], monkeypatch: pytest.MonkeyPatch):
+    calls.clear()
+    event = component_event(limited_button())
+    event.interaction.user = mock.Mock(id=hikari.Snowflake(1))
+    deserialize = mock.AsyncMock(wraps=bootstrap.active_serde.deserialize)
+    monkeypatch.setattr(bootstrap.active_serde, "deserialize", deserialize)
+
+    async def run():
+        await on_inter(event)
+        await on_inter(event)
+
+    asyncio.run(run())
+
+    assert calls == [-2]
+    # The limited click is rejected before its custom_id is deserialized.
+    assert deserialize.await_count == 1
+    event.interaction.create_initial_response.assert_awaited_once()
+    assert event.interaction.create_initial_response.await_args.args[1] == "Slow down!"
+
+
+@flare.button(label="Test", timeout=0.01)
+async def stuck_button(ctx: flare.MessageContext) -> None:
+    await asyncio.sleep(60)
+
+
+def test_timeout(component_event: typing.Callable[[flare.Button], mock.Mock], caplog: pytest.LogCaptureFixture):
+    event = component_event(stuck_button())
+
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(asyncio.wait_for(on_inter(event), 1))
+
+    assert "stuck_button" in caplog.text
+
+
+@flare.button(label="Test")
+async def hanging_button(ctx: flare.MessageContext) -> None:
+    await asyncio.sleep(60)
+
+
+def test_drain(
+    component_event: typing.Callable[[flare.Button], mock.Mock],
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    monkeypatch.setattr(bootstrap, "draining", False)
+    running = component_event(slow_button())
+    stuck = component_event(hanging_button())
+    late = component_event(slow_button())
+
+    async def run():
+        tasks = [asyncio.create_task(on_inter(running)), asyncio.create_task(on_inter(stuck))]
+        await asyncio.sleep(0)
+        await drain_callbacks(0.1)
+        # Interactions received while draining are ignored.
+        await on_inter(late)
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    with caplog.at_level(logging.WARNING):
+        results = asyncio.run(run())
+
+    running.interaction.create_initial_response.assert_awaited_once()
+    # Only the callback's own task is cancelled, not the listener that received the interaction.
+    assert results == [None, None]
+    late.interaction.create_initial_response.assert_not_awaited()
+    assert "1 interactions" in caplog.text
+    assert bootstrap.draining
+
+
+@flare.button(label="Test")
+async def rest_button(ctx: flare.MessageContext) -> None:
+    await ctx.respond("hello")
+    await ctx.respond("followup")
+
+
+def test_rest_response(component_event: typing.Callable[[flare.Button], mock.Mock]):
+    event = component_event(rest_button())
+
+    async def run():
+        listener = on_rest_inter(event.interaction)
+        builder = await listener.__anext__()
+
+        # The follow-up waits until the interaction server returned the HTTP response.
+        await asyncio.sleep(0.01)
+        event.interaction.execute.assert_not_awaited()
+
+        with pytest.raises(StopAsyncIteration):
+            await listener.__anext__()
+        return builder
+
+    builder = asyncio.run(run())
+
+    assert isinstance(builder, hikari.api.InteractionMessageBuilder)
+    assert builder.type is hikari.ResponseType.MESSAGE_CREATE
+    assert builder.content == "hello"
+    event.interaction.create_initial_response.assert_not_awaited()
+    event.interaction.execute.assert_awaited_once()
+    assert not bootstrap.rest_responses
+
+
+def test_deadline_before_deserialize(monkeypatch: pytest.MonkeyPatch):
+    calls.clear()
+    dispatcher = flare.Dispatcher(deadline=2.5)
+    monkeypatch.setattr(bootstrap, "active_dispatcher", dispatcher)
+    deserialize = mock.AsyncMock(wraps=bootstrap.active_serde.deserialize)
+    monkeypatch.setattr(bootstrap.active_serde, "deserialize", deserialize)
+
+    button = handler_button(7)
+    asyncio.run(button.set_custom_id())
+    event = _event(button.custom_id)
+    created_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=5)
+    event.interaction.id = hikari.Snowflake.from_datetime(created_at)
+
+    assert asyncio.run(flare.dispatch(event.interaction))
+
+    deserialize.assert_not_awaited()
+    assert calls == []
+    assert dispatcher.expired == {"handler_button": 1}
+
+
+@flare.button(label="Test")
+async def rest_hanging_button(ctx: flare.MessageContext) -> None:
+    await ctx.respond("hello")
+    await asyncio.sleep(60)
+
+
+def test_rest_drain(
+    component_event: typing.Callable[[flare.Button], mock.Mock],
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    monkeypatch.setattr(bootstrap, "draining", False)
+    monkeypatch.setattr(bootstrap, "detach_rest_callbacks", True)
+    event = component_event(rest_hanging_button())
+
+    async def run():
+        listener = on_rest_inter(event.interaction)
+        await listener.__anext__()
+
+        # The interaction server doesn't wait for the callback when it closes.
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(listener.__anext__(), 0.1)
+
+        await drain_callbacks(0.05)
+
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(run())
+
+    assert "1 interactions" in caplog.text
+
+
+def test_dispatch_while_draining(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(bootstrap, "draining", True)
+    calls.clear()
+    button = handler_button(8)
+    asyncio.run(button.set_custom_id())
+
+    assert asyncio.run(flare.dispatch(_event(button.custom_id).interaction))
+    assert not asyncio.run(flare.dispatch(_event("not flare's").interaction))
+    assert calls == []
+
+
+@flare.button(label="Test")
+async def user_button(ctx: flare.MessageContext, user: hikari.User) -> None:
+    calls.append(user.id)
+
+
+@pytest.mark.parametrize(
+    ("error", "rejected"),
+    [
+        (hikari.NotFoundError("", {}, b""), True),
+        (hikari.InternalServerError("", 500, {}, b""), False),
+    ],
+)
+def test_entity_fetch_errors(monkeypatch: pytest.MonkeyPatch, error: Exception, rejected: bool):
+    calls.clear()
+    app = mock.Mock(spec=hikari.RESTBot)
+    app.rest.fetch_user = mock.AsyncMock(side_effect=error)
+    monkeypatch.setattr(Converter, "app", app, raising=False)
+    monkeypatch.setattr(EntityConverter, "_fetched", {})
+
+    button = user_button(hikari.Snowflake(1234))
+    asyncio.run(button.set_custom_id())
+
+    # Transient errors are still claimed by flare, so the user can click again.
+    assert asyncio.run(flare.dispatch(_event(button.custom_id).interaction)) is not rejected
+    assert (button.custom_id in bootstrap.rejected) is rejected
+    assert calls == []
+
+
+def test_entity_not_found_on_error(monkeypatch: pytest.MonkeyPatch):
+    errors: list[Exception] = []
+
+    class Errors(flare.Middleware):
+        async def on_error(self, info: flare.DispatchInfo, error: Exception) -> None:
+            assert info.component is None
+            errors.append(error)
+
+    app = mock.Mock(spec=hikari.RESTBot)
+    app.rest.fetch_user = mock.AsyncMock(side_effect=hikari.NotFoundError("", {}, b""))
+    monkeypatch.setattr(Converter, "app", app, raising=False)
+    monkeypatch.setattr(EntityConverter, "_fetched", {})
+    monkeypatch.setattr(bootstrap, "active_middleware", compile_middleware([Errors()]))
+
+    button = user_button(hikari.Snowflake(1234))
+    asyncio.run(button.set_custom_id())
+
+    assert asyncio.run(flare.dispatch(_event(button.custom_id).interaction))
+    assert isinstance(errors[0], EntityNotFoundError)
+    assert button.custom_id not in bootstrap.rejected
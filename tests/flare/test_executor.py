@@ -0,0 +1,114 @@
+import asyncio
+import functools
+import threading
+import time
+import typing
+from unittest import mock
+
+import pytest
+
+import flare
+from flare.internal.event_handler import on_inter
+
+threads: list[threading.Thread] = []
+
+
+@flare.button(label="Test")
+def sync_button(ctx: flare.MessageContext, number: int) -> None:
+    threads.append(threading.current_thread())
+    flare.run_coroutine(ctx.respond(str(number)))
+
+
+class SyncButton(flare.Button, label="Test"):
+    def callback(self, ctx: flare.MessageContext) -> None:  # type: ignore
+        threads.append(threading.current_thread())
+
+
+def test_sync_callbacks(component_event: typing.Callable[[flare.Button], mock.Mock]):
+    threads.clear()
+    function_event = component_event(sync_button(5))
+
+    asyncio.run(on_inter(function_event))
+    asyncio.run(on_inter(component_event(SyncButton())))
+
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+    function_event.interaction.create_initial_response.assert_awaited_once()
+    assert function_event.interaction.create_initial_response.await_args.args[1] == "5"
+
+
+def test_run_coroutine_outside_callback():
+    with pytest.raises(RuntimeError):
+        flare.run_coroutine(asyncio.sleep(0))
+
+
+def passthrough(callback: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+    @functools.wraps(callback)
+    def inner(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return callback(*args, **kwargs)
+
+    return inner
+
+
+class DecoratedButton(flare.Button, label="Test"):
+    @passthrough
+    async def callback(self, ctx: flare.MessageContext) -> None:
+        threads.append(threading.current_thread())
+        await ctx.respond("decorated")
+
+
+def test_decorated_async_callback(component_event: typing.Callable[[flare.Button], mock.Mock]):
+    threads.clear()
+    event = component_event(DecoratedButton())
+
+    asyncio.run(on_inter(event))
+
+    # The coroutine returned by the decorator is awaited on the event loop.
+    assert threads == [threading.main_thread()]
+    event.interaction.create_initial_response.assert_awaited_once()
+
+
+results: list[BaseException] = []
+
+
+@flare.button(label="Test", timeout=0.01)
+def slow_sync_button(ctx: flare.MessageContext) -> None:
+    time.sleep(0.05)
+    try:
+        flare.run_coroutine(ctx.respond("too late"))
+    except asyncio.CancelledError as error:
+        results.append(error)
+
+
+def test_run_coroutine_after_timeout(component_event: typing.Callable[[flare.Button], mock.Mock]):
+    results.clear()
+    event = component_event(slow_sync_button())
+
+    # `asyncio.run` waits for the default executor, so the thread finished when it returns.
+    asyncio.run(on_inter(event))
+
+    assert len(results) == 1
+    event.interaction.create_initial_response.assert_not_awaited()
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
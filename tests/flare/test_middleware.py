@@ -0,0 +1,122 @@
+import asyncio
+import typing
+from unittest import mock
+
+import pytest
+
+import flare
+from flare.internal import bootstrap
+from flare.internal.event_handler import on_inter
+from flare.internal.middleware import compile_middleware
+
+events: list[str] = []
+
+
+@flare.button(label="Test")
+async def middleware_button(ctx: flare.MessageContext, fail: bool) -> None:
+    events.append("callback")
+    if fail:
+        raise ValueError("Callback failed.")
+
+
+class Recorder(flare.Middleware):
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.infos: list[flare.DispatchInfo] = []
+        self.errors: list[Exception] = []
+
+    async def after_deserialize(self, info: flare.DispatchInfo) -> bool:
+        events.append(f"{self.name} after")
+        return True
+
+    async def around_callback(self, info: flare.DispatchInfo, call_next: typing.Callable[[], typing.Awaitable[None]]):
+        events.append(f"{self.name} before callback")
+        await call_next()
+        events.append(f"{self.name} after callback")
+        self.infos.append(info)
+
+    async def on_error(self, info: flare.DispatchInfo, error: Exception) -> None:
+        self.errors.append(error)
+
+
+class Deny(flare.Middleware):
+    async def before_deserialize(self, info: flare.DispatchInfo) -> bool:
+        return False
+
+
+def test_middleware_order(component_event: typing.Callable[[flare.Button], mock.Mock], monkeypatch: pytest.MonkeyPatch):
+    outer, inner = Recorder("outer"), Recorder("inner")
+    monkeypatch.setattr(bootstrap, "active_middleware", compile_middleware([outer, inner]))
+    events.clear()
+
+    asyncio.run(on_inter(component_event(middleware_button(False))))
+
+    assert events == [
+        "outer after",
+        "inner after",
+        "outer before callback",
+        "inner before callback",
+        "callback",
+        "inner after callback",
+        "outer after callback",
+    ]
+    (info,) = outer.infos
+    assert isinstance(info.component, middleware_button)
+    assert info.deserialize_time is not None
+    assert info.callback_time is not None
+    assert info.elapsed >= 0
+
+
+def test_on_error(component_event: typing.Callable[[flare.Button], mock.Mock], monkeypatch: pytest.MonkeyPatch):
+    recorder = Recorder("recorder")
+    monkeypatch.setattr(bootstrap, "active_middleware", compile_middleware([recorder]))
+
+    asyncio.run(on_inter(component_event(middleware_button(True))))
+
+    (error,) = recorder.errors
+    assert isinstance(error, ValueError)
+    assert recorder.infos == []
+
+
+def test_before_deserialize(
+    component_event: typing.Callable[[flare.Button], mock.Mock], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(bootstrap, "active_middleware", compile_middleware([Deny()]))
+    events.clear()
+
+    asyncio.run(on_inter(component_event(middleware_button(False))))
+
+    assert events == []
+
+
+def test_unused_hooks_are_skipped():
+    pipeline = compile_middleware([Deny()])
+
+    assert compile_middleware([]) is None
+    assert pipeline is not None
+    assert pipeline.after_deserialize is None
+    assert pipeline.around_callback is None
+    assert pipeline.on_error is None
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
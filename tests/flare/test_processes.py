@@ -0,0 +1,82 @@
+import pathlib
+import pickle
+from unittest import mock
+
+import hikari
+import pytest
+
+import flare
+from flare.exceptions import RegistryMismatchError
+from flare.internal import bootstrap
+from flare.internal.processes import _WorkerApp
+from flare.internal.serde import CacheSerde, Serde, StoreSerde
+
+
+@flare.button(label="Test")
+async def process_button(ctx: flare.MessageContext, number: int) -> None:
+    ...
+
+
+def test_submit_routes_by_message():
+    dispatcher = flare.ProcessDispatcher("token", [], processes=3)
+    dispatcher._queues = [mock.Mock(), mock.Mock(), mock.Mock()]  # type: ignore
+
+    dispatcher.submit({"id": "10", "message": {"id": "7"}})
+    dispatcher.submit({"id": "11", "message": {"id": "7"}})
+    dispatcher.submit({"id": "12"})
+
+    assert dispatcher._queues[1].put.call_count == 2
+    assert dispatcher._queues[0].put.call_count == 1
+
+
+def test_registry_fingerprint():
+    fingerprint = bootstrap.registry_fingerprint()
+    assert fingerprint == bootstrap.registry_fingerprint()
+
+    @flare.button(label="Test")
+    async def new_button(ctx: flare.MessageContext) -> None:
+        ...
+
+    assert fingerprint != bootstrap.registry_fingerprint()
+
+
+def test_pickled_manifest_is_frozen():
+    manifest = flare.CookieManifest()
+    short = manifest.assign("cookie")
+
+    copy = pickle.loads(pickle.dumps(manifest))
+
+    assert copy.get("cookie") == short
+    assert copy.assign("other") is None
+
+
+def test_registry_mismatch():
+    # The worker doesn't import any modules, so it has no components.
+    dispatcher = flare.ProcessDispatcher("token", [], processes=1)
+
+    with pytest.raises(RegistryMismatchError):
+        dispatcher.start()
+
+    assert not dispatcher.is_running
+
+
+def test_unshared_store_is_rejected(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    dispatcher = flare.ProcessDispatcher("token", [], processes=1)
+
+    monkeypatch.setattr(bootstrap, "active_serde", CacheSerde(StoreSerde(Serde(), flare.MemoryStore()), 10))
+    with pytest.raises(ValueError):
+        dispatcher.start()
+
+    assert not dispatcher.is_running
+
+    store = pickle.loads(pickle.dumps(flare.SQLiteStore(tmp_path / "state.db")))
+    assert store.shared
+    assert not flare.SQLiteStore(":memory:").shared
+
+
+def test_worker_app_is_rest_aware():
+    rest = mock.Mock(spec=hikari.api.RESTClient)
+    app = _WorkerApp(rest)
+
+    assert isinstance(app, hikari.RESTAware)
+    assert app.rest is rest
@@ -0,0 +1,74 @@
+from unittest import mock
+
+import hikari
+import pytest
+
+import flare
+from flare.internal import ratelimit
+
+
+def _interaction(user: int, guild: int | None = None) -> mock.Mock:
+    return mock.Mock(user=mock.Mock(id=hikari.Snowflake(user)), guild_id=guild)
+
+
+def test_refill(monkeypatch: pytest.MonkeyPatch):
+    now = 0.0
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now)
+    limit = flare.RateLimit(2, 10)
+
+    assert limit.acquire(_interaction(1))
+    assert limit.acquire(_interaction(1))
+    assert not limit.acquire(_interaction(1))
+    # Other users have their own bucket.
+    assert limit.acquire(_interaction(2))
+
+    now = 5
+    assert limit.acquire(_interaction(1))
+    assert not limit.acquire(_interaction(1))
+    assert limit.limited == 2
+
+
+def test_guild_bucket():
+    limit = flare.RateLimit(1, 10, bucket=flare.Bucket.GUILD)
+
+    assert limit.acquire(_interaction(1, guild=100))
+    assert not limit.acquire(_interaction(2, guild=100))
+    # Interactions in DMs are limited by user.
+    assert limit.acquire(_interaction(2))
+
+
+def test_idle_buckets_are_removed(monkeypatch: pytest.MonkeyPatch):
+    now = 0.0
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now)
+    limit = flare.RateLimit(1, 10)
+
+    for user in range(64):
+        limit.acquire(_interaction(user))
+    assert limit.size == 64
+
+    now = 10
+    limit.acquire(_interaction(1000))
+    assert limit.size == 1
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
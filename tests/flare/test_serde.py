@@ -0,0 +1,147 @@
+import asyncio
+import typing
+
+import flare
+from flare.internal import bootstrap
+from flare.internal.codec import CodecPlan
+from flare.internal.serde import CacheSerde, Serde
+
+
+@flare.button(label="Test")
+async def serde_button(
+    ctx: flare.MessageContext,
+    number: int,
+    string: str,
+    decimal: float = 1.5,
+    maybe: typing.Optional[bool] = None,
+) -> None:
+    ...
+
+
+def test_codec_plan():
+    plan = serde_button._codec_plan  # type: ignore
+    assert isinstance(plan, CodecPlan)
+    assert list(plan) == ["number", "string", "decimal", "maybe"]
+    assert [field.name for field in plan.fields] == ["number", "string", "decimal", "maybe"]
+
+
+def test_escape():
+    serde = Serde()
+    assert serde.escape("a\\b\x81c\x82") == "a\\\\b\\\x81c\\\x82"
+
+
+def test_split():
+    serde = Serde()
+    assert serde.split("a\x81b\x81\x82") == ["a", "b", None]
+    assert serde.split("a\\\x81b\x81\\\x82\x81c\\") == ["a\x81b", "\x82", "c"]
+    assert serde.split(serde.escape("\x81\\\x82")) == ["\x81\\\x82"]
+
+
+def test_round_trip():
+    serde = Serde()
+    component = serde_button(5, "he\\l\x81lo")
+
+    async def round_trip():
+        custom_id = await serde.serialize(component.cookie, component._codec_plan, component._dataclass_values)
+        return await serde.deserialize(custom_id, bootstrap.components)
+
+    cls, kwargs = asyncio.run(round_trip())
+
+    assert cls is serde_button
+    assert kwargs == {"number": 5, "string": "he\\l\x81lo", "decimal": 1.5, "maybe": None}
+
+
+class Async:
+    pass
+
+
+class AsyncConverter(flare.Converter[Async]):
+    async def to_str(self, obj: Async) -> str:
+        return ""
+
+    async def from_str(self, obj: str) -> Async:
+        return Async()
+
+
+flare.add_converter(Async, AsyncConverter)
+
+
+@flare.button(label="Test")
+async def uncacheable_button(ctx: flare.MessageContext, value: Async) -> None:
+    ...
+
+
+def test_cache_serde():
+    serde = CacheSerde(Serde())
+    component = serde_button(5, "string")
+
+    async def deserialize_twice():
+        custom_id = await serde.serialize(component.cookie, component._codec_plan, component._dataclass_values)
+        first = await serde.deserialize(custom_id, bootstrap.components)
+        first[1]["number"] = 10
+        return first, await serde.deserialize(custom_id, bootstrap.components)
+
+    _, (cls, kwargs) = asyncio.run(deserialize_twice())
+
+    assert cls is serde_button
+    assert kwargs["number"] == 5
+    assert serde.stats.hits == 1
+    assert serde.stats.misses == 1
+
+
+def test_cache_serde_uncacheable():
+    serde = CacheSerde(Serde())
+    component = uncacheable_button(Async())
+
+    async def deserialize_twice():
+        custom_id = await serde.serialize(component.cookie, component._codec_plan, component._dataclass_values)
+        await serde.deserialize(custom_id, bootstrap.components)
+        return await serde.deserialize(custom_id, bootstrap.components)
+
+    asyncio.run(deserialize_twice())
+
+    assert serde.stats.hits == 0
+    assert serde.stats.size == 0
+
+
+def test_accepts():
+    serde = Serde()
+    custom_id = asyncio.run(
+        serde.serialize(serde_button._cookie, serde_button._codec_plan, {"number": 1, "string": "a"})
+    )
+
+    assert serde.accepts(custom_id, bootstrap.components)
+    assert not serde.accepts("ticket:open:123", bootstrap.components)
+    assert not serde.accepts("\x00\x00\x00\x00unknown\x81a", bootstrap.components)
+    assert not serde.accepts("", bootstrap.components)
+
+
+def test_cookie():
+    serde = Serde()
+
+    assert serde.cookie("\x00\x00\x00\x00plain\x81a") == "plain"
+    assert serde.cookie("\x00\x00\x00\x00es\\\x81caped\x81a") == "es\x81caped"
+    assert serde.cookie("ticket:open:123") is None
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
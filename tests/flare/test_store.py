@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+import flare
+from flare.internal import bootstrap
+from flare.internal.serde import Serde, StoreSerde
+
+
+@flare.button(label="Test")
+async def store_button(ctx: flare.MessageContext, string: str, number: int = 5) -> None:
+    ...
+
+
+def test_memory_store_lru():
+    store = flare.MemoryStore(max_size=2)
+
+    async def run():
+        await store.set("a", "1")
+        await store.set("b", "2")
+        assert await store.get("a") == "1"
+        await store.set("c", "3")
+        return await store.get("a"), await store.get("b"), await store.get("c"), await store.stats()
+
+    a, b, c, stats = asyncio.run(run())
+
+    assert (a, b, c) == ("1", None, "3")
+    assert stats.evictions == 1
+    assert stats.size == 2
+    assert stats.hits == 3
+    assert stats.misses == 1
+
+
+def test_memory_store_ttl():
+    store = flare.MemoryStore(ttl=-1)
+
+    async def run():
+        await store.set("a", "1")
+        return await store.get("a"), await store.stats()
+
+    value, stats = asyncio.run(run())
+
+    assert value is None
+    assert stats.expirations == 1
+
+
+def test_sqlite_store():
+    store = flare.SQLiteStore(":memory:")
+
+    async def run():
+        await store.set("a", "1")
+        return await store.get("a"), await store.get("b"), await store.stats()
+
+    a, b, stats = asyncio.run(run())
+
+    assert (a, b) == ("1", None)
+    assert stats.size == 1
+    assert stats.hit_rate == 0.5
+
+
+def test_sqlite_store_purge_interval():
+    with pytest.raises(ValueError):
+        flare.SQLiteStore(":memory:", purge_interval=0)
+
+    store = flare.SQLiteStore(":memory:", ttl=-1, purge_interval=1)
+
+    async def run():
+        await store.set("a", "1")
+        return await store.stats()
+
+    stats = asyncio.run(run())
+
+    assert stats.size == 0
+    assert stats.expirations == 1
+
+
+def test_store_serde_overflow():
+    serde = StoreSerde(Serde(), flare.MemoryStore())
+    component = store_button("x" * 150)
+
+    async def round_trip():
+        custom_id = await serde.serialize(component.cookie, component._codec_plan, component._dataclass_values)
+        return custom_id, await serde.deserialize(custom_id, bootstrap.components)
+
+    custom_id, (cls, kwargs) = asyncio.run(round_trip())
+
+    assert len(custom_id) <= 100
+    assert cls is store_button
+    assert kwargs == {"string": "x" * 150, "number": 5}
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.